@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""
+Compare fetching every page through SQLAlchemy queries against slicing the in-memory corpus.
+
+Run from the project root:
+    python -m benchmarks.corpus_navigation
+"""
+
+import time
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from core_functions.quran.models import Quran
+from core_functions.quran.types import QuranFontType, NavigationMode, Ayah
+from core_functions.quran.corpus import QuranCorpus
+from core_functions.quran.quran_manager import QuranManager
+
+
+def fetch_with_sql(session, page: int) -> list:
+    rows = session.query(Quran).filter(Quran.page == page).order_by(Quran.number).all()
+    return [
+        Ayah(
+            number=row.number,
+            text=row.text,
+            sura_name=row.sura_name,
+            sura_number=row.sura_number,
+            number_in_surah=row.numberInSurah,
+            juz=row.juz,
+            hizb=row.hizb,
+            hizbQuarter=row.hizbQuarter,
+            page=row.page,
+            sajda=row.sajda,
+            sajdaObligation=row.sajdaObligation,
+        )
+        for row in rows
+    ]
+
+
+def main() -> None:
+    db_path = QuranFontType.DEFAULT.database
+    engine = create_engine(f"sqlite:///{db_path}", echo=False)
+    session = sessionmaker(bind=engine)()
+    pages = range(1, QuranManager.MAX_PAGE + 1)
+
+    start = time.perf_counter()
+    sql_results = [fetch_with_sql(session, page) for page in pages]
+    sql_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    corpus = QuranCorpus()
+    load_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    corpus_results = [corpus.get_ayahs(NavigationMode.PAGE, page) for page in pages]
+    corpus_time = time.perf_counter() - start
+
+    session.close()
+    engine.dispose()
+
+    assert sql_results == corpus_results, "Corpus and SQL results differ."
+    print(f"SQL queries:       {sql_time * 1000:8.1f} ms for {len(pages)} pages")
+    print(f"Corpus load:       {load_time * 1000:8.1f} ms (once per process)")
+    print(f"Corpus slicing:    {corpus_time * 1000:8.1f} ms for {len(pages)} pages")
+    print(f"Speedup:           {sql_time / corpus_time:8.1f}x")
+    for name, size in corpus.memory_usage().items():
+        print(f"Memory, {name + ':':<17}{size / 1024:8.0f} KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""
+Time and measure building the corpus statistics, then time the statistics of every
+surah, juz and page and the frequency, distribution and concordance of a few words.
+The counts of every surah are checked against a plain count of its normalized words.
+
+Run from the project root:
+    python -m benchmarks.corpus_statistics
+"""
+
+import time
+import tracemalloc
+from collections import Counter
+from core_functions.quran.types import NavigationMode
+from core_functions.search.normalized_verses import NormalizedVerses
+from core_functions.search.normalizer import normalize
+from core_functions.search.statistics import CorpusStatistics, NO_TASHKIL, NO_HAMZA
+
+UNITS = [(NavigationMode.SURAH, 114), (NavigationMode.JUZ, 30), (NavigationMode.PAGE, 604)]
+WORDS = ["الله", "الجنة", "موسى", "يومئذ", "من"]
+
+
+def naive_counts(statistics: CorpusStatistics, start: int, end: int) -> Counter:
+    return Counter(normalize(word, NO_TASHKIL, NO_HAMZA) for text in statistics.texts[start:end] for word in text.split())
+
+
+def main() -> None:
+    # The normalized verses are shared with the search, build them outside of the measure.
+    NormalizedVerses.connect().close()
+
+    start = time.perf_counter()
+    statistics = CorpusStatistics()
+    build_ms = (time.perf_counter() - start) * 1000
+    # Built again under tracemalloc, which slows the build down too much to time it.
+    tracemalloc.start()
+    CorpusStatistics()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(statistics)
+    print(f"Build:             {build_ms:8.1f} ms, peak allocation {peak / 1024:.0f} KB")
+    for name, size in statistics.memory_usage().items():
+        print(f"Memory, {name + ':':<11}{size / 1024:8.0f} KB")
+
+    for sura_number in range(1, 115):
+        bounds = statistics.unit_bounds(NavigationMode.SURAH, sura_number)
+        expected = naive_counts(statistics, *bounds)
+        counts = Counter({statistics.words[word_id]: count for word_id, count in statistics.frequencies(*bounds).items()})
+        assert counts == expected, f"Counts of surah {sura_number} differ."
+
+    for mode, count in UNITS:
+        bounds = [statistics.unit_bounds(mode, number) for number in range(1, count + 1)]
+        start = time.perf_counter()
+        for unit_start, unit_end in bounds:
+            statistics.word_count(unit_start, unit_end)
+            statistics.unique_count(unit_start, unit_end)
+            statistics.exclusive_words(unit_start, unit_end)
+            statistics.top_words(unit_start, unit_end)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"{mode.name.lower():>7} statistics: {elapsed / count:7.3f} ms per unit, {elapsed:7.1f} ms for {count}")
+
+    for word in WORDS:
+        start = time.perf_counter()
+        frequency = statistics.frequency(word)
+        frequency_ms = (time.perf_counter() - start) * 1000
+        start = time.perf_counter()
+        distribution = statistics.distribution(word)
+        distribution_ms = (time.perf_counter() - start) * 1000
+        start = time.perf_counter()
+        lines = statistics.concordance(word)
+        concordance_ms = (time.perf_counter() - start) * 1000
+        assert frequency == len(lines) == sum(distribution.values()), f"Counts of {word} differ."
+        print(
+            f"{word:>8}   {frequency:5} times in {len(distribution):3} surahs   frequency: {frequency_ms:6.3f} ms   "
+            f"distribution: {distribution_ms:6.2f} ms   concordance: {concordance_ms:6.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
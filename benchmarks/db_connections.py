@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""
+Count the SQLite connections opened during a typical session: opening the info
+dialogs, the tafsir, the i'rab and the reasons of revelation of a few ayahs,
+listing the reciters and running a few searches. Every call of sqlite3.connect is
+counted by database, and the session is timed.
+
+Steps whose database is not installed are skipped.
+
+Run from the project root:
+    python -m benchmarks.db_connections
+"""
+
+import sqlite3
+import time
+from collections import Counter
+from pathlib import Path
+from core_functions.info import E3rab, TanzilAyah, AyaInfo, SuraInfo, JuzInfo, HizbInfo, QuarterInfo, PageInfo
+from core_functions.tafaseer import TafaseerManager
+from core_functions.Reciters import AyahReciter
+from core_functions.search import QuranSearchManager, SearchMode
+from core_functions.search.tafaseer_index import installed_tafaseer
+from utils.paths import paths
+
+AYAHS = [1, 8, 255, 2000, 4000, 6236]
+SEARCHES = ["الله", "الصبر", "يا أيها الذين آمنوا"]
+connections = Counter()
+
+
+def counting_connect(connect):
+    def wrapper(database, *args, **kwargs):
+        connections[Path(str(database).split("?")[0]).name] += 1
+        return connect(database, *args, **kwargs)
+    return wrapper
+
+
+def step(name: str, call) -> None:
+    try:
+        call()
+    except Exception as e:
+        print(f"Skipped {name}: {e}")
+
+
+def session() -> None:
+    for number in AYAHS:
+        step("ayah info", lambda: AyaInfo(number).text)
+        step("reasons of revelation", lambda: TanzilAyah(number).text)
+        step("i'rab", lambda: E3rab(1, 1).text)
+    for info, unit in ((SuraInfo, 2), (JuzInfo, 3), (HizbInfo, 5), (QuarterInfo, 9), (PageInfo, 50)):
+        for _ in range(len(AYAHS)):
+            step(info.__name__, lambda: info(unit).text)
+
+    tafaseer = TafaseerManager()
+    for category in installed_tafaseer():
+        for number in AYAHS:
+            step("tafsir", lambda: (tafaseer.set(category), tafaseer.get_tafaseer(1, number % 7 + 1)))
+
+    reciters = AyahReciter(paths.data_folder / "quran" / "reciters.db")
+    step("reciters", reciters.get_reciters)
+    for reciter_id in range(1, 11):
+        step("reciter", lambda: reciters.get_reciter(reciter_id))
+
+    manager = QuranSearchManager()
+    manager.result_cache = None
+    manager.set(no_tashkil=True, no_hamza=True, match_whole_word=False, mode=SearchMode.TEXT)
+    for text in SEARCHES:
+        manager.search(text)
+
+
+def main() -> None:
+    sqlite3.connect = counting_connect(sqlite3.connect)
+    start = time.perf_counter()
+    session()
+    elapsed = (time.perf_counter() - start) * 1000
+    for database, count in connections.most_common():
+        print(f"{database:>28}: {count:4} connections")
+    print(f"{'total':>28}: {sum(connections.values()):4} connections, session in {elapsed:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""
+Render the full 6,236-ayah range with QuranFormatter and compare it against the
+former string-concatenation formatter (text += per ayah, a translation table
+rebuilt per numeral and every mark replaced unconditionally). Both build the
+position index of the view.
+
+Run from the project root:
+    python -m benchmarks.format_full_range
+"""
+
+import time
+from core_functions.quran.types import NavigationMode, MarksType
+from core_functions.quran.corpus import QuranCorpus
+from core_functions.quran.view_content import ViewContent
+from core_functions.quran.formatter import FormatterOptions, QuranFormatter
+
+LEGACY_MARKS = {
+    MarksType.TEXT: {"۩": "(سجدة)", "ۚ": "(ج)", "ۗ": "(قلى)", "ۖ": "(صلى)", "ۘ": "(م)", "ۙ": "(لا)", "ۛ": "--", "ۜ": "س"},
+    MarksType.ACCESSIBLE: {"۩": "(سجدة)", "ۚ": "(،)", "ۗ": "(.ء)", "ۖ": "(؛)", "ۘ": "(.)", "ۙ": "(لا)", "ۛ": "--", "ۜ": "س"},
+}
+
+
+def legacy_to_arabic(number: int) -> str:
+    return str(number).translate(str.maketrans("0123456789", "٠١٢٣٤٥٦٧٨٩"))
+
+
+def format_legacy(view_content: ViewContent, ayahs, options: FormatterOptions) -> str:
+    text = ""
+    current_position = 0
+    final_ayahs = []
+    for i, ayah in enumerate(ayahs):
+        ayah_text = ayah.text
+        if options.marks_type != MarksType.DEFAULT:
+            for mark, replacement in LEGACY_MARKS[options.marks_type].items():
+                ayah_text = ayah_text.replace(mark, replacement)
+        if ayah.number_in_surah == 1:
+            ayah_text = f"{ayah.sura_name} ({legacy_to_arabic(ayah.sura_number)})\n|\n" + ayah_text
+            if ayah.sura_number != 1:
+                ayah_text = ayah_text.replace("بِسْمِ اللَّهِ الرَّحْمَٰنِ الرَّحِيمِ ", "بِسْمِ اللَّهِ الرَّحْمَٰنِ الرَّحِيمِ\n")
+        if options.show_ayah_number:
+            ayah_text += f" ({legacy_to_arabic(ayah.number_in_surah)})"
+        ayah_text = f"{ayah_text}\n"
+        ayah_text = f"|\n{ayah_text}" if i == 0 and view_content.number != 1 else ayah_text
+        text += ayah_text
+        ayah.first_position = current_position
+        current_position += len(ayah_text)
+        ayah.last_position = current_position - 1
+        final_ayahs.append(ayah)
+    text = text + "|" if options.auto_page_turn else text.strip()
+    view_content.text = text
+    view_content.insert_bulk(final_ayahs)
+    return text
+
+
+def main() -> None:
+    corpus = QuranCorpus.load()
+    print(f"Rendering {len(corpus)} ayahs")
+    for marks_type in MarksType:
+        options = FormatterOptions(marks_type=marks_type)
+
+        ayahs = corpus.get_range(1, len(corpus))
+        start = time.perf_counter()
+        view_content = ViewContent(number=None, label="نطاق", mode=NavigationMode.CUSTOM_RANGE)
+        legacy_text = format_legacy(view_content, ayahs, options)
+        legacy_time = time.perf_counter() - start
+
+        ayahs = corpus.get_range(1, len(corpus))
+        start = time.perf_counter()
+        view_content = ViewContent(number=None, label="نطاق", mode=NavigationMode.CUSTOM_RANGE)
+        text = QuranFormatter(view_content, options).format_view(ayahs)
+        format_time = time.perf_counter() - start
+
+        assert text == legacy_text, f"Formatter output differs for {marks_type}."
+        print(f"{marks_type.name:<11} legacy: {legacy_time * 1000:8.1f} ms   formatter: {format_time * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+"""
+Headless latency and memory benchmark of the reading engine.
+
+Walks every unit of every navigation mode, a set of custom ranges and cursor
+positions inside the rendered views, for both fonts and every MarksType.
+Prefetching is disabled and each walk uses a fresh manager, so every call renders.
+Reports p50/p95/max latency per operation and the peak memory of each font,
+and compares them against the stored baseline. Regressions beyond the tolerance
+exit with status 1. The baseline is machine dependent: regenerate it with
+--update-baseline on the machine the comparison runs on.
+
+Run from the project root:
+    python -m benchmarks.navigation_latency
+    python -m benchmarks.navigation_latency --update-baseline
+"""
+
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from statistics import quantiles
+from typing import Callable, Dict, Iterable, List
+from core_functions.quran.types import QuranFontType, NavigationMode, MarksType
+from core_functions.quran.quran_manager import QuranManager
+
+BASELINE_PATH = Path(__file__).with_name("navigation_latency_baseline.json")
+
+UNIT_GETTERS = {
+    NavigationMode.PAGE:    "get_page",
+    NavigationMode.SURAH:   "get_surah",
+    NavigationMode.JUZ:     "get_juz",
+    NavigationMode.HIZB:    "get_hizb",
+    NavigationMode.QUARTER: "get_quarter",
+}
+
+# (from_surah, from_ayah, to_surah, to_ayah), from a few ayahs up to the whole Quran.
+RANGES = [(1, 1, 1, 7), (2, 1, 2, 286), (2, 100, 5, 50), (18, 1, 36, 83), (36, 1, 114, 6), (1, 1, 114, 6)]
+
+POSITION_STEP = 101
+
+
+def create_manager(font_type: QuranFontType, marks_type: MarksType) -> QuranManager:
+    manager = QuranManager(font_type)
+    manager.prefetch_enabled = False
+    manager.formatter_options.marks_type = marks_type
+    return manager
+
+
+def time_calls(calls: Iterable[Callable[[], object]]) -> List[float]:
+    """Time each call with the garbage collector paused, so collections do not land in single samples."""
+    samples = []
+    for call in calls:
+        gc.disable()
+        start = time.perf_counter()
+        call()
+        samples.append((time.perf_counter() - start) * 1000)
+        gc.enable()
+    return samples
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    cuts = quantiles(samples, n=20, method="inclusive") if len(samples) > 1 else samples * 19
+    return {"p50": round(cuts[9], 4), "p95": round(cuts[18], 4), "max": round(max(samples), 4), "count": len(samples)}
+
+
+def measure_latency(font_type: QuranFontType, marks_type: MarksType) -> Dict[str, List[float]]:
+    """Return the samples of one walk over every unit, range and sampled cursor position."""
+    samples_by_operation = {}
+    manager = create_manager(font_type, marks_type)
+    positions_samples = []
+    for mode, getter_name in UNIT_GETTERS.items():
+        getter = getattr(manager, getter_name)
+        samples = []
+        for pos in range(1, QuranManager.get_max_for_navigation(mode) + 1):
+            samples.extend(time_calls([lambda: getter(pos)]))
+            view_content = manager.view_content
+            positions = range(0, len(view_content.text), POSITION_STEP)
+            positions_samples.extend(time_calls(lambda position=position: view_content.get_by_position(position) for position in positions))
+        samples_by_operation[getter_name] = samples
+
+    samples_by_operation["get_range"] = time_calls(lambda bounds=bounds: manager.get_range(*bounds) for bounds in RANGES)
+    samples_by_operation["get_by_position"] = positions_samples
+    return samples_by_operation
+
+
+def measure_memory(font_type: QuranFontType) -> Dict[str, float]:
+    """
+    Memory of walking every unit of every mode with the default options.
+    The shared corpus is loaded before tracing starts and reported on its own.
+    """
+    manager = create_manager(font_type, MarksType.DEFAULT)
+    tracemalloc.start()
+    for mode, getter_name in UNIT_GETTERS.items():
+        getter = getattr(manager, getter_name)
+        for pos in range(1, QuranManager.get_max_for_navigation(mode) + 1):
+            getter(pos)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"corpus_kb": round(sum(manager.corpus.memory_usage().values()) / 1024), "current_kb": round(current / 1024), "peak_kb": round(peak / 1024)}
+
+
+def run(repeat: int) -> Dict[str, Dict[str, float]]:
+    """
+    Walk every font and marks type the given number of times with fresh managers,
+    keeping the fastest time of each call to filter out scheduling noise.
+    """
+    results = {}
+    for font_type in QuranFontType:
+        for marks_type in MarksType:
+            walks = [measure_latency(font_type, marks_type) for _ in range(repeat)]
+            for operation in walks[0]:
+                samples = [min(times) for times in zip(*(walk[operation] for walk in walks))]
+                results[f"{font_type.name}/{marks_type.name}/{operation}"] = summarize(samples)
+    for font_type in QuranFontType:
+        results[f"{font_type.name}/memory"] = measure_memory(font_type)
+    QuranManager.formatter_options.marks_type = MarksType.DEFAULT
+    return results
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]], tolerance: float, slack_ms: float) -> List[str]:
+    """Return a description of every metric that regressed beyond the tolerance."""
+    regressions = []
+    for key, summary in results.items():
+        reference = baseline.get(key)
+        if reference is None:
+            continue
+        metrics = ("peak_kb",) if key.endswith("/memory") else ("p50", "p95")
+        for metric in metrics:
+            slack = 0 if metric == "peak_kb" else slack_ms
+            limit = reference[metric] * tolerance + slack
+            if summary[metric] > limit:
+                regressions.append(f"{key} {metric}: {summary[metric]} > {limit:.4f} (baseline {reference[metric]})")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Navigation latency benchmark of the reading engine.")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH, help="Baseline JSON file.")
+    parser.add_argument("--update-baseline", action="store_true", help="Store the results as the new baseline.")
+    parser.add_argument("--repeat", type=int, default=3, help="Walks per font and marks type, the fastest time of each call is kept.")
+    parser.add_argument("--tolerance", type=float, default=1.5, help="Allowed ratio over the baseline.")
+    parser.add_argument("--slack-ms", type=float, default=0.2, help="Allowed absolute latency increase, in ms.")
+    args = parser.parse_args()
+
+    rendered_views = QuranManager(QuranFontType.DEFAULT).rendered_views
+    print(f"Rendered views artifact: {'in use' if rendered_views else 'not found, views are rendered live'}")
+    results = run(max(1, args.repeat))
+    for key, summary in results.items():
+        if key.endswith("/memory"):
+            print(f"{key:<40} corpus {summary['corpus_kb']:>6} KB   walk current {summary['current_kb']:>6} KB   walk peak {summary['peak_kb']:>6} KB")
+        else:
+            print(f"{key:<40} p50 {summary['p50']:8.3f} ms   p95 {summary['p95']:8.3f} ms   max {summary['max']:8.3f} ms   n={summary['count']}")
+
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps(results, indent=4), encoding="utf-8")
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}, run with --update-baseline to create it.")
+        return 0
+
+    regressions = compare(results, json.loads(args.baseline.read_text(encoding="utf-8")), args.tolerance, args.slack_ms)
+    if regressions:
+        print(f"\nREGRESSIONS ({len(regressions)}):")
+        for regression in regressions:
+            print(f"  {regression}")
+        return 1
+
+    print("\nNo regression against the baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
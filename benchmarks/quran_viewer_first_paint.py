@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""
+Measure the first paint of a full-Quran custom range in QuranViewer, loading the
+whole text in the document against the windowed document mode.
+
+Run from the project root:
+    python -m benchmarks.quran_viewer_first_paint
+"""
+
+import sys
+import time
+from PyQt6.QtWidgets import QApplication, QTextEdit
+from core_functions.quran.types import QuranFontType
+from core_functions.quran.quran_manager import QuranManager
+from ui.widgets.qText_edit import QuranViewer
+
+
+def first_paint(app: QApplication, text: str, windowed: bool) -> float:
+    viewer = QuranViewer()
+    viewer.textChanged.disconnect(viewer.set_ctrl)
+    viewer.resize(800, 600)
+    viewer.show()
+    app.processEvents()
+
+    start = time.perf_counter()
+    if windowed:
+        viewer.setText(text)
+    else:
+        QTextEdit.setText(viewer, text)
+    viewer.viewport().repaint()
+    app.processEvents()
+    elapsed = time.perf_counter() - start
+
+    viewer.close()
+    viewer.deleteLater()
+    app.processEvents()
+    return elapsed
+
+
+def main() -> None:
+    app = QApplication(sys.argv)
+    text = QuranManager(QuranFontType.DEFAULT).get_range()
+    print(f"Full range: {len(text)} characters, {text.count(chr(10)) + 1} lines")
+
+    for windowed in (False, True):
+        times = sorted(first_paint(app, text, windowed) for _ in range(5))
+        label = "Windowed document:" if windowed else "Whole document:   "
+        print(f"{label} median {times[2] * 1000:8.1f} ms, best {times[0] * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
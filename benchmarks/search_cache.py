@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""
+Time searches of every mode without the result cache, then repeated with it, and
+check that the cached searches return the same rows, matches and groups. Also
+report the estimated size of each cached entry and the time to save and read back
+the persisted entries. The cache used here is written to a temporary folder.
+
+Run from the project root:
+    python -m benchmarks.search_cache
+"""
+
+import tempfile
+import time
+from pathlib import Path
+from core_functions.search import QuranSearchManager, SearchMode
+from core_functions.search.result_cache import SearchResultCache
+from core_functions.search.morphology import MorphologyIndex
+
+# (mode, text, match_whole_word)
+SEARCHES = [
+    (SearchMode.TEXT, "الله", False),
+    (SearchMode.TEXT, "الذين امنوا", False),
+    (SearchMode.TEXT, "يؤمنون", True),
+    (SearchMode.QUERY, "موسى OR هارون", False),
+    (SearchMode.QUERY, "الصبر NEAR/3 الصلاة", False),
+    (SearchMode.APPROXIMATE, "الصرط المستقم", False),
+    (SearchMode.ROOT, "ك ت ب", False),
+]
+REPEAT = 10
+
+
+def best_time(call) -> float:
+    times = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        call()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+
+def snapshot(manager: QuranSearchManager, rows: list) -> tuple:
+    return [tuple(row) for row in rows], manager.matches, manager.groups
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as folder:
+        cache = SearchResultCache(Path(folder) / "search_cache.json")
+        uncached = QuranSearchManager()
+        uncached.result_cache = None
+        cached = QuranSearchManager()
+        cached.result_cache = cache
+
+        for mode, text, match_whole_word in SEARCHES:
+            if mode == SearchMode.ROOT and MorphologyIndex.load() is None:
+                print(f"{text:>22}   skipped, the morphology index is not built")
+                continue
+            for manager in (uncached, cached):
+                manager.set(no_tashkil=True, no_hamza=True, match_whole_word=match_whole_word, mode=mode)
+            expected = snapshot(uncached, uncached.search(text))
+            assert snapshot(cached, cached.search(text)) == expected, f"First search differs: {text}"
+            assert snapshot(cached, cached.search(text)) == expected, f"Cached search differs: {text}"
+
+            cold_ms = best_time(lambda: uncached.search(text))
+            hit_ms = best_time(lambda: cached.search(text))
+            entry = cache.get(cached._cache_key(text, False))
+            print(
+                f"{text:>22} ({mode.name.lower():>11})   {len(expected[0]):5} results   "
+                f"search: {cold_ms:7.2f} ms   cached: {hit_ms:6.2f} ms   x{cold_ms / hit_ms:5.1f}   entry: {entry.size / 1024:6.1f} KB"
+            )
+
+        print(cache)
+        cache.persistent = True
+        start = time.perf_counter()
+        cache.save()
+        save_ms = (time.perf_counter() - start) * 1000
+        restored = SearchResultCache(cache.path)
+        start = time.perf_counter()
+        restored.set_persistent(True)
+        read_ms = (time.perf_counter() - start) * 1000
+        assert list(restored._entries) == list(cache._entries), "Persisted entries differ."
+        print(f"Saved {cache.path.stat().st_size / 1024:.0f} KB in {save_ms:.1f} ms, read back {len(restored)} entries in {read_ms:.1f} ms")
+        uncached._conn.close()
+        cached._conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""
+Build the trigram index of the words of the verses, report its build time and
+memory, then time approximate searches of misspelled words over the whole
+corpus: the candidate ranking alone (FuzzyWordIndex.search), the expansion to
+ayahs (FuzzyWordIndex.find), and the full search with the result rows
+(QuranSearchManager in SearchMode.APPROXIMATE). For every misspelling, the rank
+of the intended word among the candidates is reported.
+
+Run from the project root:
+    python -m benchmarks.search_fuzzy
+"""
+
+import time
+import tracemalloc
+from core_functions.search import QuranSearchManager, SearchMode
+from core_functions.search.fuzzy_index import FuzzyWordIndex
+from core_functions.search.word_index import WordIndex
+
+# Misspelled word: intended word, both without tashkil.
+MISSPELLINGS = {
+    "الرحمان": "الرحمن",
+    "يومنون": "يؤمنون",
+    "الصلوة": "الصلاة",
+    "موسي": "موسى",
+    "السموت": "السماوات",
+    "المستقم": "المستقيم",
+    "الجنه": "الجنة",
+    "ابرهيم": "إبراهيم",
+    "الكافرون": "الكافرين",
+    "صبرو": "صبروا",
+}
+PHRASE_QUERIES = ["الصرط المستقم", "رب العلمين", "بسم الله الرحمان الرحيم"]
+REPEAT = 20
+
+
+def best_time(call) -> float:
+    times = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        call()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+
+def main() -> None:
+    WordIndex.load(no_tashkil=True)
+    tracemalloc.start()
+    start = time.perf_counter()
+    index = FuzzyWordIndex.load()
+    build_ms = (time.perf_counter() - start) * 1000
+    memory_kb = tracemalloc.get_traced_memory()[0] / 1024
+    tracemalloc.stop()
+    print(f"{index}: built in {build_ms:.0f} ms, {memory_kb:.0f} KB")
+
+    manager = QuranSearchManager()
+    manager.result_cache = None
+    manager.set(mode=SearchMode.APPROXIMATE)
+    search_times = []
+    for misspelled, intended in MISSPELLINGS.items():
+        candidates = [word for word, _ in index.search(misspelled)]
+        rank = candidates.index(intended) + 1 if intended in candidates else None
+        search_ms = best_time(lambda: index.search(misspelled))
+        find_ms = best_time(lambda: index.find(misspelled))
+        full_ms = best_time(lambda: manager.search(misspelled))
+        search_times.append(search_ms)
+        print(
+            f"{misspelled:>10} -> {intended:<10} rank: {rank or '-':>2}   "
+            f"candidates: {search_ms:5.2f} ms   ayahs: {find_ms:5.2f} ms   search: {full_ms:6.2f} ms   "
+            f"({len(manager.search(misspelled))} results)"
+        )
+
+    for text in PHRASE_QUERIES:
+        full_ms = best_time(lambda: manager.search(text))
+        print(f"{text:>24}   search: {full_ms:6.2f} ms   ({len(manager.search(text))} results)")
+
+    search_times.sort()
+    print(f"Candidate ranking: median {search_times[len(search_times) // 2]:.2f} ms, max {search_times[-1]:.2f} ms")
+    manager._conn.close()
+
+
+if __name__ == "__main__":
+    main()
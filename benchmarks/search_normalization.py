@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""
+Compare QuranSearchManager, which searches the precomputed normalized columns,
+against the former query that wrapped the text column in up to 13 nested
+REPLACE() calls evaluated for every row, over the full Verses.DB.
+Both must return the same ayahs, except for whole word searches that keep the
+tashkil: QuranSearchManager answers those from the word index, which splits the
+verses on spaces, while REGEXP word boundaries also fall on tashkil. The legacy
+query never matches a word ending in a mark, such as اللَّهِ, and matches آمَنُوا
+inside وَآمَنُوا. The ayahs found by only one of them are counted instead.
+
+Run from the project root:
+    python -m benchmarks.search_normalization
+"""
+
+import re
+import sqlite3
+import time
+from itertools import product
+from core_functions.search import SearchCriteria, QuranSearchManager
+from core_functions.search.normalized_verses import NormalizedVerses, VERSES_DB_PATH
+
+QUERIES = ["اللَّهِ", "الرَّحْمَنِ", "إِنَّ", "آمَنُوا", "الله", "يؤمنون", "قال", "اسماء"]
+REPEAT = 5
+
+
+def legacy_query(search_text: str, no_tashkil: bool, no_hamza: bool, match_whole_word: bool):
+    if match_whole_word:
+        operator = "REGEXP"
+        search_text = rf"\b{search_text}\b"
+    else:
+        operator = "LIKE"
+        search_text = f"%{search_text}%"
+
+    query = f"SELECT * FROM quran WHERE page >= ? AND page <= ? AND text {operator} ?;"
+    if no_tashkil:
+        for char in ['َ', 'ً', 'ُ', 'ٌ', 'ِ', 'ٍ', 'ْ', 'ّ']:
+            search_text = search_text.replace(char, '')
+            query = query.replace('AND text', f"AND REPLACE(text, '{char}', '')")
+            query = query.replace('REPLACE(text', f"REPLACE(REPLACE(text, '{char}', '')")
+    if no_hamza:
+        for char in ['أ', 'إ', 'آ', 'ء', 'ؤ']:
+            search_text = search_text.replace(char, 'ا')
+            query = query.replace('AND text', f"AND REPLACE(text, '{char}', 'ا')")
+            query = query.replace('REPLACE(text', f"REPLACE(REPLACE(text, '{char}', 'ا')")
+    return query, search_text
+
+
+def best_time(call) -> float:
+    times = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        call()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+
+def main() -> None:
+    start = time.perf_counter()
+    manager = QuranSearchManager()
+    manager.result_cache = None
+    print(f"Normalized verses built in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    legacy_conn = sqlite3.connect(VERSES_DB_PATH)
+    legacy_conn.create_function("REGEXP", 2, lambda expr, item: re.search(expr, item) is not None)
+
+    for no_tashkil, no_hamza, match_whole_word in product((False, True), repeat=3):
+        manager.set(no_tashkil=no_tashkil, no_hamza=no_hamza, match_whole_word=match_whole_word, criteria=SearchCriteria.page, _from=1, _to=604)
+        legacy_total = normalized_total = 0.0
+        results = differing = 0
+        same_words = no_tashkil or not match_whole_word
+        for text in QUERIES:
+            query, search_text = legacy_query(text, no_tashkil, no_hamza, match_whole_word)
+            legacy = [row[2] for row in legacy_conn.execute(query, (1, 604, search_text))]
+            normalized = [row["number"] for row in manager.search(text)]
+            if same_words:
+                assert legacy == normalized, f"Results differ for {text!r} ({no_tashkil=}, {no_hamza=}, {match_whole_word=})."
+            differing += len(set(legacy) ^ set(normalized))
+            results += len(normalized)
+
+            legacy_total += best_time(lambda: legacy_conn.execute(query, (1, 604, search_text)).fetchall())
+            normalized_total += best_time(lambda: manager.search(text))
+
+        label = f"no_tashkil={no_tashkil!s:<5} no_hamza={no_hamza!s:<5} whole_word={match_whole_word!s:<5}"
+        print(
+            f"{label} REPLACE chain: {legacy_total / len(QUERIES):7.2f} ms   "
+            f"normalized: {normalized_total / len(QUERIES):7.2f} ms   "
+            f"x{legacy_total / normalized_total:5.1f}   ({results} results, {differing} differ)"
+        )
+
+    legacy_conn.close()
+    print(f"Shared database: {NormalizedVerses.URI}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""
+Build the positional word index of every normalization, report its build time
+and memory, then time exact word, phrase and prefix lookups against the REGEXP
+scan of the normalized verses. The lookups are timed alone (WordIndex.find),
+without fetching the result rows. The queries are typed without tashkil, so
+they only match the normalizations that ignore it, except as prefixes.
+
+Run from the project root:
+    python -m benchmarks.search_word_index
+"""
+
+import re
+import time
+import tracemalloc
+from itertools import product
+from core_functions.search.normalizer import normalize, text_column
+from core_functions.search.normalized_verses import NormalizedVerses
+from core_functions.search.word_index import WordIndex
+
+WORD_QUERIES = ["الله", "يؤمنون", "قال", "اسماء", "الصلاة", "موسى"]
+PHRASE_QUERIES = ["رب العالمين", "ان الله على كل شيء قدير", "يا ايها الذين امنوا", "الحمد لله"]
+PREFIX_QUERIES = ["الل", "يؤ", "قا", "رب العا", "مس"]
+REPEAT = 20
+
+
+def best_time(call) -> float:
+    times = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        call()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+
+def main() -> None:
+    conn = NormalizedVerses.connect()
+    conn.create_function("REGEXP", 2, lambda expr, item: re.search(expr, item) is not None)
+
+    for no_tashkil, no_hamza in product((True, False), repeat=2):
+        start = time.perf_counter()
+        WordIndex(no_tashkil, no_hamza)
+        build_time = time.perf_counter() - start
+        tracemalloc.start()
+        index = WordIndex.load(no_tashkil, no_hamza)
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        print(f"no_tashkil={no_tashkil!s:<5} no_hamza={no_hamza!s:<5} built in {build_time * 1000:6.0f} ms, {len(index)} words, {memory / 1024:.0f} KB")
+
+        column = text_column(no_tashkil, no_hamza)
+        for kind, queries, prefix in (("word", WORD_QUERIES, False), ("phrase", PHRASE_QUERIES, False), ("prefix", PREFIX_QUERIES, True)):
+            index_times, scan_times = [], []
+            results = differing = 0
+            for text in queries:
+                pattern = rf"\b{normalize(text, no_tashkil, no_hamza)}" + ("" if prefix else r"\b")
+                scan = f"SELECT number FROM quran_normalized WHERE {column} REGEXP ?;" if column != "text" else "SELECT number FROM quran WHERE text REGEXP ?;"
+                index_numbers = set(index.find(text, prefix))
+                scan_numbers = {row[0] for row in conn.execute(scan, (pattern,))}
+                results += len(index_numbers)
+                differing += len(index_numbers ^ scan_numbers)
+                index_times.append(best_time(lambda: index.find(text, prefix)))
+                scan_times.append(best_time(lambda: conn.execute(scan, (pattern,)).fetchall()))
+            print(
+                f"    {kind:<7} index: mean {sum(index_times) / len(queries):6.3f} ms, max {max(index_times):6.3f} ms   "
+                f"REGEXP scan: mean {sum(scan_times) / len(queries):7.2f} ms   ({results} ayahs, {differing} differ)"
+            )
+
+    conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""
+Build the similar verses index in a temporary folder, then compare the similar
+verses it finds for every ayah with a brute-force baseline: the exact Jaccard
+similarity of the word pairs of every pair of ayahs. Pairs without a common word
+pair have a similarity of 0, so the baseline only compares the ayahs that share
+one, which gives the same result as comparing all 6236² pairs.
+
+Recall is the share of the baseline results the index returns, precision the share
+of the LSH candidates that reach the minimum score (the returned results are ranked
+by their exact score, so they are all correct).
+
+Run from the project root:
+    python -m benchmarks.similar_verses
+"""
+
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+from core_functions.search.normalized_verses import NormalizedVerses
+from core_functions.search.similar_verses import SimilarVersesIndex, SHINGLE_COLUMN, MIN_SCORE, MAX_SIMILAR, shingles, jaccard
+
+NAIVE_SAMPLE_STEP = 50
+
+
+def brute_force(texts: dict) -> dict:
+    """Return the similar ayahs of every ayah with their exact score, best first."""
+    ayah_shingles = {number: shingles(text) for number, text in texts.items()}
+    ayahs_of = defaultdict(set)
+    for number, pairs in ayah_shingles.items():
+        for pair in pairs:
+            ayahs_of[pair].add(number)
+    similar = {}
+    for number, pairs in ayah_shingles.items():
+        others = set().union(*(ayahs_of[pair] for pair in pairs)) - {number}
+        scores = ((other, jaccard(pairs, ayah_shingles[other])) for other in others)
+        similar[number] = sorted(((other, score) for other, score in scores if score >= MIN_SCORE), key=lambda item: (-item[1], item[0]))
+    return similar
+
+
+def main() -> None:
+    conn = NormalizedVerses.connect()
+    texts = dict(conn.execute(f"SELECT number, {SHINGLE_COLUMN} FROM quran_normalized ORDER BY number;").fetchall())
+    conn.close()
+
+    start = time.perf_counter()
+    expected = brute_force(texts)
+    brute_force_ms = (time.perf_counter() - start) * 1000
+
+    # Without any index, one ayah is compared with every other ayah.
+    ayah_shingles = {number: shingles(text) for number, text in texts.items()}
+    sample = list(ayah_shingles)[::NAIVE_SAMPLE_STEP]
+    start = time.perf_counter()
+    for number in sample:
+        [jaccard(ayah_shingles[number], pairs) for pairs in ayah_shingles.values()]
+    naive_ms = (time.perf_counter() - start) * 1000 / len(sample)
+
+    with tempfile.TemporaryDirectory() as folder:
+        index = SimilarVersesIndex(Path(folder) / "similar_verses.db")
+        start = time.perf_counter()
+        index.build()
+        build_ms = (time.perf_counter() - start) * 1000
+        print(f"Build:        {build_ms:8.0f} ms, {index.path.stat().st_size / 1024:.0f} KB")
+        print(f"Brute force:  {brute_force_ms:8.0f} ms for every ayah, {naive_ms:.2f} ms per ayah compared with every other one")
+
+        found = relevant = top_found = top_relevant = candidates = good_candidates = 0
+        times = []
+        for number, similar in expected.items():
+            start = time.perf_counter()
+            results = index.find(number, limit=None)
+            times.append(time.perf_counter() - start)
+            ayah_candidates = index.candidates(number)
+            expected_numbers = {other for other, _ in similar}
+            candidates += len(ayah_candidates)
+            good_candidates += len(ayah_candidates & expected_numbers)
+            found += len({verse.number for verse in results} & expected_numbers)
+            relevant += len(expected_numbers)
+            top_expected = {other for other, _ in similar[:MAX_SIMILAR]}
+            top_found += len({verse.number for verse in results[:MAX_SIMILAR]} & top_expected)
+            top_relevant += len(top_expected)
+            assert all(abs(verse.score - dict(similar).get(verse.number, 0)) < 1e-9 for verse in results), f"Scores of {number} differ."
+
+    times.sort()
+    print(f"Query:        {sum(times) / len(times) * 1000:8.2f} ms on average, {times[len(times) // 2] * 1000:.2f} ms median, {times[-1] * 1000:.2f} ms max")
+    print(f"Recall:       {found / relevant:8.4f} of {relevant} similar pairs with a score of at least {MIN_SCORE}")
+    print(f"Top {MAX_SIMILAR} recall: {top_found / top_relevant:8.4f}")
+    print(f"Precision:    {good_candidates / candidates:8.4f} of {candidates} LSH candidates, {candidates / len(expected):.1f} per ayah")
+
+
+if __name__ == "__main__":
+    main()
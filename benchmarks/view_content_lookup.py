@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""
+Compare cursor-to-ayah resolution in ViewContent against the former
+per-view in-memory SQLite lookup (first_position <= p <= last_position,
+retrying one character back on a miss).
+
+Run from the project root:
+    python -m benchmarks.view_content_lookup
+"""
+
+import time
+from sqlalchemy import create_engine, Column, Integer
+from sqlalchemy.orm import sessionmaker, declarative_base
+from core_functions.quran.types import QuranFontType, NavigationMode
+from core_functions.quran.quran_manager import QuranManager
+
+SQLiteBase = declarative_base()
+
+
+class PositionRow(SQLiteBase):
+    __tablename__ = "ayah_view_map"
+
+    number = Column(Integer, primary_key=True)
+    first_position = Column(Integer, nullable=False)
+    last_position = Column(Integer, nullable=False)
+
+
+def lookup_with_sql(session, position: int) -> int:
+    while True:
+        row = (
+            session.query(PositionRow)
+            .filter(PositionRow.first_position <= position, PositionRow.last_position >= position)
+            .first()
+        )
+        if row:
+            return row.number
+        position -= 1
+
+
+def main() -> None:
+    manager = QuranManager(QuranFontType.DEFAULT, NavigationMode.JUZ)
+    manager.get_juz(1)
+    view_content = manager.view_content
+    ayahs = [view_content.get_by_ayah_number(number) for number in range(view_content.start_ayah.number, view_content.end_ayah.number + 1)]
+    positions = range(0, len(view_content.text), 7)
+
+    start = time.perf_counter()
+    engine = create_engine("sqlite:///:memory:", echo=False)
+    SQLiteBase.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.bulk_save_objects([PositionRow(number=ayah.number, first_position=ayah.first_position, last_position=ayah.last_position) for ayah in ayahs])
+    session.commit()
+    sql_build_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    sql_results = [lookup_with_sql(session, position) for position in positions]
+    sql_time = time.perf_counter() - start
+    session.close()
+    engine.dispose()
+
+    start = time.perf_counter()
+    bisect_results = [view_content.get_by_position(position).number for position in positions]
+    bisect_time = time.perf_counter() - start
+
+    assert sql_results == bisect_results, "SQLite and bisect lookups differ."
+    print(f"View:              {view_content.edit_label} ({len(ayahs)} ayahs, {len(view_content.text)} chars)")
+    print(f"SQLite build:      {sql_build_time * 1000:8.1f} ms (once per view)")
+    print(f"SQLite lookups:    {sql_time * 1000:8.1f} ms for {len(positions)} positions")
+    print(f"Bisect lookups:    {bisect_time * 1000:8.1f} ms for {len(positions)} positions")
+    print(f"Speedup:           {sql_time / bisect_time:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
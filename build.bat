@@ -21,6 +21,9 @@ if exist requirements.txt (
 )
 
 
+echo Building rendered Quran views...
+python -m core_functions.quran.rendered_views
+
 if exist setup.py (
     echo Building the program with cx-Freeze...
     python setup.py build
@@ -26,6 +26,10 @@ else {
 
 
 
+Write-Host "Building rendered Quran views..."
+python -m core_functions.quran.rendered_views
+
+
 if (Test-Path "setup.py") {
     Write-Host "Building the program with cx-Freeze..."
     python setup.py build
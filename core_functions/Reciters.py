@@ -4,6 +4,7 @@ from typing import List, Dict, Optional
 from functools import lru_cache
 from abc import ABC, abstractmethod
 from exceptions.database import DBNotFoundError
+from utils.db_connections import ReadOnlyConnections
 from utils.logger import LoggerManager
 from core_functions.downloader.db import DownloadDB
 from core_functions.downloader.models import DownloadSurahs, DownloadAyahs
@@ -21,14 +22,13 @@ class RecitersManager(ABC):
         logger.debug(f"{self.__class__.__name__} initialized.")
 
     def _connect(self) -> sqlite3.Connection:
-        """Establishes a connection to the SQLite database."""
+        """Returns the shared read-only connection of this thread to the SQLite database."""
         logger.debug(f"Connecting to database at: {self.db_path} in {self.__class__.__name__}")
         if not os.path.isfile(self.db_path):
             logger.error(f"Database file not found: {self.db_path}")
             raise DBNotFoundError(self.db_path)
         
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        conn = ReadOnlyConnections.get(self.db_path)
         logger.debug(f"Database connection established successfully to {self.db_path} in {self.__class__.__name__}")
         return conn
 
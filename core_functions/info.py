@@ -2,6 +2,13 @@ import sqlite3
 import json
 import os
 from abc import ABC, abstractmethod
+from threading import Lock
+from typing import Dict, Optional
+from core_functions.quran.types import NavigationMode
+from core_functions.quran.corpus import QuranCorpus
+from core_functions.search.statistics import CorpusStatistics
+from core_functions.search.similar_verses import SimilarVersesIndex
+from utils.db_connections import ReadOnlyConnections
 from utils.logger import LoggerManager
 
 logger = LoggerManager.get_logger(__name__)
@@ -9,16 +16,15 @@ logger = LoggerManager.get_logger(__name__)
 class Base(ABC):
     
     def _connect(self, file_path) -> sqlite3.Connection:
-        """Connect to the SQLite database and return the connection object."""
+        """Return the shared read-only connection of this thread to the SQLite database."""
         logger.debug(f"Connecting to the database: {file_path}, in instance of {self.__class__.__name__}")
         
         if not os.path.isfile(file_path):
             logger.error(f"No database found in: {file_path}")
             raise FileNotFoundError(f"No database found in: {file_path}")
 
-        conn = sqlite3.connect(file_path)
-        conn.row_factory = sqlite3.Row
-        logger.info(f"Connected to the database successfully: {file_path}, in instance of {self.__class__.__name__}")
+        conn = ReadOnlyConnections.get(file_path)
+        logger.debug(f"Connected to the database successfully: {file_path}, in instance of {self.__class__.__name__}")
         return conn
     
     @property
@@ -35,13 +41,84 @@ class Base(ABC):
         logger.debug(f"Removed empty lines, new text length: {len(text)}.")
         return text
 
-    def __del__(self) -> None:
-        """Destructor to close the database connection."""
-        logger.debug(f"Deleting {self.__class__.__name__} object and closing database.")
-        if self._conn is not None:
-            self._conn.close()
-            logger.info(f"Deleted {self.__class__.__name__} object and Database connection closed.")
-        
+class UnitInfoTable:
+    """
+    Summary of every juz, hizb, quarter and page of a Quran database.
+
+    The ayahs are read once in the order of the mushaf and each unit keeps its
+    first and last ayah, the range of pages, hizbs, quarters and juz it spans, its
+    surahs and its longest and shortest ayah (the first one on ties), so showing the
+    information of a unit is a dictionary lookup. Tables are shared per database.
+    """
+    UNIT_COLUMNS = ("juz", "hizb", "hizbQuarter", "page")
+    _instances: Dict[str, "UnitInfoTable"] = {}
+    _lock = Lock()
+
+    def __init__(self, file_path) -> None:
+        logger.debug(f"Computing the units information of {file_path}.")
+        rows = ReadOnlyConnections.get(file_path).execute(
+            "SELECT number, sura_number, sura_name, numberInSurah, juz, hizb, hizbQuarter, page, text FROM quran ORDER BY number;"
+        ).fetchall()
+        self._units: Dict[str, Dict[int, dict]] = {column: {} for column in self.UNIT_COLUMNS}
+        for row in rows:
+            for column in self.UNIT_COLUMNS:
+                self._add(self._units[column], row[column], row)
+
+        for units in self._units.values():
+            for unit in units.values():
+                unit["count_surahs"] = len(unit.pop("sura_numbers"))
+                unit["surah_names"] = ", ".join(name.replace("سورة ", "") for name in unit.pop("sura_names"))
+                del unit["longest_length"], unit["shortest_length"]
+        logger.info(f"Units information of {file_path} computed from {len(rows)} ayahs.")
+
+    @staticmethod
+    def _add(units: Dict[int, dict], number: int, row: sqlite3.Row) -> None:
+        length = len(row["text"])
+        unit = units.get(number)
+        if unit is None:
+            units[number] = {
+                "start_juz": row["juz"], "end_juz": row["juz"],
+                "start_hizb": row["hizb"], "end_hizb": row["hizb"],
+                "start_quarter": row["hizbQuarter"], "end_quarter": row["hizbQuarter"],
+                "start_page": row["page"], "end_page": row["page"],
+                "count_ayahs": 1,
+                "sura_numbers": {row["sura_number"]},
+                "sura_names": [row["sura_name"]],
+                "start_ayah_number": row["numberInSurah"], "start_sura_name": row["sura_name"],
+                "end_ayah_number": row["numberInSurah"], "end_sura_name": row["sura_name"],
+                "longest_ayah_number": row["numberInSurah"], "longest_ayah_sura": row["sura_name"], "longest_length": length,
+                "shortest_ayah_number": row["numberInSurah"], "shortest_ayah_sura": row["sura_name"], "shortest_length": length,
+            }
+            return
+
+        for column, key in (("juz", "juz"), ("hizb", "hizb"), ("hizbQuarter", "quarter"), ("page", "page")):
+            unit[f"start_{key}"] = min(unit[f"start_{key}"], row[column])
+            unit[f"end_{key}"] = max(unit[f"end_{key}"], row[column])
+        unit["count_ayahs"] += 1
+        unit["sura_numbers"].add(row["sura_number"])
+        if row["sura_name"] not in unit["sura_names"]:
+            unit["sura_names"].append(row["sura_name"])
+        unit["end_ayah_number"] = row["numberInSurah"]
+        unit["end_sura_name"] = row["sura_name"]
+        if length > unit["longest_length"]:
+            unit["longest_ayah_number"], unit["longest_ayah_sura"], unit["longest_length"] = row["numberInSurah"], row["sura_name"], length
+        if length < unit["shortest_length"]:
+            unit["shortest_ayah_number"], unit["shortest_ayah_sura"], unit["shortest_length"] = row["numberInSurah"], row["sura_name"], length
+
+    @classmethod
+    def load(cls, file_path) -> "UnitInfoTable":
+        """Return the shared table of the database, computing it on first use."""
+        key = os.path.abspath(file_path)
+        with cls._lock:
+            if key not in cls._instances:
+                cls._instances[key] = cls(file_path)
+            return cls._instances[key]
+
+    def get(self, column: str, number: int) -> Optional[dict]:
+        """Return the summary of the unit with the given number in the column (juz, hizb, hizbQuarter or page), or None."""
+        return self._units[column].get(number)
+
+
 class E3rab(Base):
     def __init__(self, surah_number: int, ayah_number: int) -> None:
         logger.debug(f"Initializing E3rab with surah: {surah_number}, ayah: {ayah_number}.")
@@ -243,8 +320,7 @@ class JuzInfo(Base):
         assert 1 <= juz_number <= 30, "❌ Juz number must be between 1 and 30."
         self._juz_number = juz_number
         file_path = os.path.join("database", "quran", "quran.DB")
-        self._conn = self._connect(file_path)
-        self.cursor = self._conn.cursor()
+        self._units = UnitInfoTable.load(file_path)
         logger.debug(f"Initialized JuzInfo successfully for Juz {juz_number}.")
 
     @property
@@ -252,37 +328,16 @@ class JuzInfo(Base):
         """Fetch the Juz information for the specified Juz number."""
         logger.debug(f"Fetching information for Juz {self._juz_number}.")
         
-        query = """ 
-        SELECT 
-            juz AS juz_number,
-            MIN(page) AS start_page,
-            MAX(page) AS end_page,
-            MIN(hizb) AS start_hizb,
-            MAX(hizb) AS end_hizb,
-            MIN(hizbQuarter) AS start_hizbQuarter,
-            MAX(hizbQuarter) AS end_hizbQuarter,
-            COUNT(DISTINCT sura_number) AS count_surahs,
-            COUNT(number) AS count_ayahs,
-            (SELECT numberInSurah FROM quran q2 WHERE q2.juz = q1.juz ORDER BY number LIMIT 1) AS start_ayah_number,
-            (SELECT numberInSurah FROM quran q3 WHERE q3.juz = q1.juz ORDER BY number DESC LIMIT 1) AS end_ayah_number,
-            (SELECT sura_name FROM quran q4 WHERE q4.juz = q1.juz ORDER BY number LIMIT 1) AS start_sura_name,
-            (SELECT sura_name FROM quran q5 WHERE q5.juz = q1.juz ORDER BY number DESC LIMIT 1) AS end_sura_name,
-            (SELECT numberInSurah FROM quran q6 WHERE q6.juz = q1.juz ORDER BY LENGTH(text) DESC LIMIT 1) AS longest_ayah_number,
-            (SELECT sura_name FROM quran q7 WHERE q7.juz = q1.juz ORDER BY LENGTH(text) DESC LIMIT 1) AS longest_ayah_sura,
-            (SELECT numberInSurah FROM quran q8 WHERE q8.juz = q1.juz ORDER BY LENGTH(text) ASC LIMIT 1) AS shortest_ayah_number,
-            (SELECT sura_name FROM quran q9 WHERE q9.juz = q1.juz ORDER BY LENGTH(text) ASC LIMIT 1) AS shortest_ayah_sura,
-            (SELECT GROUP_CONCAT(REPLACE(sura_name, 'سورة ', ''), ', ') FROM (SELECT DISTINCT sura_name FROM quran WHERE juz = q1.juz)) AS surah_names
-        FROM quran q1
-        WHERE juz = ?
-        GROUP BY juz;
-        """
-
-        self.cursor.execute(query, (self._juz_number,))
-        result = self.cursor.fetchone()
-
-        if result:
+        unit = self._units.get("juz", self._juz_number)
+        if unit:
+            data = {
+                **unit,
+                "juz_number": self._juz_number,
+                "start_hizbQuarter": unit["start_quarter"],
+                "end_hizbQuarter": unit["end_quarter"],
+            }
             logger.debug(f"Information fetched successfully for Juz {self._juz_number}.")
-            return self._format(dict(result))
+            return self._format(data)
         else:
             logger.warning(f"No information found for Juz {self._juz_number}. Returning empty string.")
             return ""
@@ -314,8 +369,7 @@ class HizbInfo(Base):
         assert 1 <= hizb_number <= 60, "❌ Hizb number must be between 1 and 60."
         self._hizb_number = hizb_number
         file_path = os.path.join("database", "quran", "quran.DB")
-        self._conn = self._connect(file_path)
-        self.cursor = self._conn.cursor()
+        self._units = UnitInfoTable.load(file_path)
         logger.debug(f"Initialized HizbInfo successfully for Hizb {hizb_number}.")
 
     @property
@@ -323,40 +377,18 @@ class HizbInfo(Base):
         """Fetch the Hizb information for the specified Hizb number."""
         logger.debug(f"Fetching information for Hizb {self._hizb_number}.")
 
-        query = """ 
-        SELECT 
-            hizb AS hizb_number,
-            CASE 
-                WHEN (hizb % 2) = 1 THEN 'الأول' 
-                ELSE 'الثاني' 
-            END AS hizb_order_in_juz,
-            MIN(juz) AS juz,
-            MIN(page) AS start_page,
-            MAX(page) end_page,
-            MIN(hizbQuarter) AS start_hizbQuarter,
-            MAX(hizbQuarter) AS end_hizbQuarter,
-            COUNT(DISTINCT sura_number) AS count_surahs,
-            COUNT(number) AS count_ayahs,
-            (SELECT numberInSurah FROM quran WHERE hizb = q1.hizb ORDER BY number LIMIT 1) AS start_ayah_number,
-            (SELECT numberInSurah FROM quran WHERE hizb = q1.hizb ORDER BY number DESC LIMIT 1) AS end_ayah_number,
-            (SELECT sura_name FROM quran WHERE hizb = q1.hizb ORDER BY number LIMIT 1) AS start_sura_name,
-            (SELECT sura_name FROM quran WHERE hizb = q1.hizb ORDER BY number DESC LIMIT 1) AS end_sura_name,
-            (SELECT numberInSurah FROM quran WHERE hizb = q1.hizb ORDER BY LENGTH(text) DESC LIMIT 1) AS longest_ayah_number,
-            (SELECT sura_name FROM quran WHERE hizb = q1.hizb ORDER BY LENGTH(text) DESC LIMIT 1) AS longest_ayah_sura,
-            (SELECT numberInSurah FROM quran WHERE hizb = q1.hizb ORDER BY LENGTH(text) ASC LIMIT 1) AS shortest_ayah_number,
-            (SELECT sura_name FROM quran WHERE hizb = q1.hizb ORDER BY LENGTH(text) ASC LIMIT 1) AS shortest_ayah_sura,
-            (SELECT GROUP_CONCAT(REPLACE(sura_name, 'سورة ', ''), ', ') FROM (SELECT DISTINCT sura_name FROM quran WHERE hizb = q1.hizb)) AS surah_names
-        FROM quran q1
-        WHERE hizb = ?
-        GROUP BY hizb;
-        """
-
-        self.cursor.execute(query, (self._hizb_number,))
-        result = self.cursor.fetchone()
-
-        if result:
+        unit = self._units.get("hizb", self._hizb_number)
+        if unit:
+            data = {
+                **unit,
+                "hizb_number": self._hizb_number,
+                "hizb_order_in_juz": "الأول" if self._hizb_number % 2 == 1 else "الثاني",
+                "juz": unit["start_juz"],
+                "start_hizbQuarter": unit["start_quarter"],
+                "end_hizbQuarter": unit["end_quarter"],
+            }
             logger.debug(f"Information fetched successfully for Hizb {self._hizb_number}.")
-            return self._format(dict(result))
+            return self._format(data)
         else:
             logger.warning(f"No information found for Hizb {self._hizb_number}. Returning empty string.")
             return ""
@@ -388,8 +420,7 @@ class QuarterInfo(Base):
         assert 1 <= quarter_number <= 240, "❌ Quarter number must be between 1 and 240."
         self._quarter_number = quarter_number
         file_path = os.path.join("database", "quran", "quran.DB")        
-        self._conn = self._connect(file_path)
-        self.cursor = self._conn.cursor()
+        self._units = UnitInfoTable.load(file_path)
         logger.info(f"Initialized QuarterInfo successfully for Quarter {quarter_number}.")
 
     @property
@@ -397,45 +428,18 @@ class QuarterInfo(Base):
         """Fetch the Quarter information for the specified Quarter number."""
         logger.debug(f"Fetching information for Quarter {self._quarter_number}.")
         
-        query = """ 
-        SELECT 
-            hizbQuarter AS quarter_number,
-            CASE
-            WHEN hizb % 2 = 1 THEN 'الأول'
-            ELSE 'الثاني'
-            END AS hizbOrderInJuz,
-            CASE 
-                WHEN hizbQuarter % 4 = 1 THEN 'الأول'
-                WHEN hizbQuarter % 4 = 2 THEN 'الثاني'
-                WHEN hizbQuarter % 4 = 3 THEN 'الثالث'
-                ELSE 'الرابع'
-            END AS quarter_order_in_hizb,
-            MIN(juz) AS juz_number,
-            MIN(hizb) AS hizb,
-            MIN(page) AS start_page,
-            MAX(page) AS end_page,
-            COUNT(DISTINCT sura_number) AS count_surahs,
-            COUNT(number) AS count_ayahs,
-            (SELECT numberInSurah FROM quran WHERE hizbQuarter = q1.hizbQuarter ORDER BY number LIMIT 1) AS start_ayah_number,
-            (SELECT numberInSurah FROM quran WHERE hizbQuarter = q1.hizbQuarter ORDER BY number DESC LIMIT 1) AS end_ayah_number,
-            (SELECT sura_name FROM quran WHERE hizbQuarter = q1.hizbQuarter ORDER BY number LIMIT 1) AS start_sura_name,
-            (SELECT sura_name FROM quran WHERE hizbQuarter = q1.hizbQuarter ORDER BY number DESC LIMIT 1) AS end_sura_name,
-            (SELECT numberInSurah FROM quran WHERE hizbQuarter = q1.hizbQuarter ORDER BY LENGTH(text) DESC LIMIT 1) AS longest_ayah_number,
-            (SELECT sura_name FROM quran WHERE hizbQuarter = q1.hizbQuarter ORDER BY LENGTH(text) DESC LIMIT 1) AS longest_ayah_sura,
-            (SELECT numberInSurah FROM quran WHERE hizbQuarter = q1.hizbQuarter ORDER BY LENGTH(text) ASC LIMIT 1) AS shortest_ayah_number,
-            (SELECT sura_name FROM quran WHERE hizbQuarter = q1.hizbQuarter ORDER BY LENGTH(text) ASC LIMIT 1) AS shortest_ayah_sura,
-            (SELECT GROUP_CONCAT(REPLACE(sura_name, 'سورة ', ''), ', ') FROM (SELECT DISTINCT sura_name FROM quran WHERE hizbQuarter = q1.hizbQuarter)) AS surah_names
-        FROM quran q1
-        WHERE hizbQuarter = ?
-        GROUP BY hizbQuarter;
-        """
-
-        self.cursor.execute(query, (self._quarter_number,))
-        result = self.cursor.fetchone()
-
-        if result:
+        unit = self._units.get("hizbQuarter", self._quarter_number)
+        if unit:
+            data = {
+                **unit,
+                "quarter_number": self._quarter_number,
+                "hizbOrderInJuz": "الأول" if unit["start_hizb"] % 2 == 1 else "الثاني",
+                "quarter_order_in_hizb": ("الرابع", "الأول", "الثاني", "الثالث")[self._quarter_number % 4],
+                "juz_number": unit["start_juz"],
+                "hizb": unit["start_hizb"],
+            }
             logger.debug(f"Information fetched successfully for Quarter {self._quarter_number}.")
-            return self._format(dict(result))
+            return self._format(data)
         else:
             logger.warning(f"No information found for Quarter {self._quarter_number}. Returning empty string.")
             return ""
@@ -466,8 +470,7 @@ class PageInfo(Base):
         assert 1 <= page_number <= 604, "❌ Page number must be between 1 and 604."
         self._page_number = page_number
         file_path = os.path.join("database", "quran", "quran.DB")
-        self._conn = self._connect(file_path)
-        self.cursor = self._conn.cursor()
+        self._units = UnitInfoTable.load(file_path)
         logger.debug(f"Initialized PageInfo successfully for Page {page_number}.")
 
     @property
@@ -475,34 +478,17 @@ class PageInfo(Base):
         """Fetch the Page information for the specified Page number."""
         logger.debug(f"Fetching information for Page {self._page_number}.")
         
-        query = """ 
-        SELECT 
-            page AS page_number,
-            MIN(juz) AS juz_number,
-            MIN(hizb) AS hizb_number,
-            MIN(hizbQuarter) AS quarter_number,
-            COUNT(DISTINCT sura_number) AS count_surahs,
-            COUNT(number) AS count_ayahs,
-            (SELECT numberInSurah FROM quran WHERE page = q1.page ORDER BY number LIMIT 1) AS start_ayah_number,
-            (SELECT numberInSurah FROM quran WHERE page = q1.page ORDER BY number DESC LIMIT 1) AS end_ayah_number,
-            (SELECT sura_name FROM quran WHERE page = q1.page ORDER BY number LIMIT 1) AS start_sura_name,
-            (SELECT sura_name FROM quran WHERE page = q1.page ORDER BY number DESC LIMIT 1) AS end_sura_name,
-            (SELECT numberInSurah FROM quran WHERE page = q1.page ORDER BY LENGTH(text) DESC LIMIT 1) AS longest_ayah_number,
-            (SELECT sura_name FROM quran WHERE page = q1.page ORDER BY LENGTH(text) DESC LIMIT 1) AS longest_ayah_sura,
-            (SELECT numberInSurah FROM quran WHERE page = q1.page ORDER BY LENGTH(text) ASC LIMIT 1) AS shortest_ayah_number,
-            (SELECT sura_name FROM quran WHERE page = q1.page ORDER BY LENGTH(text) ASC LIMIT 1) AS shortest_ayah_sura,
-            (SELECT GROUP_CONCAT(REPLACE(sura_name, 'سورة ', ''), ', ') FROM (SELECT DISTINCT sura_name FROM quran WHERE page = q1.page)) AS surah_names
-        FROM quran q1
-        WHERE page = ?
-        GROUP BY page;
-        """
-
-        self.cursor.execute(query, (self._page_number,))
-        result = self.cursor.fetchone()
-
-        if result:
+        unit = self._units.get("page", self._page_number)
+        if unit:
+            data = {
+                **unit,
+                "page_number": self._page_number,
+                "juz_number": unit["start_juz"],
+                "hizb_number": unit["start_hizb"],
+                "quarter_number": unit["start_quarter"],
+            }
             logger.debug(f"Information fetched successfully for Page {self._page_number}.")
-            return self._format(dict(result))
+            return self._format(data)
         else:
             logger.warning(f"No information found for Page {self._page_number}. Returning empty string.")
             return ""
@@ -586,3 +572,98 @@ class MoshafInfo(Base):
         logger.debug("General information about the Quran formatted successfully.")
         return text.strip()
 
+
+class UnitStatistics(Base):
+    TOP_WORDS = 10
+
+    def __init__(self, mode: NavigationMode, number: int, unit_label: str) -> None:
+        """Initialize with a page, surah, juz, hizb or quarter and how the text refers to it, e.g. "هذه السورة"."""
+        logger.debug(f"Initializing UnitStatistics for {mode.name} {number}.")
+        self._mode = mode
+        self._number = number
+        self._unit_label = unit_label
+        logger.debug(f"Initialized UnitStatistics successfully for {mode.name} {number}.")
+
+    @property
+    def text(self) -> str:
+        """Compute the word statistics of the unit from the shared corpus statistics."""
+        logger.debug(f"Computing word statistics for {self._mode.name} {self._number}.")
+        statistics = CorpusStatistics.load()
+        start, end = statistics.unit_bounds(self._mode, self._number)
+        if start == end:
+            logger.warning(f"No ayahs found for {self._mode.name} {self._number}. Returning empty string.")
+            return ""
+
+        data = {
+            "word_count": statistics.word_count(start, end),
+            "unique_count": statistics.unique_count(start, end),
+            "exclusive_count": len(statistics.exclusive_words(start, end)),
+            "top_words": "، ".join(f"{word} ({count})" for word, count in statistics.top_words(start, end, self.TOP_WORDS)),
+        }
+        return self._format(data)
+
+    def _format(self, data: dict) -> str:
+        """Format the word statistics into a readable string."""
+        text = f"""
+إحصاءات الكلمات:
+عدد الكلمات: {data["word_count"]}.
+عدد الكلمات دون تكرار: {data["unique_count"]}.
+عدد الكلمات التي لا ترد في غير {self._unit_label}: {data["exclusive_count"]}.
+أكثر الكلمات ورودًا: {data["top_words"]}.
+"""
+        logger.debug(f"Formatted word statistics for {self._mode.name} {self._number}.")
+        return text.strip()
+
+
+class WordConcordance(Base):
+    CONTEXT_WORDS = 4
+
+    def __init__(self, word: str) -> None:
+        logger.debug(f"Initializing WordConcordance for: {word}.")
+        self._word = word
+
+    @property
+    def text(self) -> str:
+        """List every occurrence of the word with its context, after its count in each surah."""
+        logger.debug(f"Building the concordance of: {self._word}.")
+        statistics = CorpusStatistics.load()
+        lines = statistics.concordance(self._word, self.CONTEXT_WORDS)
+        if not lines:
+            logger.warning(f"Word not found in the Quran: {self._word}. Returning empty string.")
+            return ""
+
+        corpus = QuranCorpus.load()
+        distribution = statistics.distribution(self._word, NavigationMode.SURAH)
+        surahs = "، ".join(f"{corpus.sura_names[sura_number].replace('سورة ', '')} ({count})" for sura_number, count in distribution.items())
+        text = f"وردت {len(lines)} مرة في {len(distribution)} سورة: {surahs}.\n\n"
+        for line in lines:
+            sura_number, number_in_surah = corpus.surah_ayah(line.number)
+            text += f"{line.left} [{line.word}] {line.right} | الآية {number_in_surah} من {corpus.sura_names[sura_number]}\n"
+
+        logger.debug(f"Concordance of {self._word} built with {len(lines)} lines.")
+        return text.strip()
+
+
+class SimilarVerses(Base):
+    def __init__(self, ayah_number: int) -> None:
+        logger.debug(f"Initializing SimilarVerses with Ayah {ayah_number}.")
+        self._ayah_number = ayah_number
+
+    @property
+    def text(self) -> str:
+        """List the ayahs most similar to the given one with their similarity."""
+        logger.debug(f"Fetching the similar verses of Ayah {self._ayah_number}.")
+        index = SimilarVersesIndex.load()
+        similar = index.find(self._ayah_number) if index is not None else []
+        if not similar:
+            logger.warning(f"No similar verses found for Ayah {self._ayah_number}. Returning empty string.")
+            return ""
+
+        corpus = QuranCorpus.load()
+        text = ""
+        for verse in similar:
+            ayah = corpus.get_range(verse.number, verse.number)[0]
+            text += f"{ayah.text} | الآية {ayah.number_in_surah} من {ayah.sura_name}، نسبة التشابه {verse.score:.0%}\n"
+
+        logger.debug(f"Found {len(similar)} similar verses for Ayah {self._ayah_number}.")
+        return text.strip()
@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+
+import sys
+from array import array
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from .models import Quran
+from .types import NavigationMode, QuranFontType, Ayah
+from utils.logger import LoggerManager
+
+logger = LoggerManager.get_logger(__name__)
+
+
+class QuranCorpus:
+    """
+    Column-oriented, in-memory copy of the Quran databases.
+
+    The whole corpus is loaded once, every navigation unit (page, surah, juz,
+    hizb and quarter) is resolved to a precomputed [start, end) slice of the
+    columns, so fetching a unit never touches the database.
+
+    The text of every QuranFontType is held side by side, aligned by ayah number,
+    so switching font only picks another text column.
+    """
+    _instance: Optional["QuranCorpus"] = None
+
+    def __init__(self, databases: Optional[Dict[QuranFontType, Path]] = None):
+        self.databases = databases or {font_type: font_type.database for font_type in QuranFontType}
+        logger.debug(f"Loading Quran corpus from: {list(self.databases.values())}")
+        self.numbers = array("H")
+        self.sura_numbers = array("B")
+        self.numbers_in_surah = array("H")
+        self.juz = array("B")
+        self.hizb = array("B")
+        self.hizb_quarters = array("H")
+        self.pages = array("H")
+        self.sajda = array("B")
+        self.sajda_obligation = array("B")
+        self.texts: Dict[QuranFontType, List[str]] = {}
+        self.sura_names: Dict[int, str] = {}
+        self._load()
+
+        self._columns: Dict[NavigationMode, array] = {
+            NavigationMode.PAGE:    self.pages,
+            NavigationMode.SURAH:   self.sura_numbers,
+            NavigationMode.JUZ:     self.juz,
+            NavigationMode.HIZB:    self.hizb,
+            NavigationMode.QUARTER: self.hizb_quarters,
+        }
+        self._unit_bounds: Dict[NavigationMode, Tuple[array, array]] = {
+            mode: self._compute_bounds(column) for mode, column in self._columns.items()
+        }
+        memory = self.memory_usage()
+        logger.info(
+            f"Quran corpus loaded with {len(self)} ayahs, "
+            + ", ".join(f"{name}: {size / 1024:.0f} KB" for name, size in memory.items())
+        )
+
+    @classmethod
+    def load(cls) -> "QuranCorpus":
+        """Return the shared corpus, loading it on first use."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @staticmethod
+    def _query(db_path: Path, *columns) -> list:
+        engine = create_engine(f"sqlite:///{db_path}", echo=False)
+        session = sessionmaker(bind=engine)()
+        try:
+            return session.query(*columns).order_by(Quran.number).all()
+        finally:
+            session.close()
+            engine.dispose()
+
+    def _load(self) -> None:
+        font_types = list(self.databases)
+        rows = self._query(
+            self.databases[font_types[0]],
+            Quran.number,
+            Quran.text,
+            Quran.sura_name,
+            Quran.sura_number,
+            Quran.numberInSurah,
+            Quran.juz,
+            Quran.hizb,
+            Quran.hizbQuarter,
+            Quran.page,
+            Quran.sajda,
+            Quran.sajdaObligation,
+        )
+
+        self.texts[font_types[0]] = [row.text for row in rows]
+        for row in rows:
+            self.numbers.append(row.number)
+            self.sura_numbers.append(row.sura_number)
+            self.numbers_in_surah.append(row.numberInSurah)
+            self.juz.append(row.juz)
+            self.hizb.append(row.hizb)
+            self.hizb_quarters.append(row.hizbQuarter)
+            self.pages.append(row.page)
+            self.sajda.append(bool(row.sajda))
+            self.sajda_obligation.append(bool(row.sajdaObligation))
+            self.sura_names.setdefault(row.sura_number, row.sura_name)
+
+        # The other variants only differ by text, which is aligned on the ayah number.
+        for font_type in font_types[1:]:
+            texts = dict(self._query(self.databases[font_type], Quran.number, Quran.text))
+            missing = [number for number in self.numbers if number not in texts]
+            if missing:
+                raise ValueError(f"{self.databases[font_type]} has no text for ayahs {missing[:10]}.")
+            self.texts[font_type] = [texts[number] for number in self.numbers]
+
+    def memory_usage(self) -> Dict[str, int]:
+        """Return the approximate memory used by each text variant and by the shared metadata, in bytes."""
+        usage = {
+            f"{font_type.name} text": sys.getsizeof(texts) + sum(sys.getsizeof(text) for text in texts)
+            for font_type, texts in self.texts.items()
+        }
+        columns = (self.numbers, self.sura_numbers, self.numbers_in_surah, self.juz, self.hizb, self.hizb_quarters, self.pages, self.sajda, self.sajda_obligation)
+        usage["metadata"] = sum(column.buffer_info()[1] * column.itemsize for column in columns)
+        return usage
+
+    @staticmethod
+    def _compute_bounds(column: array) -> Tuple[array, array]:
+        """
+        Compute the [start, end) index of every value of a sorted column.
+        Index 0 is unused so that unit numbers can be used directly.
+        """
+        size = max(column) + 1
+        starts = array("H", [0] * size)
+        ends = array("H", [0] * size)
+        previous = None
+        for index, value in enumerate(column):
+            if value != previous:
+                starts[value] = index
+                previous = value
+            ends[value] = index + 1
+        return starts, ends
+
+    def __len__(self) -> int:
+        return len(self.numbers)
+
+    def unit_bounds(self, mode: NavigationMode, pos: int) -> Tuple[int, int]:
+        """Return the [start, end) indexes of the given unit, or (0, 0) if it does not exist."""
+        starts, ends = self._unit_bounds[mode]
+        if not 0 < pos < len(starts):
+            return 0, 0
+        return starts[pos], ends[pos]
+
+    def unit_count(self, mode: NavigationMode) -> int:
+        """Return the number of units (pages, surahs, etc.) of the given mode."""
+        return len(self._unit_bounds[mode][0]) - 1
+
+    def unit_of(self, mode: NavigationMode, ayah_number: int) -> int:
+        """Return the number of the unit (page, surah, etc.) that contains the given ayah, or 0."""
+        index = ayah_number - 1
+        if not 0 <= index < len(self):
+            return 0
+        return self._columns[mode][index]
+
+    def surah_ayah_count(self, sura_number: int) -> int:
+        """Return the number of ayahs of a surah, or 0 if it does not exist."""
+        start, end = self.unit_bounds(NavigationMode.SURAH, sura_number)
+        return end - start
+
+    def ayah_number(self, sura_number: int, number_in_surah: int) -> int:
+        """
+        Return the global number of an ayah given its surah and its number in the surah,
+        or 0 if it does not exist. Resolved from the surah start offsets, without any lookup.
+        """
+        start, end = self.unit_bounds(NavigationMode.SURAH, sura_number)
+        if not 0 < number_in_surah <= end - start:
+            return 0
+        return self.numbers[start + number_in_surah - 1]
+
+    def surah_ayah(self, ayah_number: int) -> Tuple[int, int]:
+        """Return the (surah number, number in surah) of a global ayah number, or (0, 0) if it does not exist."""
+        index = ayah_number - 1
+        if not 0 <= index < len(self):
+            return 0, 0
+        return self.sura_numbers[index], self.numbers_in_surah[index]
+
+    def get_ayahs(self, mode: NavigationMode, pos: int, font_type: QuranFontType = QuranFontType.DEFAULT) -> List[Ayah]:
+        """Return the ayahs of a page/surah/juz/hizb/quarter."""
+        return self.get_slice(*self.unit_bounds(mode, pos), font_type)
+
+    def get_range(self, start_number: int, end_number: int, font_type: QuranFontType = QuranFontType.DEFAULT) -> List[Ayah]:
+        """Return the ayahs between two global ayah numbers, both included."""
+        return self.get_slice(max(0, start_number - 1), min(len(self), end_number), font_type)
+
+    def get_slice(self, start: int, end: int, font_type: QuranFontType = QuranFontType.DEFAULT) -> List[Ayah]:
+        """Build fresh Ayah objects for the [start, end) indexes."""
+        texts = self.texts[font_type]
+        return [self._to_ayah(index, texts) for index in range(start, end)]
+
+    def _to_ayah(self, index: int, texts: List[str]) -> Ayah:
+        sura_number = self.sura_numbers[index]
+        return Ayah(
+            number=self.numbers[index],
+            text=texts[index],
+            sura_name=self.sura_names[sura_number],
+            sura_number=sura_number,
+            number_in_surah=self.numbers_in_surah[index],
+            juz=self.juz[index],
+            hizb=self.hizb[index],
+            hizbQuarter=self.hizb_quarters[index],
+            page=self.pages[index],
+            sajda=bool(self.sajda[index]),
+            sajdaObligation=bool(self.sajda_obligation[index]),
+        )
+
+    def __repr__(self) -> str:
+        return f"QuranCorpus(fonts={[font_type.name for font_type in self.texts]}, ayahs={len(self)})"
@@ -1,6 +1,5 @@
 # -*- coding: utf-8 -*-
 
-import re
 from typing import List
 from pydantic import BaseModel
 from .types import MarksType, Ayah
@@ -9,6 +8,39 @@ from utils.logger import LoggerManager
 
 logger = LoggerManager.get_logger(__name__)
 
+ARABIC_DIGITS = str.maketrans("0123456789", "٠١٢٣٤٥٦٧٨٩")
+
+# Arabic-Indic numerals of every surah number and ayah number in surah (the longest surah has 286 ayahs).
+ARABIC_NUMBERS = tuple(str(number).translate(ARABIC_DIGITS) for number in range(287))
+
+# (mark, replacement) pairs of each MarksType. Chained str.replace on the marks actually
+# present is several times faster than str.translate with multi-character replacements.
+MARKS_REPLACEMENTS = {
+    MarksType.TEXT: tuple({
+        "۩": "(سجدة)",
+        "ۚ": "(ج)",
+        "ۗ": "(قلى)",
+        "ۖ": "(صلى)",
+        "ۘ": "(م)",
+        "ۙ": "(لا)",
+        "ۛ": "--",
+        "ۜ": "س"
+    }.items()),
+    MarksType.ACCESSIBLE: tuple({
+        "۩": "(سجدة)",
+        "ۚ": "(،)",
+        "ۗ": "(.ء)",
+        "ۖ": "(؛)",
+        "ۘ": "(.)",
+        "ۙ": "(لا)",
+        "ۛ": "--",
+        "ۜ": "س"
+    }.items()),
+}
+
+BASMALA = "بِسْمِ اللَّهِ الرَّحْمَٰنِ الرَّحِيمِ "
+
+
 class FormatterOptions(BaseModel):
     """
     Formatter options for the Quran text.
@@ -42,33 +74,9 @@ class QuranFormatter:
         returns:
             str: The text with replaced marks.
         """
-        
-        if self.formatter_options.marks_type == MarksType.TEXT:
-            marks = {
-                "۩": "(سجدة)",
-                "ۚ": "(ج)",
-                "ۗ": "(قلى)",
-                "ۖ": "(صلى)",
-                "ۘ": "(م)",
-                "ۙ": "(لا)",
-                "ۛ": "--",
-                "ۜ": "س"
-            }
-        elif self.formatter_options.marks_type == MarksType.ACCESSIBLE:
-            marks = {
-                "۩": "(سجدة)",
-                "ۚ": "(،)",
-                "ۗ": "(.ء)",
-                "ۖ": "(؛)",
-                "ۘ": "(.)",
-                "ۙ": "(لا)",
-                "ۛ": "--",
-                "ۜ": "س"
-            }
-
-        for mark, replacement in marks.items():
-            text = text.replace(mark, replacement)
-    
+        for mark, replacement in MARKS_REPLACEMENTS.get(self.formatter_options.marks_type, ()):
+            if mark in text:
+                text = text.replace(mark, replacement)
         return text
     
     @staticmethod
@@ -82,49 +90,51 @@ class QuranFormatter:
         Returns:
             str: A string with Arabic digits (e.g., "١٢٣").
         """
-        english_to_arabic = str.maketrans("0123456789", "٠١٢٣٤٥٦٧٨٩")
-        return str(english_number).translate(english_to_arabic)
+        if isinstance(english_number, int) and 0 <= english_number < len(ARABIC_NUMBERS):
+            return ARABIC_NUMBERS[english_number]
+        return str(english_number).translate(ARABIC_DIGITS)
 
     def format_view(self, ayahs: List[Ayah]) -> str:
         """Format the view content with ayat text and positions."""
-        text = ""
+        parts = []
         current_position = 0
-        final_ayahs = []
+        replace_marks = self.formatter_options.marks_type != MarksType.DEFAULT
+        show_ayah_number = self.formatter_options.show_ayah_number
+        to_arabic = self.convert_english_to_arabic_number
+        insert = self.view_content.insert
 
         for i, ayah in enumerate(ayahs):
             ayah_text = ayah.text
-            if self.formatter_options.marks_type != MarksType.DEFAULT:
+            if replace_marks:
                 ayah_text = self.replace_marks(ayah_text)
 
             if ayah.number_in_surah == 1:
-                start_point = f"{ayah.sura_name} ({self.convert_english_to_arabic_number(ayah.sura_number)})\n|\n"
-                ayah_text = start_point + ayah_text
                 if ayah.sura_number != 1:
-                    ayah_text = ayah_text.replace(
-                        "بِسْمِ اللَّهِ الرَّحْمَٰنِ الرَّحِيمِ ", 
-                        "بِسْمِ اللَّهِ الرَّحْمَٰنِ الرَّحِيمِ\n"
-                    )
+                    ayah_text = ayah_text.replace(BASMALA, BASMALA.rstrip() + "\n")
+                ayah_text = f"{ayah.sura_name} ({to_arabic(ayah.sura_number)})\n|\n{ayah_text}"
 
-            if self.formatter_options.show_ayah_number:
-                ayah_text += f" ({self.convert_english_to_arabic_number(ayah.number_in_surah)})"
+            if show_ayah_number:
+                ayah_text = f"{ayah_text} ({to_arabic(ayah.number_in_surah)})\n"
+            else:
+                ayah_text = f"{ayah_text}\n"
 
-            ayah_text = f"{ayah_text}\n"
-            ayah_text = f"|\n{ayah_text}" if i == 0 and self.view_content.number != 1 else ayah_text                
-            text += ayah_text
+            if i == 0 and self.view_content.number != 1:
+                ayah_text = f"|\n{ayah_text}"
+            parts.append(ayah_text)
 
-            # Calculate the positions
+            # Calculate the positions and index the ayah right away
             ayah.first_position = current_position
             current_position += len(ayah_text)
             ayah.last_position = current_position - 1
-            final_ayahs.append(ayah)
+            insert(ayah)
 
+        text = "".join(parts)
         if self.formatter_options.auto_page_turn:
             text += "|"
         else:
             text = text.strip()
 
         self.view_content.text = text
-        self.view_content.insert_bulk(final_ayahs)
         
         return text
 
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, Future
+from threading import Lock
+from typing import Callable, Dict, Hashable, Iterable, Optional, Tuple
+from .view_content import ViewContent
+from utils.logger import LoggerManager
+
+logger = LoggerManager.get_logger(__name__)
+
+
+class ViewPrefetcher:
+    """
+    Renders views speculatively on a single worker thread.
+
+    Finished views are kept in a small buffer until they are taken. Every call to
+    schedule() starts a new generation: pending renders of older generations are
+    cancelled, and a render that was already running is discarded when it finishes.
+    """
+
+    def __init__(self, maxsize: int = 4):
+        self.maxsize = maxsize
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ViewPrefetcher")
+        self._buffer: "OrderedDict[Hashable, ViewContent]" = OrderedDict()
+        self._futures: Dict[Hashable, Future] = {}
+        self._lock = Lock()
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    def schedule(self, tasks: Iterable[Tuple[Hashable, Callable[[], ViewContent]]]) -> None:
+        """Cancel pending renders and queue the given (key, render) tasks in order."""
+        self.cancel()
+        with self._lock:
+            generation = self._generation
+            for key, render in tasks:
+                if key not in self._buffer:
+                    self._futures[key] = self._executor.submit(self._run, generation, key, render)
+
+    def _run(self, generation: int, key: Hashable, render: Callable[[], ViewContent]) -> None:
+        if generation != self._generation:
+            return
+        try:
+            view = render()
+        except Exception as e:
+            logger.error(f"Prefetch of {key} failed: {e}", exc_info=True)
+            return
+
+        with self._lock:
+            if generation != self._generation:
+                logger.debug(f"Discarded stale prefetch of {key}.")
+                return
+            self._buffer[key] = view
+            self._buffer.move_to_end(key)
+            while len(self._buffer) > self.maxsize:
+                self._buffer.popitem(last=False)
+        logger.debug(f"Prefetched {key}.")
+
+    def take(self, key: Hashable) -> Optional[ViewContent]:
+        """
+        Remove and return the prefetched view for the key, or None on a miss.
+        If the view is being rendered right now, wait for it instead of rendering it twice.
+        """
+        future = self._futures.get(key)
+        if future is not None and future.running():
+            future.result()
+
+        with self._lock:
+            view = self._buffer.pop(key, None)
+            if view is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return view
+
+    def cancel(self) -> None:
+        """Cancel pending renders. Views already in the buffer are kept."""
+        with self._lock:
+            self._generation += 1
+            for future in self._futures.values():
+                future.cancel()
+            self._futures.clear()
+
+    def clear(self) -> None:
+        """Cancel pending renders and drop all buffered views. Counters are kept."""
+        self.cancel()
+        with self._lock:
+            self._buffer.clear()
+
+    def shutdown(self) -> None:
+        """Cancel pending renders and stop the worker thread."""
+        self.clear()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    def __repr__(self) -> str:
+        return f"ViewPrefetcher(size={len(self)}, maxsize={self.maxsize}, hits={self.hits}, misses={self.misses})"
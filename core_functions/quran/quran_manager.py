@@ -1,13 +1,13 @@
 # -*- coding: utf-8 -*-
 
-from typing import List, Optional
-from pathlib import Path
-from functools import lru_cache
-from sqlalchemy import create_engine, func, Column
-from sqlalchemy.orm import sessionmaker, Session
-from .models import Quran, QuranBase
+from typing import List, Optional, Hashable, Tuple
+from functools import lru_cache, partial
 from .types import QuranFontType, NavigationMode, Surah, Ayah
+from .corpus import QuranCorpus
 from .view_content import ViewContent
+from .view_cache import ViewCache
+from .prefetch import ViewPrefetcher
+from .rendered_views import RenderedViews
 from .formatter import FormatterOptions, QuranFormatter
 
 
@@ -25,25 +25,22 @@ class QuranManager:
         navigation_mode: NavigationMode = NavigationMode.PAGE
     ):
         """
-        Initialize with a font type (determines DB path)
+        Initialize with a font type (determines the text variant)
         and an initial navigation mode.
         """
         self._font_type = font_type
-        self.db_path: Path = font_type.database
-        self._create_engine_and_session()
+        self.corpus = QuranCorpus.load()
 
         self._navigation_mode: Optional[NavigationMode] = None
         self.current_position: int = 1
         self.max_position: int = 1
         self.navigation_mode = navigation_mode
         self.view_content: Optional[ViewContent] = None
-
-    def _create_engine_and_session(self):
-        """(Recreate SQLAlchemy engine and session for the current DB path."""
-        self.engine = create_engine(f"sqlite:///{self.db_path}", echo=False)
-        QuranBase.metadata.create_all(self.engine)
-        self.Session = sessionmaker(bind=self.engine)
-        self.session: Session = self.Session()
+        self.view_cache = ViewCache()
+        self.prefetcher = ViewPrefetcher()
+        self.prefetch_enabled = True
+        self.rendered_views = RenderedViews.load()
+        self._options_key: Optional[Tuple] = None
 
     @property
     def font_type(self) -> QuranFontType:
@@ -52,13 +49,14 @@ class QuranManager:
     @font_type.setter
     def font_type(self, value: QuranFontType):
         """
-        Change font type (and underlying DB) at runtime.
-        Recreates engine and session automatically.
+        Change font type at runtime.
+        Both text variants are already in the corpus, so this only picks the text column
+        rendered from now on. The current position is kept, and cached views stay valid
+        since they are keyed by font type.
         """
         if value != self._font_type:
             self._font_type = value
-            self.db_path    = value.database
-            self._create_engine_and_session()
+            self.prefetcher.cancel()
 
     @property
     def navigation_mode(self) -> NavigationMode:
@@ -90,68 +88,118 @@ class QuranManager:
         """
         Return a list of Surah objects.
         """
-        rows = (
-            self.session.query(
-                Quran.sura_number,
-                func.replace(Quran.sura_name, "سورة ", "").label("sura_name"),
-                func.count(Quran.number).label("ayah_count"),
-                func.min(Quran.number).label("first_ayah_number"),
-                func.max(Quran.number).label("last_ayah_number")
-            )
-            .group_by(Quran.sura_number)
-            .order_by(Quran.sura_number)
-            .all()
-        )
-        return [Surah(number=row.sura_number, name=row.sura_name, ayah_count=row.ayah_count, first_ayah_number=row.first_ayah_number, last_ayah_number=row.last_ayah_number) for row in rows]
-
-    def get_ayahs(self, col: Column, pos: int) -> List[Ayah]:
+        surahs = []
+        for sura_number, name in self.corpus.sura_names.items():
+            start, end = self.corpus.unit_bounds(NavigationMode.SURAH, sura_number)
+            surahs.append(Surah(
+                number=sura_number,
+                name=name.replace("سورة ", ""),
+                ayah_count=end - start,
+                first_ayah_number=self.corpus.numbers[start],
+                last_ayah_number=self.corpus.numbers[end - 1],
+            ))
+        return surahs
+
+    def get_ayahs(self, mode: NavigationMode, pos: int) -> List[Ayah]:
         """
-        Fetch Ayahs by a given column and value.
+        Fetch Ayahs of the unit at the given position from the in-memory corpus.
         Helper for page/surah/juz/hizb/quarter getters.
         """
-        rows = (
-            self.session.query(Quran)
-            .filter(col == pos)
-            .order_by(Quran.number)
-            .all()
-        )
         self.current_position = pos
-        return [self._row_to_ayah(r) for r in rows]
+        return self.corpus.get_ayahs(mode, pos, self._font_type)
 
     def get_view_content(self, number: int, mode: NavigationMode, label: str, ayahs: List[Ayah]) -> str:
-        self.view_content = ViewContent(number=number, label=label, mode=mode)
-        formatter = QuranFormatter(self.view_content, self.formatter_options)
-        return formatter.format_view(ayahs)
+        self.view_content = self._render_view(number, mode, label, ayahs, self.formatter_options)
+        return self.view_content.text
+
+    def _create_view(self, font_type: QuranFontType, mode: NavigationMode, pos: int, label: str, ayahs: List[Ayah], formatter_options: FormatterOptions) -> ViewContent:
+        """
+        Serve the view of a unit from the prebuilt artifact when it is available and up to date,
+        otherwise render it. Does not touch the manager state.
+        """
+        if self.rendered_views is not None:
+            view_content = self.rendered_views.get_view(font_type, mode, pos, label, ayahs, formatter_options)
+            if view_content is not None:
+                return view_content
+        return self._render_view(pos, mode, label, ayahs, formatter_options)
+
+    @staticmethod
+    def _render_view(number: int, mode: NavigationMode, label: str, ayahs: List[Ayah], formatter_options: FormatterOptions) -> ViewContent:
+        """Format the Ayahs into a new ViewContent without touching the manager state."""
+        view_content = ViewContent(number=number, label=label, mode=mode)
+        QuranFormatter(view_content, formatter_options).format_view(ayahs)
+        return view_content
+
+    def _prefetch_neighbours(self, mode: NavigationMode, pos: int, label: str) -> None:
+        """
+        Render the next and previous units on the prefetch worker,
+        skipping those already in the view cache.
+        """
+        if not self.prefetch_enabled:
+            return
+        options = self.formatter_options.model_copy()
+        tasks = []
+        for neighbour in (pos + 1, pos - 1):
+            if not 1 <= neighbour <= self.max_position:
+                continue
+            key = self._get_view_key(mode, neighbour)
+            if key not in self.view_cache:
+                ayahs = self.corpus.get_ayahs(mode, neighbour, self._font_type)
+                tasks.append((key, partial(self._create_view, self._font_type, mode, neighbour, label, ayahs, options)))
+        self.prefetcher.schedule(tasks)
+
+    def _get_view_key(self, mode: NavigationMode, position: Hashable) -> Tuple:
+        """
+        Build the view cache key of a unit.
+        The cache is invalidated first if the formatter options changed since the last call.
+        """
+        options = tuple(self.formatter_options.model_dump().values())
+        if options != self._options_key:
+            self._options_key = options
+            self.view_cache.clear()
+            self.prefetcher.clear()
+        return (self._font_type, mode, position, options)
+
+    def get_unit(self, mode: NavigationMode, pos: int, label: str) -> str:
+        """
+        Return the rendered view of a page/surah/juz/hizb/quarter,
+        served from the view cache or the prefetch buffer when available.
+        The neighbouring units are then prefetched in the background.
+        """
+        self.navigation_mode = mode
+        key = self._get_view_key(mode, pos)
+        view_content = self.view_cache.get(key)
+        if view_content is None:
+            view_content = self.prefetcher.take(key)
+            if view_content is None:
+                ayahs = self.get_ayahs(mode, pos)
+                view_content = self._create_view(self._font_type, mode, pos, label, ayahs, self.formatter_options)
+            self.view_cache.put(key, view_content)
+
+        self.current_position = pos
+        self.view_content = view_content
+        self._prefetch_neighbours(mode, pos, label)
+        return view_content.text
 
     def get_page(self, page_number: int) -> str:
         """Fetch all Ayahs on a given page."""
-        self.navigation_mode = NavigationMode.PAGE
-        ayahs = self.get_ayahs(Quran.page, page_number)
-        return self.get_view_content(number=page_number, label="صفحة", mode=NavigationMode.PAGE, ayahs=ayahs)
+        return self.get_unit(NavigationMode.PAGE, page_number, label="صفحة")
 
     def get_surah(self, surah_number: int) -> str:
         """Fetch all Ayahs in a given surah."""
-        self.navigation_mode = NavigationMode.SURAH
-        ayahs = self.get_ayahs(Quran.sura_number, surah_number)
-        return self.get_view_content(number=surah_number, label="سورة", mode=NavigationMode.SURAH, ayahs=ayahs)
+        return self.get_unit(NavigationMode.SURAH, surah_number, label="سورة")
 
     def get_juz(self, juz_number: int) -> str:
         """Fetch all Ayahs in a given juz."""
-        self.navigation_mode = NavigationMode.JUZ
-        ayahs = self.get_ayahs(Quran.juz, juz_number)   
-        return self.get_view_content(number=juz_number, label="جزء", mode=NavigationMode.JUZ, ayahs=ayahs)
+        return self.get_unit(NavigationMode.JUZ, juz_number, label="جزء")
 
     def get_hizb(self, hizb_number: int) -> str:
         """Fetch all Ayahs in a given hizb."""
-        self.navigation_mode = NavigationMode.HIZB
-        ayahs = self.get_ayahs(Quran.hizb, hizb_number)
-        return self.get_view_content(number=hizb_number, label="حزب", mode=NavigationMode.HIZB, ayahs=ayahs)
+        return self.get_unit(NavigationMode.HIZB, hizb_number, label="حزب")
 
     def get_quarter(self, quarter_number: int) -> str:
         """Fetch all Ayahs in a given hizbQuarter."""
-        self.navigation_mode = NavigationMode.QUARTER
-        ayahs = self.get_ayahs(Quran.hizbQuarter, quarter_number)
-        return self.get_view_content(number=quarter_number, label="ربع", mode=NavigationMode.QUARTER, ayahs=ayahs)
+        return self.get_unit(NavigationMode.QUARTER, quarter_number, label="ربع")
 
     def get_current_content(self) -> str:
         """Fetch Ayahs for the current position and mode."""
@@ -206,92 +254,63 @@ class QuranManager:
         If one end is omitted, it defaults to start=1 or end=last Ayah.
         """
         self.navigation_mode = NavigationMode.CUSTOM_RANGE
+        self.prefetcher.cancel()
         # Determine global numbering for start
         start_num = None
         if from_surah is not None:
-            sura_ayahs = (
-                self.session.query(Quran)
-                .filter(Quran.sura_number == from_surah)
-                .order_by(Quran.number)
-                .all()
-            )
-            if sura_ayahs:
-                idx = max(1, min(len(sura_ayahs), from_ayah or 1)) - 1
-                start_num = sura_ayahs[idx].number
+            ayah_count = self.corpus.surah_ayah_count(from_surah)
+            if ayah_count:
+                start_num = self.corpus.ayah_number(from_surah, max(1, min(ayah_count, from_ayah or 1)))
 
         # Determine global numbering for end
         end_num = None
         if to_surah is not None:
-            sura_ayahs = (
-                self.session.query(Quran)
-                .filter(Quran.sura_number == to_surah)
-                .order_by(Quran.number)
-                .all()
-            )
-            if sura_ayahs:
-                idx = max(1, min(len(sura_ayahs), to_ayah or len(sura_ayahs))) - 1
-                end_num = sura_ayahs[idx].number
-
-        # Build final query
-        query = self.session.query(Quran).order_by(Quran.number)
+            ayah_count = self.corpus.surah_ayah_count(to_surah)
+            if ayah_count:
+                end_num = self.corpus.ayah_number(to_surah, max(1, min(ayah_count, to_ayah or ayah_count)))
+
+        # Slice the final range
         if start_num is not None and end_num is not None:
             if start_num > end_num:
                 start_num, end_num = end_num, start_num
-            query = query.filter(Quran.number.between(start_num, end_num))
         elif start_num is not None:
-            query = query.filter(Quran.number >= start_num)
+            end_num = len(self.corpus)
         else:
-            query = query.filter(Quran.number > 1)
+            start_num, end_num = 2, len(self.corpus)
 
-        ayahs = [self._row_to_ayah(r) for r in query.all()]
-        view_content = self.get_view_content(number=None, label="نطاق", mode=self.navigation_mode, ayahs=ayahs)
+        key = self._get_view_key(self.navigation_mode, (start_num, end_num))
+        view_content = self.view_cache.get(key)
+        if view_content is not None:
+            self.view_content = view_content
+            return view_content.text
 
-        return view_content
+        ayahs = self.corpus.get_range(start_num, end_num, self._font_type)
+        self.view_content = self._create_view(self._font_type, self.navigation_mode, None, "نطاق", ayahs, self.formatter_options)
+        self.view_cache.put(key, self.view_content)
+
+        return self.view_content.text
+
+    def get_ayah_number(self, surah_number: int, ayah_number_in_surah: int) -> int:
+        """Return the global ayah number of (surah, ayah in surah), or 0 if it does not exist."""
+        return self.corpus.ayah_number(surah_number, ayah_number_in_surah)
+
+    def get_surah_ayah(self, ayah_number: int) -> Tuple[int, int]:
+        """Return the (surah, ayah in surah) of a global ayah number, or (0, 0) if it does not exist."""
+        return self.corpus.surah_ayah(ayah_number)
 
     def get_by_ayah_number(self, ayah_number: int) -> str:
         """
         Given a global ayah_number, find which unit (page/surah/juz/etc.) it belongs to
         and return all Ayahs in that unit.
         """
-        # Map navigation_mode to the corresponding Quran column
-        mode_to_column = {
-            NavigationMode.PAGE:    Quran.page,
-            NavigationMode.SURAH:   Quran.sura_number,
-            NavigationMode.QUARTER: Quran.hizbQuarter,
-            NavigationMode.HIZB:    Quran.hizb,
-            NavigationMode.JUZ:     Quran.juz,
-        }
-        col = mode_to_column.get(self._navigation_mode)
-
-        if col is None:
+        if self._navigation_mode == NavigationMode.CUSTOM_RANGE:
             return ""
 
         # Determine group value (e.g. page number, surah number) that ayah belongs to
-        group_value = (
-            self.session.query(col)
-            .filter(Quran.number == ayah_number)
-            .distinct()
-            .first()
-        )
-        if group_value is None:
+        group_value = self.corpus.unit_of(self._navigation_mode, ayah_number)
+        if not group_value:
             return ""
 
         # Set and return that unit’s Ayahs
-        self.current_position = group_value[0]
+        self.current_position = group_value
         return self.get_current_content()
-
-    def _row_to_ayah(self, row) -> Ayah:
-        """Convert a SQLAlchemy Quran row to an Ayah dataclass."""
-        return Ayah(
-            number=row.number,
-            text=row.text,
-            sura_name=row.sura_name,
-            sura_number=row.sura_number,
-            number_in_surah=row.numberInSurah,
-            juz=row.juz,
-            hizb=row.hizb,
-            hizbQuarter=row.hizbQuarter,
-            page=row.page,
-            sajda=row.sajda,
-            sajdaObligation=row.sajdaObligation,
-        )
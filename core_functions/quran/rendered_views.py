@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+"""
+Prebuilt artifact of every rendered navigation unit.
+
+The formatted text of an ayah does not depend on the page, surah, juz, hizb or
+quarter it is shown in, except for the "|" line opening every view but the first
+one. So for both Quran fonts and every MarksType, the artifact holds the formatted
+text of all ayahs in order, with the character and byte offset of each ayah.
+It is memory-mapped at runtime, and a unit is served by slicing and decoding the
+text of its ayahs. The auto page turn suffix/strip is applied at serve time.
+
+Layout:
+    MAGIC | header length (uint32) | JSON header | sections
+
+Each section (font, marks type) stores one UTF-8 blob and two uint32 tables with
+the byte and character offset of each ayah (index = ayah number - 1, plus the end).
+
+Build it from the project root with:
+    python -m core_functions.quran.rendered_views
+"""
+
+import json
+import mmap
+import struct
+import sys
+import time
+from array import array
+from pathlib import Path
+from typing import Dict, List, Optional
+from utils.paths import paths
+from utils.func import calculate_sha256
+from utils.logger import LoggerManager
+from .types import QuranFontType, NavigationMode, MarksType, Ayah
+from .corpus import QuranCorpus
+from .view_content import ViewContent
+from .formatter import FormatterOptions, QuranFormatter
+
+logger = LoggerManager.get_logger(__name__)
+
+MAGIC = b"ALBAYAN-VIEWS"
+VERSION = 1
+ARTIFACT_PATH = paths.data_folder / "quran" / "rendered_views.bin"
+VIEW_OPENING = "|\n"
+
+
+def section_name(font_type: QuranFontType, marks_type: MarksType) -> str:
+    return f"{font_type.name}/{marks_type.name}"
+
+
+def build_rendered_views(output_path: Path = ARTIFACT_PATH) -> Path:
+    """Render every navigation unit of every font and marks type and write the artifact."""
+    header = {"version": VERSION, "byteorder": sys.byteorder, "databases": {}, "sections": {}}
+    blobs: List[bytes] = []
+    offset = 0
+
+    corpus = QuranCorpus.load()
+    for font_type in QuranFontType:
+        header["databases"][font_type.name] = calculate_sha256(font_type.database)
+
+        for marks_type in MarksType:
+            # A view numbered 1 has no opening line, and auto_page_turn only appends "|",
+            # so rendering the whole Quran this way gives the plain text of every ayah.
+            view_content = ViewContent(number=1, label="", mode=NavigationMode.CUSTOM_RANGE)
+            options = FormatterOptions(marks_type=marks_type, auto_page_turn=True)
+            ayahs = corpus.get_range(1, len(corpus), font_type)
+            text = QuranFormatter(view_content, options).format_view(ayahs)[:-1]
+
+            char_offsets = array("I", [ayah.first_position for ayah in ayahs] + [len(text)])
+            byte_offsets = array("I", [0])
+            for ayah in ayahs:
+                byte_offsets.append(byte_offsets[-1] + len(text[ayah.first_position:ayah.last_position + 1].encode("utf-8")))
+
+            section = {}
+            for name, data in (("text", text.encode("utf-8")), ("byte_offsets", byte_offsets.tobytes()), ("char_offsets", char_offsets.tobytes())):
+                section[name] = [offset, len(data)]
+                blobs.append(data)
+                offset += len(data)
+            header["sections"][section_name(font_type, marks_type)] = section
+
+    header_bytes = json.dumps(header).encode("utf-8")
+    data_start = len(MAGIC) + 4 + len(header_bytes)
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, "wb") as file:
+        file.write(MAGIC)
+        file.write(struct.pack("<I", len(header_bytes)))
+        file.write(header_bytes)
+        for data in blobs:
+            file.write(data)
+
+    logger.info(f"Rendered views written to {output_path} ({data_start + offset} bytes).")
+    return output_path
+
+
+class RenderedViews:
+    """Read-only, memory-mapped access to the rendered views artifact."""
+    _instances: Dict[Path, Optional["RenderedViews"]] = {}
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._file = open(path, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mmap[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"Not a rendered views artifact: {path}")
+
+        header_size = struct.unpack_from("<I", self._mmap, len(MAGIC))[0]
+        header_start = len(MAGIC) + 4
+        self.header = json.loads(self._mmap[header_start:header_start + header_size].decode("utf-8"))
+        self._data_start = header_start + header_size
+        if self.header.get("version") != VERSION or self.header.get("byteorder") != sys.byteorder:
+            raise ValueError(f"Unsupported rendered views artifact: {path}")
+
+        # Only fonts whose database is unchanged since the build are served.
+        self.valid_fonts = set()
+        for font_type in QuranFontType:
+            if self.header["databases"].get(font_type.name) == calculate_sha256(font_type.database):
+                self.valid_fonts.add(font_type)
+            else:
+                logger.warning(f"Rendered views of {font_type.name} do not match {font_type.database}, they are rendered live.")
+        self._sections: Dict[str, Dict[str, memoryview]] = {}
+
+    @classmethod
+    def load(cls, path: Path = ARTIFACT_PATH) -> Optional["RenderedViews"]:
+        """Return the artifact at the given path, or None if it is missing or invalid."""
+        path = Path(path)
+        if path not in cls._instances:
+            instance = None
+            if path.exists():
+                try:
+                    instance = cls(path)
+                    logger.info(f"Rendered views loaded from {path}, valid fonts: {[font.name for font in instance.valid_fonts]}")
+                except Exception as e:
+                    logger.warning(f"Ignoring rendered views artifact {path}: {e}")
+            else:
+                logger.debug(f"No rendered views artifact at {path}, views are rendered live.")
+            cls._instances[path] = instance
+        return cls._instances[path]
+
+    def _get_section(self, name: str) -> Optional[Dict[str, memoryview]]:
+        section = self._sections.get(name)
+        if section is None:
+            entries = self.header["sections"].get(name)
+            if entries is None:
+                return None
+            view = memoryview(self._mmap)
+            section = {
+                "text": view[self._data_start + entries["text"][0]:self._data_start + sum(entries["text"])],
+                "byte_offsets": view[self._data_start + entries["byte_offsets"][0]:self._data_start + sum(entries["byte_offsets"])].cast("I"),
+                "char_offsets": view[self._data_start + entries["char_offsets"][0]:self._data_start + sum(entries["char_offsets"])].cast("I"),
+            }
+            self._sections[name] = section
+        return section
+
+    def get_view(self, font_type: QuranFontType, mode: NavigationMode, pos: int, label: str, ayahs: List[Ayah], formatter_options: FormatterOptions) -> Optional[ViewContent]:
+        """
+        Build the ViewContent of a unit from the artifact,
+        or return None if the artifact cannot serve it.
+        """
+        if font_type not in self.valid_fonts or not formatter_options.show_ayah_number or not ayahs:
+            return None
+        section = self._get_section(section_name(font_type, formatter_options.marks_type))
+        start, end = ayahs[0].number - 1, ayahs[-1].number
+        if section is None or end > len(section["char_offsets"]) - 1:
+            return None
+
+        byte_offsets = section["byte_offsets"]
+        char_offsets = section["char_offsets"]
+        opening = VIEW_OPENING if pos != 1 else ""
+        text = opening + bytes(section["text"][byte_offsets[start]:byte_offsets[end]]).decode("utf-8")
+        shift = len(opening) - char_offsets[start]
+
+        for index, ayah in enumerate(ayahs, start):
+            ayah.first_position = char_offsets[index] + shift if index != start else 0
+            ayah.last_position = char_offsets[index + 1] + shift - 1
+        view_content = ViewContent(number=pos, label=label, mode=mode)
+        view_content.insert_bulk(ayahs)
+
+        view_content.text = text + "|" if formatter_options.auto_page_turn else text.strip()
+        return view_content
+
+    def __repr__(self) -> str:
+        return f"RenderedViews(path={self.path}, valid_fonts={[font.name for font in self.valid_fonts]})"
+
+
+if __name__ == "__main__":
+    start = time.perf_counter()
+    path = build_rendered_views(Path(sys.argv[1]) if len(sys.argv) > 1 else ARTIFACT_PATH)
+    print(f"Built {path} ({path.stat().st_size / 1024 / 1024:.1f} MB) in {time.perf_counter() - start:.1f} s")
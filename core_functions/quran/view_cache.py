@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Hashable, Optional
+from .view_content import ViewContent
+from utils.logger import LoggerManager
+
+logger = LoggerManager.get_logger(__name__)
+
+
+class ViewCache:
+    """
+    Bounded LRU cache of rendered views.
+
+    Each entry is a ViewContent holding the rendered text and its ayah position map,
+    so revisiting a unit does not fetch or format anything.
+    """
+
+    def __init__(self, maxsize: int = 32):
+        self.maxsize = maxsize
+        self._views: "OrderedDict[Hashable, ViewContent]" = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[ViewContent]:
+        """Return the cached view for the key, or None on a miss."""
+        with self._lock:
+            view = self._views.get(key)
+            if view is None:
+                self.misses += 1
+                return None
+            self._views.move_to_end(key)
+            self.hits += 1
+            return view
+
+    def put(self, key: Hashable, view: ViewContent) -> None:
+        """Store a view, evicting the least recently used entry when full."""
+        with self._lock:
+            self._views[key] = view
+            self._views.move_to_end(key)
+            while len(self._views) > self.maxsize:
+                self._views.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached views. Counters are kept."""
+        with self._lock:
+            self._views.clear()
+        logger.debug("View cache cleared.")
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._views
+
+    def __len__(self) -> int:
+        return len(self._views)
+
+    def __repr__(self) -> str:
+        return f"ViewCache(size={len(self)}, maxsize={self.maxsize}, hits={self.hits}, misses={self.misses})"
@@ -1,25 +1,27 @@
 # -*- coding: utf-8 -*-
 
-from typing import Optional, Dict
-from sqlalchemy import create_engine, func
-from sqlalchemy.orm import sessionmaker, Session
-from .models import AyahMapBase, AyahViewMap
+from bisect import bisect_right
+from itertools import groupby
+from operator import attrgetter
+from typing import Optional, Dict, List, Tuple
 from .types import Ayah, NavigationMode
 from utils.logger import LoggerManager
 
 logger = LoggerManager.get_logger(__name__)
 
 class ViewContent:
-    def __init__(self, number: int, label: str, mode: NavigationMode, db_url: str = "sqlite:///:memory:"):
+    def __init__(self, number: int, label: str, mode: NavigationMode):
         logger.debug(f"Initializing ViewContent with number: {number}, label: {label}, mode: {mode}")
         self.number = number
         self.label = label
         self.mode = mode
         self.text = ""
-        self.engine = create_engine(db_url, echo=False)
-        self.Session = sessionmaker(bind=self.engine)
-        self.session: Session = self.Session()
-        AyahMapBase.metadata.create_all(self.engine)
+        # Ayahs sorted by first_position, with parallel position arrays for bisect lookups.
+        self._ayahs: List[Ayah] = []
+        self._first_positions: List[int] = []
+        self._by_number: Dict[int, Ayah] = {}
+        self._by_number_in_surah: Dict[Tuple[int, int], Ayah] = {}
+        self._ayah_range: Dict[int, Dict[str, int]] = {}
         logger.debug(f"Initialized ViewContent with number: {number}, label: {label}, mode: {mode}")
 
     @property
@@ -32,139 +34,74 @@ class ViewContent:
             return f"آية {start_ayah.number_in_surah} {start_ayah.sura_name} / آية {end_ayah.number_in_surah} {end_ayah.sura_name}"
         else:
             return f"ال{self.label} {self.number}"
-        
+
     @property
     def start_ayah(self) -> Optional[Ayah]:
-        ayah_row = (
-            self.session.query(AyahViewMap)
-            .order_by(AyahViewMap.first_position.asc())
-            .first()
-        )
-        return self._row_to_ayah(ayah_row) if ayah_row else None
+        return self._ayahs[0] if self._ayahs else None
 
     @property
     def end_ayah(self) -> Optional[Ayah]:
-        ayah_row = (
-            self.session.query(AyahViewMap)
-            .order_by(AyahViewMap.first_position.desc())
-            .first()
-        )
-        return self._row_to_ayah(ayah_row) if ayah_row else None
+        return self._ayahs[-1] if self._ayahs else None
 
     def insert(self, ayah: Ayah):
-        ayah_row = AyahViewMap(
-            number=ayah.number,
-            text=ayah.text,
-            sura_name=ayah.sura_name,
-            sura_number=ayah.sura_number,
-            number_in_surah=ayah.number_in_surah,
-            juz=ayah.juz,
-            hizb=ayah.hizb,
-            hizbQuarter=ayah.hizbQuarter,
-            page=ayah.page,
-            first_position=ayah.first_position,
-            last_position=ayah.last_position,
-            sajda=ayah.sajda,
-            sajdaObligation=ayah.sajdaObligation,
-        )
-        self.session.add(ayah_row)
-        self.session.commit()
+        if self._first_positions and ayah.first_position < self._first_positions[-1]:
+            index = bisect_right(self._first_positions, ayah.first_position)
+        else:
+            index = len(self._ayahs)
+        self._ayahs.insert(index, ayah)
+        self._first_positions.insert(index, ayah.first_position)
+        self._by_number.setdefault(ayah.number, ayah)
+        self._by_number_in_surah.setdefault((ayah.sura_number, ayah.number_in_surah), ayah)
+
+        surah_range = self._ayah_range.get(ayah.sura_number)
+        if surah_range is None:
+            self._ayah_range[ayah.sura_number] = {"surah_name": ayah.sura_name, "min_ayah": ayah.number_in_surah, "max_ayah": ayah.number_in_surah}
+            if len(self._ayah_range) > 1 and ayah.sura_number < max(self._ayah_range):
+                self._ayah_range = dict(sorted(self._ayah_range.items()))
+        else:
+            surah_range["min_ayah"] = min(surah_range["min_ayah"], ayah.number_in_surah)
+            surah_range["max_ayah"] = max(surah_range["max_ayah"], ayah.number_in_surah)
 
     def insert_bulk(self, ayahs: list[Ayah]):
-        ayah_rows = [
-            AyahViewMap(
-                number=ayah.number,
-                text=ayah.text,
-                sura_name=ayah.sura_name,
-                sura_number=ayah.sura_number,
-                number_in_surah=ayah.number_in_surah,
-                juz=ayah.juz,
-                hizb=ayah.hizb,
-                hizbQuarter=ayah.hizbQuarter,
-                page=ayah.page,
-                first_position=ayah.first_position,
-                last_position=ayah.last_position,
-                sajda=ayah.sajda,
-                sajdaObligation=ayah.sajdaObligation,
-            )
-            for ayah in ayahs
-        ]
-        self.session.bulk_save_objects(ayah_rows)
-        self.session.commit()
+        first_positions = [ayah.first_position for ayah in ayahs]
+        if not ayahs or first_positions != sorted(first_positions) or (self._first_positions and first_positions[0] < self._first_positions[-1]):
+            for ayah in ayahs:
+                self.insert(ayah)
+            return
+
+        # Fast path for ayahs that come in order after the existing ones.
+        self._ayahs.extend(ayahs)
+        self._first_positions.extend(first_positions)
+        self._by_number = {**{ayah.number: ayah for ayah in reversed(ayahs)}, **self._by_number}
+        self._by_number_in_surah = {**{(ayah.sura_number, ayah.number_in_surah): ayah for ayah in reversed(ayahs)}, **self._by_number_in_surah}
+
+        get_number_in_surah = attrgetter("number_in_surah")
+        for sura_number, group in groupby(ayahs, key=attrgetter("sura_number")):
+            group = list(group)
+            numbers_in_surah = list(map(get_number_in_surah, group))
+            surah_range = self._ayah_range.get(sura_number)
+            if surah_range is None:
+                self._ayah_range[sura_number] = {"surah_name": group[0].sura_name, "min_ayah": min(numbers_in_surah), "max_ayah": max(numbers_in_surah)}
+            else:
+                surah_range["min_ayah"] = min(surah_range["min_ayah"], *numbers_in_surah)
+                surah_range["max_ayah"] = max(surah_range["max_ayah"], *numbers_in_surah)
+        if list(self._ayah_range) != sorted(self._ayah_range):
+            self._ayah_range = dict(sorted(self._ayah_range.items()))
 
     def get_by_position(self, position: int) -> Optional[Ayah]:
-        ayah_row = (
-            self.session.query(AyahViewMap)
-            .filter(AyahViewMap.first_position <= position, AyahViewMap.last_position >= position)
-            .first()
-        )
-        ayah = self._row_to_ayah(ayah_row) if ayah_row else None
-        return ayah or self.get_by_position(position - 1)
+        # The ayah that starts at or before the position, which also covers positions after the last ayah.
+        index = bisect_right(self._first_positions, position) - 1
+        return self._ayahs[index] if index >= 0 else None
 
     def get_by_ayah_number(self, ayah_number: int) -> Optional[Ayah]:
         logger.debug(f"Fetching Ayah by number: {ayah_number}")
-        ayah_row = (
-            self.session.query(AyahViewMap)
-            .filter(
-                AyahViewMap.number== ayah_number
-            )
-            .first()
-        )
-        return self._row_to_ayah(ayah_row) if ayah_row else self.start_ayah
+        return self._by_number.get(ayah_number) or self.start_ayah
 
     def get_by_ayah_number_in_surah(self, ayah_number_in_surah: int, surah_number: int) -> Optional[Ayah]:
-        ayah_row = (
-            self.session.query(AyahViewMap)
-            .filter(
-                AyahViewMap.number_in_surah == ayah_number_in_surah,
-                AyahViewMap.sura_number == surah_number
-            )
-            .first()
-        )
-        return self._row_to_ayah(ayah_row) if ayah_row else None
+        return self._by_number_in_surah.get((surah_number, ayah_number_in_surah))
 
     def get_ayah_range(self) -> Dict[int, Dict[str, int]]:
-        result = {}
-        rows = (
-            self.session.query(
-                AyahViewMap.sura_number,
-                AyahViewMap.sura_name,
-                func.min(AyahViewMap.number_in_surah).label("min_ayah"),
-                func.max(AyahViewMap.number_in_surah).label("max_ayah"),
-            )
-            .group_by(AyahViewMap.sura_number)
-            .order_by(AyahViewMap.sura_number)
-            .all()
-        )
-        for row in rows:
-            result[row.sura_number] = {"surah_name": row.sura_name, "min_ayah": row.min_ayah, "max_ayah": row.max_ayah}
-        return result
-
-    def _row_to_ayah(self, row) -> Ayah:
-        return Ayah(
-            number=row.number,
-            text=row.text,
-            sura_name=row.sura_name,
-            sura_number=row.sura_number,
-            number_in_surah=row.number_in_surah,
-            juz=row.juz,
-            hizb=row.hizb,
-            hizbQuarter=row.hizbQuarter,
-            page=row.page,
-            sajda=row.sajda,
-            sajdaObligation=row.sajdaObligation,
-            last_position=row.last_position,
-            first_position=row.first_position,
-        )
+        return self._ayah_range
 
     def __repr__(self) -> str:
         return f"ViewContent(number={self.number}, label={self.label}, mode={self.mode})"
-    
-    def __del__(self):
-        """Close the session and dispose of the engine when the object is deleted."""
-        if self.session:
-            self.session.close()
-        if self.engine:
-            self.engine.dispose()
-        logger.debug(f"ViewContent {self.label} closed.")
-    
\ No newline at end of file
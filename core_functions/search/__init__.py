@@ -0,0 +1,8 @@
+from .quran_search import SearchCriteria, QuranSearchManager
+from .types import SearchMode
+
+__all__ = [
+    "SearchCriteria",
+    "QuranSearchManager",
+    "SearchMode",
+    ]
@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+
+import heapq
+import time
+from array import array
+from collections import Counter
+from threading import Lock
+from typing import Dict, List, Set, Tuple
+from utils.logger import LoggerManager
+from .normalizer import normalize
+from .word_index import WordIndex, Span, OFFSET_BITS, OFFSET_MASK
+
+logger = LoggerManager.get_logger(__name__)
+
+GRAM_SIZE = 3
+# Words are padded so their first and last letters are covered by as many trigrams as the others.
+WORD_START = "^" * (GRAM_SIZE - 1)
+WORD_END = "$" * (GRAM_SIZE - 1)
+MAX_CANDIDATES = 20
+MAX_VERIFIED = 100
+
+
+def trigrams(word: str) -> Set[str]:
+    padded = WORD_START + word + WORD_END
+    return {padded[i:i + GRAM_SIZE] for i in range(len(padded) - GRAM_SIZE + 1)}
+
+
+def max_distance_for(word: str) -> int:
+    """Return the number of typos tolerated in a word: one up to five letters, two for longer words."""
+    return 1 if len(word) <= 5 else 2
+
+
+def bounded_levenshtein(a: str, b: str, limit: int) -> int:
+    """Return the edit distance between a and b, or limit + 1 as soon as it is known to exceed limit."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    # Words often share their first and last letters (articles, pronouns, plural endings), which cost nothing.
+    start = 0
+    while start < len(a) and start < len(b) and a[start] == b[start]:
+        start += 1
+    end = 0
+    while end < len(a) - start and end < len(b) - start and a[-1 - end] == b[-1 - end]:
+        end += 1
+    a = a[start:len(a) - end]
+    b = b[start:len(b) - end]
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        row_min = i
+        for j, char_b in enumerate(b, 1):
+            distance = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b))
+            current.append(distance)
+            if distance < row_min:
+                row_min = distance
+        if row_min > limit:
+            return limit + 1
+        previous = current
+    return previous[-1] if previous[-1] <= limit else limit + 1
+
+
+class FuzzyWordIndex:
+    """
+    Trigram index of the distinct words of the verses, without tashkil, for typo tolerant search.
+
+    A word within k edits of the searched word shares all but at most 3k of its trigrams,
+    so the words of the trigram postings are counted, filtered by overlap and length, and
+    only those sharing the most trigrams are checked with an edit distance bounded by k.
+    The accepted words are expanded to ayahs through the postings of the WordIndex.
+    Indexes are built on first use from the shared WordIndex and kept per no_hamza.
+    """
+    _instances: Dict[bool, "FuzzyWordIndex"] = {}
+    _lock = Lock()
+
+    def __init__(self, no_hamza: bool = False):
+        start = time.perf_counter()
+        self.no_hamza = no_hamza
+        self.word_index = WordIndex.load(no_tashkil=True, no_hamza=no_hamza)
+        self.words = self.word_index.vocabulary
+        self.grams: Dict[str, array] = {}
+        self.by_length: Dict[int, array] = {}
+        self.lengths = array("B", (len(word) for word in self.words))
+        for word_id, word in enumerate(self.words):
+            for gram in trigrams(word):
+                postings = self.grams.get(gram)
+                if postings is None:
+                    postings = self.grams[gram] = array("I")
+                postings.append(word_id)
+            self.by_length.setdefault(len(word), array("I")).append(word_id)
+        logger.info(f"Trigram index (no_hamza={no_hamza}) built in {(time.perf_counter() - start) * 1000:.0f} ms, {len(self.grams)} trigrams.")
+
+    @classmethod
+    def load(cls, no_hamza: bool = False) -> "FuzzyWordIndex":
+        """Return the shared index of the given normalization, building it on first use."""
+        key = bool(no_hamza)
+        with cls._lock:
+            if key not in cls._instances:
+                cls._instances[key] = cls(key)
+            return cls._instances[key]
+
+    def _candidates(self, grams: Set[str], max_distance: int, length: int) -> List[Tuple[int, int]]:
+        """Return the (shared trigrams, word id) of the words passing the overlap and length filters, most shared first."""
+        # Sorted, so words sharing as many trigrams are verified in the same order in every run.
+        counts = Counter()
+        for gram in sorted(grams):
+            counts.update(self.grams.get(gram, ()))
+        threshold = len(grams) - GRAM_SIZE * max_distance
+        if threshold <= 0:
+            # Too short for the trigram filter, words sharing no trigram may still be close enough.
+            for size in range(max(1, length - max_distance), length + max_distance + 1):
+                for word_id in self.by_length.get(size, ()):
+                    counts.setdefault(word_id, 0)
+        candidates = []
+        for word_id, count in counts.most_common():
+            if count < threshold or len(candidates) == MAX_VERIFIED:
+                break
+            if abs(self.lengths[word_id] - length) <= max_distance:
+                candidates.append((count, word_id))
+        return candidates
+
+    def search(self, word: str, max_distance: int = None, limit: int = MAX_CANDIDATES) -> List[Tuple[str, int]]:
+        """
+        Return up to limit words of the verses within max_distance edits of the normalized word,
+        with their distance, ranked by distance, shared trigrams, then frequency.
+        Only the MAX_VERIFIED words sharing the most trigrams are checked, which bounds the latency.
+        """
+        if max_distance is None:
+            max_distance = max_distance_for(word)
+        ranked = []
+        for overlap, word_id in self._candidates(trigrams(word), max_distance, len(word)):
+            candidate = self.words[word_id]
+            distance = bounded_levenshtein(word, candidate, max_distance)
+            if distance <= max_distance:
+                ranked.append((distance, -overlap, -len(self.word_index.postings[candidate]), candidate))
+        ranked.sort()
+        return [(candidate, distance) for distance, _, _, candidate in ranked[:limit]]
+
+    def find(self, text: str) -> Dict[int, Tuple[int, List[Span]]]:
+        """
+        Find the ayahs containing an approximate match of every word of the text.
+        Return the total edit distance and the (first, last) word offsets of the matches, by ayah number.
+        """
+        result: Dict[int, Tuple[int, List[Span]]] = None
+        for query_word in normalize(text, True, self.no_hamza).split():
+            found: Dict[int, Tuple[int, List[Span]]] = {}
+            for candidate, distance in self.search(query_word):
+                logger.debug(f"Approximate match of {query_word}: {candidate} at distance {distance}.")
+                for posting in self.word_index.postings[candidate]:
+                    number = posting >> OFFSET_BITS
+                    offset = posting & OFFSET_MASK
+                    best, spans = found.get(number, (distance, []))
+                    spans.append((offset, offset))
+                    found[number] = (min(best, distance), spans)
+            if result is None:
+                result = found
+            else:
+                result = {
+                    number: (distance + found[number][0], spans + found[number][1])
+                    for number, (distance, spans) in result.items() if number in found
+                }
+            if not result:
+                return {}
+        return result or {}
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def __repr__(self) -> str:
+        return f"FuzzyWordIndex(no_hamza={self.no_hamza}, words={len(self)}, trigrams={len(self.grams)})"
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import Iterator, Optional
+from PyQt6.QtCore import QObject, pyqtSignal
+from exceptions.database import InvalidSearchQueryError
+from utils.logger import LoggerManager
+from .quran_search import QuranSearchManager
+
+logger = LoggerManager.get_logger(__name__)
+
+PAGE_SIZE = 50
+
+
+class LiveSearch(QObject):
+    """
+    Runs searches on a single worker thread for search as you type.
+
+    Every call to search() starts a new generation: the statement of the previous
+    search is interrupted, and results of older generations are discarded. The first
+    page of results is emitted as soon as it is read, the next ones on fetch_more(),
+    from a cursor kept open on the worker. The worker has its own QuranSearchManager,
+    so the connection never leaves its thread; only interrupt() is called from others.
+    """
+    results_ready = pyqtSignal(int, list, dict, dict, bool)  # generation, rows, matches, groups, has_more
+    page_ready = pyqtSignal(int, list, bool)                 # generation, rows, has_more
+    search_failed = pyqtSignal(int, str)                     # generation, reason
+
+    def __init__(self, page_size: int = PAGE_SIZE):
+        super().__init__()
+        self.page_size = page_size
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="LiveSearch")
+        self._lock = Lock()
+        self._generation = 0
+        self._busy = False
+        self._manager: Optional[QuranSearchManager] = None
+        self._pages: Optional[Iterator[list]] = None
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def search(self, search_text: str, settings: dict, prefix: bool = False) -> int:
+        """Cancel the running search and start searching the text with the set() settings, return its generation."""
+        generation = self.cancel()
+        self._executor.submit(self._run, generation, search_text, settings, prefix)
+        logger.debug(f"Live search {generation} queued: {search_text}")
+        return generation
+
+    def fetch_more(self) -> None:
+        """Read the next page of the current search."""
+        self._executor.submit(self._next_page, self._generation)
+
+    def cancel(self) -> int:
+        """Discard the current search, interrupting its statement if one is running, return the new generation."""
+        with self._lock:
+            self._generation += 1
+            if self._busy and self._manager is not None:
+                self._manager.interrupt()
+            return self._generation
+
+    def shutdown(self) -> None:
+        self.cancel()
+        self._executor.submit(self._close)
+        self._executor.shutdown(wait=False)
+
+    def _start(self, generation: int) -> bool:
+        with self._lock:
+            if generation != self._generation:
+                return False
+            self._busy = True
+            return True
+
+    def _finish(self) -> None:
+        with self._lock:
+            self._busy = False
+
+    def _run(self, generation: int, search_text: str, settings: dict, prefix: bool) -> None:
+        self._close_pages()
+        if not self._start(generation):
+            return
+        try:
+            if self._manager is None:
+                self._manager = QuranSearchManager()
+            self._manager.set(**settings)
+            self._pages = self._manager.search_pages(search_text, self.page_size, prefix)
+            rows = next(self._pages, [])
+        except InvalidSearchQueryError as e:
+            self.search_failed.emit(generation, e.reason)
+            return
+        except Exception as e:
+            self._fail(generation, e)
+            return
+        finally:
+            self._finish()
+
+        if generation == self._generation:
+            logger.debug(f"Live search {generation}: first page of {len(rows)} results.")
+            self.results_ready.emit(generation, rows, dict(self._manager.matches), dict(self._manager.groups), len(rows) == self.page_size)
+
+    def _next_page(self, generation: int) -> None:
+        if self._pages is None or not self._start(generation):
+            return
+        try:
+            rows = next(self._pages, [])
+        except Exception as e:
+            self._fail(generation, e)
+            return
+        finally:
+            self._finish()
+
+        if generation == self._generation:
+            self.page_ready.emit(generation, rows, len(rows) == self.page_size)
+
+    def _fail(self, generation: int, error: Exception) -> None:
+        self._close_pages()
+        if generation != self._generation and isinstance(error, sqlite3.OperationalError):
+            logger.debug(f"Live search {generation} interrupted.")
+            return
+        logger.error(f"Live search {generation} failed: {error}", exc_info=True)
+        self.search_failed.emit(generation, "تعذر إكمال البحث")
+
+    def _close_pages(self) -> None:
+        if self._pages is not None:
+            self._pages.close()
+            self._pages = None
+
+    def _close(self) -> None:
+        # Released on the worker, so the connection is closed on the thread that opened it.
+        self._close_pages()
+        self._manager = None
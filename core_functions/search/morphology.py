@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+"""
+Root and lemma index of the words of Verses.DB.
+
+The index is built offline from a local morphology table and stored next to
+Verses.DB as morphology.DB. The table is a UTF-8, tab separated file with one
+line per word of Verses.DB:
+
+    sura    ayah    word    root    lemma
+
+where word is the 1-based position of the word in the text of the ayah, split on
+spaces, and root and lemma are written in Arabic letters (the root with or
+without separators, e.g. "رحم" or "ر ح م"). Lines starting with "#" and a header
+line are skipped. Words without a root (particles, pronouns) may be left out or
+have an empty root.
+
+Build it from the project root with:
+    python -m core_functions.search.morphology <morphology table> [output]
+"""
+
+import sqlite3
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+from threading import Lock
+from typing import Dict, List, Optional, Tuple
+from utils.logger import LoggerManager
+from utils.func import calculate_sha256
+from .normalizer import TASHKIL, strip_tashkil
+from .normalized_verses import VERSES_DB_PATH
+
+logger = LoggerManager.get_logger(__name__)
+
+MORPHOLOGY_DB_PATH = VERSES_DB_PATH.with_name("morphology.DB")
+ROOT_SEPARATORS = (" ", "-", "ـ", "،", ",")
+ROOT_HAMZAT = ("أ", "إ", "آ", "ؤ", "ئ")
+
+
+def normalize_root(root: str) -> str:
+    """Return the root as bare letters: no tashkil, no separators and every hamza written as "ء"."""
+    for char in ROOT_SEPARATORS + TASHKIL:
+        root = root.replace(char, "")
+    for char in ROOT_HAMZAT:
+        root = root.replace(char, "ء")
+    return root
+
+
+def read_morphology_table(table_path: Path) -> List[Tuple[int, int, int, str, str]]:
+    rows = []
+    with open(table_path, encoding="utf-8") as file:
+        for line_number, line in enumerate(file, 1):
+            fields = line.rstrip("\r\n").split("\t")
+            if not line.strip() or line.startswith("#") or not fields[0].strip().isdigit():
+                continue
+            if len(fields) < 4:
+                raise ValueError(f"{table_path}:{line_number}: expected sura, ayah, word, root and lemma.")
+            sura, ayah, word = (int(field) for field in fields[:3])
+            rows.append((sura, ayah, word, fields[3].strip(), fields[4].strip() if len(fields) > 4 else ""))
+    return rows
+
+
+def build_morphology_index(table_path: Path, output_path: Path = MORPHOLOGY_DB_PATH, source: Path = VERSES_DB_PATH) -> Path:
+    """Resolve every row of the morphology table to a word of Verses.DB and write the index."""
+    source_conn = sqlite3.connect(source)
+    ayahs = {
+        (sura, ayah): (number, text.split())
+        for number, sura, ayah, text in source_conn.execute("SELECT number, sura_number, numberInSurah, text FROM quran;")
+    }
+    source_conn.close()
+
+    words = []
+    skipped = 0
+    for sura, ayah, word, root, lemma in read_morphology_table(table_path):
+        number, ayah_words = ayahs.get((sura, ayah), (None, []))
+        if not 1 <= word <= len(ayah_words):
+            skipped += 1
+            continue
+        words.append((number, word - 1, ayah_words[word - 1], normalize_root(root) or None, strip_tashkil(lemma) or None))
+    if skipped:
+        logger.warning(f"{skipped} rows of {table_path} do not match a word of {source} and were skipped.")
+
+    output_path = Path(output_path)
+    temp_path = output_path.with_name(output_path.name + ".tmp")
+    temp_path.unlink(missing_ok=True)
+    conn = sqlite3.connect(temp_path)
+    try:
+        conn.execute("CREATE TABLE words (number INTEGER, word INTEGER, form TEXT, root TEXT, lemma TEXT, PRIMARY KEY (number, word));")
+        conn.executemany("INSERT OR REPLACE INTO words VALUES (?, ?, ?, ?, ?);", words)
+        conn.execute("CREATE INDEX words_root ON words (root);")
+        conn.execute("CREATE INDEX words_lemma ON words (lemma);")
+        conn.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);")
+        conn.executemany("INSERT INTO meta VALUES (?, ?);", (("source_sha256", calculate_sha256(source)), ("table", Path(table_path).name)))
+        conn.commit()
+    finally:
+        conn.close()
+    temp_path.replace(output_path)
+    logger.info(f"Morphology index written to {output_path} with {len(words)} words.")
+    return output_path
+
+
+class MorphologyIndex:
+    """
+    Read-only access to morphology.DB.
+
+    load() returns None when the index has not been built, so the root search is
+    only offered when the data is available.
+    """
+    _instances: Dict[Path, Optional["MorphologyIndex"]] = {}
+    _lock = Lock()
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        meta = dict(self._conn.execute("SELECT key, value FROM meta;").fetchall())
+        if meta.get("source_sha256") != calculate_sha256(VERSES_DB_PATH):
+            logger.warning(f"{path} was built from another Verses.DB, root search results may point to the wrong words.")
+
+    @classmethod
+    def load(cls, path: Path = MORPHOLOGY_DB_PATH) -> Optional["MorphologyIndex"]:
+        """Return the index at the given path, or None if it is missing or invalid."""
+        path = Path(path)
+        with cls._lock:
+            if path not in cls._instances:
+                instance = None
+                if path.is_file():
+                    try:
+                        instance = cls(path)
+                        logger.info(f"Morphology index loaded from {path}.")
+                    except sqlite3.Error as e:
+                        logger.warning(f"Ignoring morphology index {path}: {e}")
+                else:
+                    logger.debug(f"No morphology index at {path}, root search is unavailable.")
+                cls._instances[path] = instance
+            return cls._instances[path]
+
+    def find_root(self, root: str) -> List[Tuple[int, int, str]]:
+        """Return the (ayah number, word offset, form) of every word derived from the root."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT number, word, form FROM words WHERE root = ? ORDER BY number, word;", (normalize_root(root),)
+            ).fetchall()
+
+    @staticmethod
+    def group_by_form(words: List[Tuple[int, int, str]]) -> Dict[str, List[int]]:
+        """
+        Group the words by derived form, written without tashkil, from the most to the
+        least frequent. Each form maps to the ayah number of each of its occurrences.
+        """
+        groups: Dict[str, List[int]] = {}
+        for number, _, form in words:
+            groups.setdefault(strip_tashkil(form), []).append(number)
+        counts = Counter({form: len(numbers) for form, numbers in groups.items()})
+        return {form: groups[form] for form, _ in counts.most_common()}
+
+    def __repr__(self) -> str:
+        return f"MorphologyIndex(path={self.path})"
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+    start = time.perf_counter()
+    path = build_morphology_index(Path(sys.argv[1]), Path(sys.argv[2]) if len(sys.argv) > 2 else MORPHOLOGY_DB_PATH)
+    print(f"Built {path} in {time.perf_counter() - start:.1f} s")
@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+
+import time
+from array import array
+from bisect import bisect_left
+from threading import Lock
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+from core_functions.quran.corpus import QuranCorpus
+from utils.logger import LoggerManager
+from .normalizer import normalize
+
+logger = LoggerManager.get_logger(__name__)
+
+# Letters commonly typed one for another in names, folded after the tashkil and the hamzat.
+NAME_FOLDS = str.maketrans({"ة": "ه", "ى": "ي"})
+
+# Ranks of a match, best first.
+EXACT = 0
+WHOLE_WORD = 1
+NAME_PREFIX = 2
+WORD_PREFIX = 3
+INFIX = 4
+
+
+def normalize_name(name: str) -> str:
+    """Return the name without tashkil, with folded hamzat, ta marbuta and alef maqsura, lower case and single spaced."""
+    return " ".join(normalize(name, True, True).translate(NAME_FOLDS).lower().split())
+
+
+class NameIndex:
+    """
+    Prefix and infix index of a list of names, such as the surahs or the reciters.
+
+    The names are normalized by normalize_name, and every position of every name is
+    kept in a suffix array: the (name, position) pairs sorted by the text that follows.
+    The names containing a query are found with one binary search, then ranked by
+    where the query falls in the name (the whole name, a whole word, the start of the
+    name, the start of a word, anywhere), and by their order in the list.
+    The shared indexes are built once per process by surahs() and reciters().
+    """
+    _instances: Dict[Hashable, "NameIndex"] = {}
+    _lock = Lock()
+
+    def __init__(self, names: Iterable[Tuple[int, str]]):
+        start = time.perf_counter()
+        self.ids: List[int] = []
+        self.labels: List[str] = []
+        self.names: List[str] = []
+        for item_id, label in names:
+            self.ids.append(item_id)
+            self.labels.append(label)
+            self.names.append(normalize_name(label))
+        self._labels_by_id = dict(zip(self.ids, self.labels))
+        suffixes = sorted(
+            ((entry, position) for entry, name in enumerate(self.names) for position in range(len(name))),
+            key=lambda suffix: self.names[suffix[0]][suffix[1]:],
+        )
+        self.entries = array("I", (entry for entry, _ in suffixes))
+        self.positions = array("H", (position for _, position in suffixes))
+        logger.debug(f"Name index of {len(self.names)} names built in {(time.perf_counter() - start) * 1000:.1f} ms, {len(suffixes)} suffixes.")
+
+    @classmethod
+    def shared(cls, key: Hashable, names: Iterable[Tuple[int, str]]) -> "NameIndex":
+        """Return the index shared under the key, building it from the names on first use."""
+        with cls._lock:
+            if key not in cls._instances:
+                cls._instances[key] = cls(names)
+            return cls._instances[key]
+
+    @classmethod
+    def surahs(cls) -> "NameIndex":
+        """Return the shared index of the surah names, by surah number."""
+        # The names QuranManager.get_surahs() lists, without building every Surah.
+        names = ((number, name.replace("سورة ", "")) for number, name in QuranCorpus.load().sura_names.items())
+        return cls.shared("surahs", names)
+
+    @classmethod
+    def reciters(cls, reciters_manager) -> "NameIndex":
+        """Return the shared index of the display texts of the reciters of the manager, by reciter id."""
+        key = ("reciters", str(reciters_manager.db_path), reciters_manager.table_name)
+        with cls._lock:
+            if key in cls._instances:
+                return cls._instances[key]
+        reciters = reciters_manager.get_reciters()
+        return cls.shared(key, ((reciter["id"], reciter["display_text"]) for reciter in reciters))
+
+    def _suffix(self, i: int) -> str:
+        return self.names[self.entries[i]][self.positions[i]:]
+
+    def _rank(self, name: str, position: int, length: int) -> int:
+        end = position + length
+        starts_word = position == 0 or name[position - 1] == " "
+        ends_word = end == len(name) or name[end] == " "
+        if position == 0 and end == len(name):
+            return EXACT
+        if starts_word and ends_word:
+            return WHOLE_WORD
+        if position == 0:
+            return NAME_PREFIX
+        if starts_word:
+            return WORD_PREFIX
+        return INFIX
+
+    def search(self, text: str) -> List[Tuple[int, int]]:
+        """Return the (rank, entry) of the names containing the normalized text, best first."""
+        query = normalize_name(text)
+        if not query:
+            return []
+        best: Dict[int, int] = {}
+        i = bisect_left(range(len(self.entries)), query, key=self._suffix)
+        while i < len(self.entries) and self._suffix(i).startswith(query):
+            entry = self.entries[i]
+            rank = self._rank(self.names[entry], self.positions[i], len(query))
+            if rank < best.get(entry, INFIX + 1):
+                best[entry] = rank
+            i += 1
+        return sorted((rank, entry) for entry, rank in best.items())
+
+    def complete(self, text: str, limit: int = None) -> List[int]:
+        """Return the ids of the names containing the text, best matches first."""
+        return [self.ids[entry] for _, entry in self.search(text)[:limit]]
+
+    def resolve(self, text: str) -> Optional[int]:
+        """Return the id of the best match of the text, or None if no name contains it."""
+        matches = self.search(text)
+        return self.ids[matches[0][1]] if matches else None
+
+    def label(self, item_id: int) -> Optional[str]:
+        return self._labels_by_id.get(item_id)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __repr__(self) -> str:
+        return f"NameIndex(names={len(self)}, suffixes={len(self.entries)})"
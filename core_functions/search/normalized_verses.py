@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+import sqlite3
+import time
+from pathlib import Path
+from threading import Lock
+from typing import Optional
+from utils.paths import paths
+from utils.db_connections import ReadOnlyConnections
+from utils.logger import LoggerManager
+from exceptions.database import DBNotFoundError, DatabaseConnectionError
+from .normalizer import TEXT_COLUMNS, normalize
+
+logger = LoggerManager.get_logger(__name__)
+
+VERSES_DB_PATH = paths.data_folder / "quran" / "Verses.DB"
+
+
+class NormalizedVerses:
+    """
+    Shared in-memory copy of Verses.DB with every normalized text variant precomputed.
+
+    The quran table is copied as is, and the quran_normalized table holds, for each
+    ayah number, the text without tashkil, with hamzat folded, and both. The database
+    is built once per process on the first connection and lives as long as the
+    anchor connection, every search connection shares it through SQLite's shared cache.
+    """
+    URI = "file:albayan_normalized_verses?mode=memory&cache=shared"
+    _anchor: Optional[sqlite3.Connection] = None
+    _lock = Lock()
+
+    @classmethod
+    def connect(cls, source: Path = VERSES_DB_PATH) -> sqlite3.Connection:
+        """Return a new connection to the normalized verses, building them on first use."""
+        with cls._lock:
+            if cls._anchor is None:
+                cls._anchor = cls._build(Path(source))
+        return sqlite3.connect(cls.URI, uri=True)
+
+    @classmethod
+    def _build(cls, source: Path) -> sqlite3.Connection:
+        if not source.is_file():
+            logger.error(f"Database file not found: {source}")
+            raise DBNotFoundError(str(source))
+
+        start = time.perf_counter()
+        try:
+            conn = sqlite3.connect(cls.URI, uri=True, check_same_thread=False)
+            conn.execute("ATTACH DATABASE ? AS source;", (ReadOnlyConnections.uri(source),))
+            schema = conn.execute("SELECT sql FROM source.sqlite_master WHERE type = 'table' AND name = 'quran';").fetchone()[0]
+            conn.execute(schema)
+            conn.execute("INSERT INTO quran SELECT * FROM source.quran;")
+            conn.commit()
+            conn.execute("DETACH DATABASE source;")
+
+            variants = {column: options for options, column in TEXT_COLUMNS.items() if column != "text"}
+            conn.execute(f"CREATE TABLE quran_normalized (number INTEGER PRIMARY KEY, {', '.join(variants)});")
+            rows = (
+                (number, *(normalize(text, *options) for options in variants.values()))
+                for number, text in conn.execute("SELECT number, text FROM quran ORDER BY number;").fetchall()
+            )
+            conn.executemany(f"INSERT INTO quran_normalized VALUES (?{', ?' * len(variants)});", rows)
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.error(f"Building the normalized verses failed: {e}", exc_info=True)
+            raise DatabaseConnectionError(cause=e)
+
+        logger.info(f"Normalized verses built from {source} in {(time.perf_counter() - start) * 1000:.0f} ms.")
+        return conn
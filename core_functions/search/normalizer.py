@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""
+Text normalization shared by the search engine.
+
+The same functions build the normalized columns of the verses and normalize the
+searched text, so both sides are always folded the same way.
+"""
+
+from typing import Dict, Tuple
+
+TASHKIL = ("َ", "ً", "ُ", "ٌ", "ِ", "ٍ", "ْ", "ّ")
+HAMZAT = ("أ", "إ", "آ", "ء", "ؤ")
+HAMZA_REPLACEMENT = "ا"
+
+# (no_tashkil, no_hamza) -> column of the normalized verses table holding that variant.
+TEXT_COLUMNS: Dict[Tuple[bool, bool], str] = {
+    (False, False): "text",
+    (True, False):  "text_no_tashkil",
+    (False, True):  "text_no_hamza",
+    (True, True):   "text_normalized",
+}
+
+
+def strip_tashkil(text: str) -> str:
+    for char in TASHKIL:
+        if char in text:
+            text = text.replace(char, "")
+    return text
+
+
+def fold_hamza(text: str) -> str:
+    for char in HAMZAT:
+        if char in text:
+            text = text.replace(char, HAMZA_REPLACEMENT)
+    return text
+
+
+def normalize(text: str, no_tashkil: bool = False, no_hamza: bool = False) -> str:
+    """Return the text with tashkil removed and/or hamzat folded to alef."""
+    if no_tashkil:
+        text = strip_tashkil(text)
+    if no_hamza:
+        text = fold_hamza(text)
+    return text
+
+
+def text_column(no_tashkil: bool = False, no_hamza: bool = False) -> str:
+    """Return the normalized verses column to search for the given options."""
+    return TEXT_COLUMNS[(bool(no_tashkil), bool(no_hamza))]
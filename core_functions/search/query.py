@@ -0,0 +1,270 @@
+# -*- coding: utf-8 -*-
+"""
+Boolean and proximity query language of the Quran search.
+
+    الصلاة الزكاة              both words in the ayah (implicit AND)
+    الصلاة AND الزكاة          same
+    موسى OR هارون              either word
+    الجنة NOT النار            the first word without the second
+    "رب العالمين"              the words as a phrase, "رب العا*" ends with a prefix
+    يؤمن*                      words starting with the given letters
+    الصبر NEAR/3 الصلاة        both within 3 words in the same ayah, NEAR alone means NEAR/5
+    (موسى OR عيسى) NOT فرعون   parentheses group the operators
+
+NOT binds tighter than AND, which binds tighter than OR. NEAR binds tighter than
+all of them and only takes words and phrases. Keywords are only recognized in
+Latin capitals, so every Arabic word, such as أو or ليس, is searched as a word,
+and a keyword typed between quotes is searched as a word too.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Union
+from exceptions.database import InvalidSearchQueryError
+from utils.logger import LoggerManager
+from .normalizer import normalize
+from .word_index import WordIndex, Span
+
+logger = LoggerManager.get_logger(__name__)
+
+DEFAULT_NEAR_DISTANCE = 5
+AND_KEYWORDS = ("AND",)
+OR_KEYWORDS = ("OR",)
+NOT_KEYWORDS = ("NOT",)
+
+TOKEN_PATTERN = re.compile(
+    r'(?P<phrase>"[^"]*"?)'
+    r'|(?P<open>\()'
+    r'|(?P<close>\))'
+    r'|(?P<near>NEAR/(?P<distance>\d+)|NEAR(?![^\s()"]))'
+    r'|(?P<word>[^\s()"]+)'
+)
+
+
+@dataclass
+class Term:
+    """A word or a phrase, the last word is a prefix if prefix is True."""
+    words: List[str]
+    prefix: bool = False
+
+
+@dataclass
+class Near:
+    left: Union["Near", Term]
+    right: Term
+    distance: int
+
+
+@dataclass
+class And:
+    children: List["Node"] = field(default_factory=list)
+
+
+@dataclass
+class Or:
+    children: List["Node"] = field(default_factory=list)
+
+
+@dataclass
+class Not:
+    child: "Node"
+
+
+Node = Union[Term, Near, And, Or, Not]
+
+
+@dataclass
+class Token:
+    kind: str
+    value: str
+    position: int
+    distance: int = 0
+
+
+def tokenize(query: str) -> List[Token]:
+    tokens = []
+    for match in TOKEN_PATTERN.finditer(query):
+        kind = match.lastgroup if match.lastgroup != "distance" else "near"
+        value = match.group()
+        if kind == "phrase" and (len(value) < 2 or not value.endswith('"')):
+            raise InvalidSearchQueryError(query, "علامة تنصيص غير مغلقة", match.start())
+        if kind == "word" and value in AND_KEYWORDS + OR_KEYWORDS + NOT_KEYWORDS:
+            kind = "and" if value in AND_KEYWORDS else "or" if value in OR_KEYWORDS else "not"
+        distance = int(match.group("distance") or DEFAULT_NEAR_DISTANCE) if kind == "near" else 0
+        tokens.append(Token(kind, value, match.start(), distance))
+    return tokens
+
+
+class QueryParser:
+    """Recursive descent parser of the query language into a tree of Term, Near, And, Or and Not nodes."""
+
+    def __init__(self, query: str):
+        self.query = query
+        self.tokens = tokenize(query)
+        self.index = 0
+
+    def parse(self) -> Node:
+        if not self.tokens:
+            raise InvalidSearchQueryError(self.query, "الاستعلام فارغ")
+        node = self._parse_or()
+        if self.index < len(self.tokens):
+            token = self.tokens[self.index]
+            raise InvalidSearchQueryError(self.query, f"لم يُتوقع \"{token.value}\" هنا", token.position)
+        return node
+
+    def _peek(self) -> Optional[Token]:
+        return self.tokens[self.index] if self.index < len(self.tokens) else None
+
+    def _error(self, reason: str) -> InvalidSearchQueryError:
+        token = self._peek()
+        return InvalidSearchQueryError(self.query, reason, token.position if token else len(self.query))
+
+    def _parse_or(self) -> Node:
+        children = [self._parse_and()]
+        while self._peek() and self._peek().kind == "or":
+            self.index += 1
+            children.append(self._parse_and())
+        return children[0] if len(children) == 1 else Or(children)
+
+    def _parse_and(self) -> Node:
+        children = [self._parse_not()]
+        while self._peek() and self._peek().kind in ("and", "not", "word", "phrase", "open"):
+            if self._peek().kind == "and":
+                self.index += 1
+            children.append(self._parse_not())
+        return children[0] if len(children) == 1 else And(children)
+
+    def _parse_not(self) -> Node:
+        if self._peek() and self._peek().kind == "not":
+            self.index += 1
+            return Not(self._parse_not())
+        return self._parse_near()
+
+    def _parse_near(self) -> Node:
+        node = self._parse_primary()
+        while self._peek() and self._peek().kind == "near":
+            distance = self._peek().distance
+            self.index += 1
+            right = self._parse_primary()
+            if not isinstance(node, (Term, Near)) or not isinstance(right, Term):
+                raise self._error("يقبل معامل القرب الكلمات والعبارات فقط")
+            node = Near(node, right, distance)
+        return node
+
+    def _parse_primary(self) -> Node:
+        token = self._peek()
+        if token is None:
+            raise self._error("الاستعلام غير مكتمل")
+        self.index += 1
+        if token.kind == "open":
+            node = self._parse_or()
+            if not self._peek() or self._peek().kind != "close":
+                raise self._error("قوس غير مغلق")
+            self.index += 1
+            return node
+        if token.kind == "word":
+            prefix = token.value.endswith("*")
+            word = token.value.rstrip("*")
+            if not word:
+                raise InvalidSearchQueryError(self.query, "يجب أن تسبق النجمة حروف الكلمة", token.position)
+            return Term([word], prefix)
+        if token.kind == "phrase":
+            words = token.value[1:-1].split()
+            prefix = bool(words) and words[-1].endswith("*")
+            if prefix:
+                words[-1] = words[-1].rstrip("*")
+            if not words or not words[-1]:
+                raise InvalidSearchQueryError(self.query, "عبارة فارغة", token.position)
+            return Term(words, prefix)
+        self.index -= 1
+        raise self._error(f"لم يُتوقع \"{token.value}\" هنا")
+
+
+def parse_query(query: str) -> Node:
+    """Parse the query, raise InvalidSearchQueryError with the reason and position if it is not valid."""
+    return QueryParser(query).parse()
+
+
+class QueryPlanner:
+    """
+    Evaluates a parsed query over a WordIndex with posting-list intersections.
+
+    The operands of an AND are evaluated from the smallest estimated posting list to the
+    largest, each one only in the ayahs still matching, and the NOT operands are subtracted
+    last. The result maps every matching ayah number to the (first, last) word offsets of
+    its matches, which are empty for ayahs only matched through NOT.
+    """
+
+    def __init__(self, word_index: WordIndex, universe: Set[int]):
+        self.word_index = word_index
+        self.universe = universe
+
+    def _words(self, term: Term) -> List[str]:
+        return [normalize(word, self.word_index.no_tashkil, self.word_index.no_hamza) for word in term.words]
+
+    def estimate(self, node: Node) -> int:
+        """Estimate the number of postings the node matches."""
+        if isinstance(node, Term):
+            words = self._words(node)
+            return min(self.word_index.estimate(word, node.prefix and i == len(words) - 1) for i, word in enumerate(words))
+        if isinstance(node, Near):
+            return min(self.estimate(node.left), self.estimate(node.right))
+        if isinstance(node, Or):
+            return sum(self.estimate(child) for child in node.children)
+        if isinstance(node, And):
+            positives = [child for child in node.children if not isinstance(child, Not)]
+            return min(self.estimate(child) for child in positives) if positives else len(self.universe)
+        return len(self.universe)
+
+    def evaluate(self, node: Node, candidates: Optional[Set[int]] = None) -> Dict[int, List[Span]]:
+        candidates = self.universe if candidates is None else candidates
+        if isinstance(node, Term):
+            return self.word_index.find_phrase(self._words(node), node.prefix, candidates)
+        if isinstance(node, Near):
+            return self._evaluate_near(node, candidates)
+        if isinstance(node, Or):
+            result: Dict[int, List[Span]] = {}
+            for child in node.children:
+                for number, spans in self.evaluate(child, candidates).items():
+                    result.setdefault(number, []).extend(spans)
+            return result
+        if isinstance(node, Not):
+            excluded = self.evaluate(node.child, candidates)
+            return {number: [] for number in candidates if number not in excluded}
+        return self._evaluate_and(node, candidates)
+
+    def _evaluate_and(self, node: And, candidates: Set[int]) -> Dict[int, List[Span]]:
+        positives = sorted((child for child in node.children if not isinstance(child, Not)), key=self.estimate)
+        negatives = [child.child for child in node.children if isinstance(child, Not)]
+        logger.debug(f"AND plan: {[type(child).__name__ for child in positives]} then NOT {len(negatives)} operands.")
+
+        result: Dict[int, List[Span]] = {number: [] for number in candidates} if not positives else None
+        for child in positives:
+            matches = self.evaluate(child, candidates if result is None else set(result))
+            if result is None:
+                result = matches
+            else:
+                result = {number: result[number] + spans for number, spans in matches.items() if number in result}
+            if not result:
+                return {}
+        for child in negatives:
+            excluded = self.evaluate(child, set(result))
+            result = {number: spans for number, spans in result.items() if number not in excluded}
+        return result
+
+    def _evaluate_near(self, node: Near, candidates: Set[int]) -> Dict[int, List[Span]]:
+        right = self.evaluate(node.right, candidates)
+        left = self.evaluate(node.left, set(right) & candidates) if right else {}
+        result: Dict[int, List[Span]] = {}
+        for number, left_spans in left.items():
+            for left_first, left_last in left_spans:
+                for right_first, right_last in right[number]:
+                    if right_first > left_last:
+                        gap = right_first - left_last - 1
+                    elif left_first > right_last:
+                        gap = left_first - right_last - 1
+                    else:
+                        continue
+                    if gap <= node.distance:
+                        result.setdefault(number, []).append((min(left_first, right_first), max(left_last, right_last)))
+        return result
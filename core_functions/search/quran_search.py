@@ -0,0 +1,414 @@
+import sqlite3
+import re
+import json
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+from exceptions.database import DatabaseConnectionError, InvalidSearchTextError, InvalidCriteriaError
+from utils.logger import LoggerManager
+from .normalizer import normalize, text_column
+from .normalized_verses import NormalizedVerses, VERSES_DB_PATH
+from .word_index import WordIndex, Span
+from .query import parse_query, QueryPlanner
+from .morphology import MorphologyIndex, normalize_root
+from .fuzzy_index import FuzzyWordIndex
+from .result_cache import SearchResultCache, CacheKey
+from .name_index import NameIndex
+from .types import SearchMode
+
+logger = LoggerManager.get_logger(__name__)
+
+# A SELECT of the results and its parameters.
+Statement = Tuple[str, tuple]
+
+class SearchCriteria:
+    page = "page"
+    sura = "sura_number"
+    hizb = "hizb"
+    juz = "juz"
+    quarter = "hizbQuarter"
+    _arabic_criteria_dict = {
+        "صفحة": page,
+        "سورة": sura,
+        "الحزب": hizb,
+        "الجزء": juz,
+        "الربع": quarter
+    }    
+
+    @classmethod
+    def is_valid(cls, criteria) -> bool:
+        return criteria in cls._arabic_criteria_dict.values()
+
+    @classmethod
+    def get_criteria_by_arabic_name(cls, arabic_criteria) -> str:
+        return cls._arabic_criteria_dict.get(arabic_criteria)
+
+    @classmethod    
+    def get_arabic_criteria(cls) -> list:
+        return list(cls._arabic_criteria_dict.keys())
+
+
+class QuranSearchManager:
+    def __init__(self):
+        """Initialize the QuranSearchManager class."""
+        logger.debug("Initializing QuranSearchManager...")
+        self.no_tashkil = False
+        self.no_hamza = False
+        self.match_whole_word = False
+        self.mode = SearchMode.TEXT
+        self._criteria = None
+        self._from = None
+        self._to = None
+        self._from_ayah = None
+        self._to_ayah = None
+        self._conn = None
+        self._cursor = None
+        self.matches: Dict[int, List[Span]] = {}
+        self.groups: Dict[str, List[int]] = {}
+        self.result_cache: Optional[SearchResultCache] = SearchResultCache.load()
+        self._connect()
+        logger.debug("QuranSearchManager initialized.")
+
+    def set(self, no_tashkil:bool=False, no_hamza:bool=False, match_whole_word:bool=False, criteria:str = SearchCriteria.page, _from:int = 1, _to:int = 604, from_ayah:int=None, to_ayah:int=None, mode:SearchMode=SearchMode.TEXT) -> None:
+        """
+        Set the parameters for the search.
+
+        :param 
+        no_tashkil: If True, ignore tashkil (diacritics) in the search.
+        no_hamza: If True, ignore hamza in the search.
+        match_whole_word: If True, match the whole word in the search.
+        criteria: The criteria for the search (e.g., page, sura_number, hizb, juz, quarter).
+        _from: The starting value for the criteria.
+        _to: The ending value for the criteria.
+        from_ayah: The starting ayah number.
+        to_ayah: The ending ayah number.
+        mode: SearchMode.TEXT searches the text as typed, SearchMode.QUERY parses it as a boolean and proximity query,
+        SearchMode.ROOT finds every word derived from the typed root,
+        SearchMode.APPROXIMATE tolerates typos in the words of the text.
+        """
+        logger.debug(f"Setting parameters: no_tashkil={no_tashkil}, no_hamza={no_hamza}, match_whole_word={match_whole_word}, criteria={criteria}, _from={_from}, _to={_to}, from_ayah={from_ayah}, to_ayah={to_ayah}")
+
+        if not  SearchCriteria.is_valid(criteria):
+            logger.error(f"Invalid criteria: {criteria}. Must be one of {SearchCriteria.get_arabic_criteria()}.")
+            raise InvalidCriteriaError(criteria)
+
+        if self._conn is None:
+            logger.error("Database connection is None. Must connect to database first.")
+            raise DatabaseConnectionError("QuranSearchManager._conn is None, you must connect to database first.")
+
+        #Get surah number if the input is surah  name
+        if  criteria == SearchCriteria.sura and isinstance(_from, str):
+            logger.debug(f"Converting surah name '{_from}' to surah number...")
+            _from = self._resolve_surah(_from)
+        if  criteria == SearchCriteria.sura and isinstance(_to, str):
+            logger.debug(f"Converting surah name '{_to}' to surah number...")
+            _to = self._resolve_surah(_to)
+
+        if not isinstance(_from, int) or _from < 1:
+            logger.warning(f"Invalid 'from' value: {_from}. Setting to 1.")
+            _from = 1
+
+        if _to < _from:
+            logger.warning(f"Invalid 'to' value: {_to}. Setting 'to' to 'from' value: {_from}.")
+            _to = _from
+
+        if not isinstance(_to, int) or _to <1:
+            logger.debug(f"Invalid 'to' value: {_to}. Fetching max value for {criteria}.")
+            self._cursor.execute(f"SELECT DISTINCT MAX({criteria}) AS 'max' FROM quran;")
+            _to = self._cursor.fetchone()["max"]
+
+# Set attributes
+        self.no_tashkil = no_tashkil
+        self.no_hamza = no_hamza
+        self.match_whole_word = match_whole_word
+        self.mode = mode
+        self._from = _from
+        self._to = _to
+        self._from_ayah = from_ayah
+        self._to_ayah = to_ayah
+        self._criteria = criteria
+        logger.info(f"Parameters set: no_tashkil={self.no_tashkil}, no_hamza={self.no_hamza}, match_whole_word={self.match_whole_word}, criteria={self._criteria}, _from={self._from}, _to={self._to}, from_ayah={self._from_ayah}, to_ayah={self._to_ayah}.")
+
+    @staticmethod
+    def _resolve_surah(name: str) -> int:
+        """Return the number of the surah whose name best matches the given one."""
+        number = NameIndex.surahs().resolve(name)
+        if number is None:
+            logger.error(f"No surah name matches: {name}.")
+            raise InvalidCriteriaError(name)
+        return number
+
+    def settings(self) -> dict:
+        """Return the current parameters as keyword arguments of set()."""
+        return {
+            "no_tashkil": self.no_tashkil,
+            "no_hamza": self.no_hamza,
+            "match_whole_word": self.match_whole_word,
+            "criteria": self._criteria,
+            "_from": self._from,
+            "_to": self._to,
+            "from_ayah": self._from_ayah,
+            "to_ayah": self._to_ayah,
+            "mode": self.mode,
+        }
+
+    def _connect(self):
+        """Connect to the normalized copy of the Quran database."""
+        # connect to database
+        try:
+            logger.debug(f"Connecting to the normalized verses of: {VERSES_DB_PATH}...")
+            self._conn = NormalizedVerses.connect()
+            self._conn.row_factory = sqlite3.Row
+            self._conn.create_function("REGEXP", 2, lambda expr, item: re.search(expr, item) is not None)
+            self._cursor = self._conn.cursor()
+            logger.debug("Database connection established successfully.")
+        except sqlite3.Error as e:
+            logger.error(f"Database connection failed: {e}")
+            raise DatabaseConnectionError(cause=e)
+
+    def _load_word_index(self) -> Optional[WordIndex]:
+        try:
+            return WordIndex.load(self.no_tashkil, self.no_hamza)
+        except Exception as e:
+            logger.error(f"Word index unavailable: {e}", exc_info=True)
+            return None
+    
+    def search(self, search_text:str, prefix:bool=False) -> list:
+        """
+        Search for the given text in the Quran database.
+
+        :param
+        search_text: The text to search for.
+        prefix: If True, the last word of the text only has to start a word of the ayah.
+
+        In SearchMode.QUERY, the text is parsed by core_functions.search.query and evaluated
+        over the word index, an invalid query raises InvalidSearchQueryError.
+        In SearchMode.APPROXIMATE, every word of the text, without tashkil, matches the words
+        of the verses within one or two edits, and the closest matches come first.
+        In SearchMode.ROOT, the text is a root looked up in the morphology index, and
+        self.groups maps each derived form found to the ayah numbers of its occurrences.
+        Whole word and prefix searches are answered by the word index, which also fills
+        self.matches with the character spans of the matched words in each ayah.
+        A REGEXP scan is used if the word index cannot be built.
+        The results are kept in self.result_cache, a repeated search only reads their rows.
+        """
+        logger.debug(f"Starting search with text: '{search_text}'")
+        
+        if  not isinstance(search_text, str):
+            logger.error(f"Invalid search text type: {type(search_text)}. Must be a string.")
+            raise InvalidSearchTextError(search_text)
+
+        if not search_text:
+            logger.warning("Empty search text provided. Returning None.")
+            return None
+
+        key = self._cache_key(search_text, prefix)
+        cached_statement = self._cached_statement(key)
+        statement = cached_statement or self._prepare(search_text, prefix)
+        if statement is None:
+            return []
+
+        try:
+            self._cursor.execute(*statement)
+            result = self._cursor.fetchall()
+            logger.info(f"Search completed. Found {len(result)} results.")
+        except sqlite3.Error as e:
+            logger.error(f"Search query execution failed: {e}", exc_info=True)
+            return []
+
+        if cached_statement is None:
+            self._cache_results(key, [row["number"] for row in result])
+        return result
+
+    def search_pages(self, search_text: str, page_size: int = 50, prefix: bool = False) -> Iterator[list]:
+        """
+        Search like search(), but yield the results in pages of page_size rows, each page
+        being read from the database only when it is asked for. self.matches and self.groups
+        are filled before the first page. Database errors, including an interrupt() of the
+        connection from another thread, are raised to the caller.
+        """
+        if not isinstance(search_text, str):
+            raise InvalidSearchTextError(search_text)
+        if not search_text:
+            return
+
+        key = self._cache_key(search_text, prefix)
+        cached_statement = self._cached_statement(key)
+        statement = cached_statement or self._prepare(search_text, prefix)
+        if statement is None:
+            return
+
+        cursor = self._conn.execute(*statement)
+        numbers = []
+        try:
+            while True:
+                rows = cursor.fetchmany(page_size)
+                numbers.extend(row["number"] for row in rows)
+                if rows:
+                    yield rows
+                if len(rows) < page_size:
+                    break
+        finally:
+            cursor.close()
+        # Only cached once every page has been read, a search abandoned early is not complete.
+        if cached_statement is None:
+            self._cache_results(key, numbers)
+
+    def _cache_key(self, search_text: str, prefix: bool) -> CacheKey:
+        """Return the key of the search in the result cache, with the text as the mode reads it."""
+        if self.mode == SearchMode.QUERY:
+            # Folding the hamza of a keyword such as "أو" would turn it into a word.
+            key_text = search_text
+        elif self.mode == SearchMode.ROOT:
+            key_text = normalize_root(search_text)
+        elif self.mode == SearchMode.APPROXIMATE:
+            key_text = normalize(search_text, True, self.no_hamza)
+        else:
+            key_text = normalize(search_text, self.no_tashkil, self.no_hamza)
+        return (self.mode.value, key_text, prefix, self.no_tashkil, self.no_hamza, self.match_whole_word, self._criteria, self._from, self._to)
+
+    def _cached_statement(self, key: CacheKey) -> Optional[Statement]:
+        """Return the SELECT of the cached results of the search, restoring its matches and groups, or None if not cached."""
+        cached = self.result_cache.get(key) if self.result_cache is not None else None
+        if cached is None:
+            return None
+        logger.debug(f"Search results found in the cache: {len(cached.numbers)} ayahs.")
+        self.matches = dict(cached.matches)
+        self.groups = {form: list(numbers) for form, numbers in cached.groups.items()}
+        return self._select_numbers(cached.numbers.tolist())
+
+    def _cache_results(self, key: CacheKey, numbers: List[int]) -> None:
+        if self.result_cache is not None:
+            self.result_cache.put(key, numbers, self.matches, self.groups)
+
+    def interrupt(self) -> None:
+        """Abort the statement running on the connection, safe to call from another thread."""
+        self._conn.interrupt()
+
+    def _prepare(self, search_text: str, prefix: bool) -> Optional[Statement]:
+        """Resolve the search to the SELECT of its results, filling self.matches and self.groups. Return None if no result is possible."""
+        self.matches = {}
+        self.groups = {}
+        if self.mode == SearchMode.QUERY:
+            return self._prepare_query(search_text)
+        if self.mode == SearchMode.ROOT:
+            return self._prepare_root(search_text)
+        if self.mode == SearchMode.APPROXIMATE:
+            return self._prepare_approximate(search_text)
+
+        # The verses are normalized once when the database is built,
+        # so only the search text is normalized here and the matching column is searched.
+        search_text = normalize(search_text, self.no_tashkil, self.no_hamza)
+        column = text_column(self.no_tashkil, self.no_hamza)
+        word_index = self._load_word_index() if self.match_whole_word or prefix else None
+
+        if word_index is not None:
+            self.matches = word_index.find(search_text, prefix)
+            logger.debug(f"Word index found {len(self.matches)} ayahs for {'prefix' if prefix else 'whole word'} match: {search_text}")
+            return self._select_numbers(sorted(self.matches))
+
+        # Substring searches, and word searches if the word index is unavailable, scan the normalized verses.
+        if prefix:
+            operator = "REGEXP"
+            search_text = rf"\b{search_text}"
+            logger.debug(f"Using REGEXP operator for prefix match: {search_text}")
+        elif self.match_whole_word:
+            operator = "REGEXP"
+            search_text = rf"\b{search_text}\b"
+            logger.debug(f"Using REGEXP operator for whole word match: {search_text}")
+        else:
+            operator = "LIKE"
+            search_text = f"%{search_text}%"
+            logger.debug(f"Using LIKE operator for partial match: {search_text}")
+        if column == "text":
+            condition = f"text {operator} ?"
+        else:
+            condition = f"number IN (SELECT number FROM quran_normalized WHERE {column} {operator} ?)"
+
+        return self._select(condition, search_text)
+
+    def _prepare_query(self, search_text: str) -> Optional[Statement]:
+        """Evaluate a boolean and proximity query in the ayahs of the current range."""
+        tree = parse_query(search_text)
+        logger.debug(f"Parsed search query: {tree}")
+        word_index = self._load_word_index()
+        if word_index is None:
+            return None
+
+        matches = QueryPlanner(word_index, self._range_numbers()).evaluate(tree)
+        self.matches = {number: word_index.to_char_spans(number, spans) for number, spans in matches.items()}
+        logger.debug(f"Query matched {len(matches)} ayahs.")
+        return self._select_numbers(sorted(matches))
+
+    def _prepare_root(self, root: str) -> Optional[Statement]:
+        """Find the words derived from the root with one lookup in the morphology index, grouped by form."""
+        morphology_index = MorphologyIndex.load()
+        if morphology_index is None:
+            logger.warning("Root search requested but the morphology index is not available.")
+            return None
+
+        # Keep the words of the ayahs in the current range only, so the groups count the results.
+        numbers = self._range_numbers()
+        words = [word for word in morphology_index.find_root(root) if word[0] in numbers]
+        logger.debug(f"Morphology index found {len(words)} words derived from: {root}")
+        word_offsets: Dict[int, List[Span]] = {}
+        for number, word, _ in words:
+            word_offsets.setdefault(number, []).append((word, word))
+
+        word_index = self._load_word_index()
+        if word_index is not None:
+            self.matches = {number: word_index.to_char_spans(number, spans) for number, spans in word_offsets.items()}
+        self.groups = MorphologyIndex.group_by_form(words)
+        return self._select_numbers(sorted(word_offsets))
+
+    def _prepare_approximate(self, search_text: str) -> Optional[Statement]:
+        """Find the ayahs with an approximate match of every word, ordered by total edit distance."""
+        try:
+            fuzzy_index = FuzzyWordIndex.load(self.no_hamza)
+        except Exception as e:
+            logger.error(f"Trigram index unavailable: {e}", exc_info=True)
+            return None
+
+        found = fuzzy_index.find(search_text)
+        logger.debug(f"Trigram index found {len(found)} ayahs for approximate match: {search_text}")
+        self.matches = {
+            number: fuzzy_index.word_index.to_char_spans(number, sorted(word_spans))
+            for number, (_, word_spans) in found.items()
+        }
+        return self._select_numbers(sorted(found, key=lambda number: (found[number][0], number)))
+
+    def _range_numbers(self) -> Set[int]:
+        """Return the numbers of the ayahs in the current range."""
+        self._cursor.execute(f"SELECT json_group_array(number) FROM quran WHERE {self._criteria} >= ? AND {self._criteria} <= ?;", (self._from, self._to))
+        return set(json.loads(self._cursor.fetchone()[0]))
+
+    def _select(self, condition: str, parameter: str) -> Statement:
+        query = f"SELECT * FROM quran WHERE {self._criteria} >= ? AND {self._criteria} <= ? AND {condition} ORDER BY number;"
+        logger.debug(f"Query constructed: {query}")
+        return query, (self._from, self._to, parameter)
+
+    def _select_numbers(self, numbers: List[int]) -> Statement:
+        """Select the ayahs of the current range among the numbers, in the order of the list."""
+        query = (
+            "SELECT quran.* FROM json_each(?) AS numbers JOIN quran ON quran.number = numbers.value "
+            f"WHERE quran.{self._criteria} >= ? AND quran.{self._criteria} <= ? ORDER BY numbers.key;"
+        )
+        logger.debug(f"Query constructed for {len(numbers)} ayah numbers: {query}")
+        return query, (json.dumps(numbers), self._from, self._to)
+
+
+    def __str__(self) -> str:
+        """Return a string representation of the QuranSearchManager."""
+        return "Quran Search Manager Information:\n" \
+            "No Tashkil: {}\n" \
+            "No Hamza: {}\n" \
+            "Criteria: {}\n" \
+            "From: {}\n" \
+            "To: {}\n" \
+            "From Ayah: {}\n" \
+            "To Ayah: {}\n".format(self.no_tashkil, self.no_hamza, self._criteria, self._from, self._to, self._from_ayah, self._to_ayah)
+
+    def __del__(self):
+        """Destructor for the QuranSearchManager class."""
+        logger.debug("Deleting QuranSearchManager object and closing database connection...")
+        if self._conn is not None:
+            self._conn.close()
+            logger.info("Deleted QuranSearchManager object Database connection closed.")          
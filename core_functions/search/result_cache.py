@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+
+import hashlib
+import json
+import os
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Lock
+from typing import Dict, List, Optional, Tuple
+from utils.func import calculate_sha256
+from utils.paths import paths
+from utils.logger import LoggerManager
+from .normalized_verses import VERSES_DB_PATH
+from .morphology import MORPHOLOGY_DB_PATH
+from .word_index import Span
+
+logger = LoggerManager.get_logger(__name__)
+
+RESULT_CACHE_VERSION = 1
+RESULT_CACHE_BUDGET = 8 * 1024 * 1024
+MAX_PERSISTED_ENTRIES = 20
+# Rough cost in bytes of the Python objects of an entry, used to keep the cache within its budget.
+ENTRY_COST = 512
+NUMBER_COST = 4
+MATCH_COST = 100
+SPAN_COST = 64
+
+# (mode, text as the mode reads it, prefix, no_tashkil, no_hamza, match_whole_word, criteria, from, to)
+CacheKey = Tuple
+
+
+@dataclass
+class CachedResult:
+    """The ayah numbers of a search in the order of its results, with the matches and groups it filled."""
+    numbers: array
+    matches: Dict[int, List[Span]]
+    groups: Dict[str, List[int]]
+
+    @property
+    def size(self) -> int:
+        return (
+            ENTRY_COST
+            + NUMBER_COST * len(self.numbers)
+            + sum(MATCH_COST + SPAN_COST * len(spans) for spans in self.matches.values())
+            + sum(MATCH_COST + NUMBER_COST * len(numbers) for numbers in self.groups.values())
+        )
+
+
+def content_hash(sources: Tuple[Path, ...] = (VERSES_DB_PATH, MORPHOLOGY_DB_PATH)) -> str:
+    """Return a hash of the databases the results are read from, the missing ones are skipped."""
+    digest = hashlib.sha256()
+    for source in sources:
+        if Path(source).is_file():
+            digest.update(f"{Path(source).name}:{calculate_sha256(source)};".encode("utf-8"))
+    return digest.hexdigest()
+
+
+class SearchResultCache:
+    """
+    LRU cache of search results shared by every QuranSearchManager of the process.
+
+    Only the ayah numbers of the results are kept, with the matched spans and groups,
+    so a repeated search reads its rows by primary key instead of scanning the verses.
+    The least recently used entries are dropped when the estimated size of the cache
+    exceeds its budget. Entries are only valid for the content hash of the databases
+    they were computed from: persisted entries are discarded when it changes.
+    When persistent, the most recent entries are written to the user data folder by
+    save() and read back on the next start.
+    """
+    _instances: Dict[Path, "SearchResultCache"] = {}
+    _lock = Lock()
+
+    def __init__(self, path: Path, budget: int = RESULT_CACHE_BUDGET, source_hash: str = None):
+        self.path = Path(path)
+        self.budget = budget
+        self.source_hash = source_hash or content_hash()
+        self.persistent = False
+        self.size = 0
+        self._entries: "OrderedDict[CacheKey, CachedResult]" = OrderedDict()
+        self._entries_lock = Lock()
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def load(cls, path: Path = None) -> "SearchResultCache":
+        """Return the shared cache persisted at the given path."""
+        path = Path(path or paths.search_cache)
+        with cls._lock:
+            if path not in cls._instances:
+                cls._instances[path] = cls(path)
+            return cls._instances[path]
+
+    def get(self, key: CacheKey) -> Optional[CachedResult]:
+        with self._entries_lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: CacheKey, numbers: List[int], matches: Dict[int, List[Span]], groups: Dict[str, List[int]]) -> None:
+        """Store the results of a search, keeping only the matches of the ayahs in its results."""
+        kept = set(numbers)
+        entry = CachedResult(
+            array("I", numbers),
+            {number: spans for number, spans in matches.items() if number in kept},
+            {form: [number for number in form_numbers if number in kept] for form, form_numbers in groups.items()},
+        )
+        if entry.size > self.budget:
+            logger.debug(f"Search results of {key} exceed the cache budget, not cached.")
+            return
+        with self._entries_lock:
+            self._remove(key)
+            self._entries[key] = entry
+            self.size += entry.size
+            while self.size > self.budget:
+                self._remove(next(iter(self._entries)))
+            self._dirty = True
+        logger.debug(f"Cached {len(numbers)} results, {len(self._entries)} entries, {self.size} bytes.")
+
+    def _remove(self, key: CacheKey) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= entry.size
+
+    def clear(self) -> None:
+        with self._entries_lock:
+            self._entries.clear()
+            self.size = 0
+            self._dirty = True
+
+    def set_persistent(self, persistent: bool) -> None:
+        """Read the persisted entries when persistence is turned on, delete them when it is turned off."""
+        if persistent == self.persistent:
+            return
+        self.persistent = persistent
+        if persistent:
+            self._read()
+        else:
+            self.path.unlink(missing_ok=True)
+            logger.info(f"Persisted search results deleted: {self.path}")
+
+    def save(self) -> None:
+        """Write the most recent entries if the cache is persistent and changed since the last save."""
+        if not self.persistent or not self._dirty:
+            return
+        with self._entries_lock:
+            entries = list(self._entries.items())[-MAX_PERSISTED_ENTRIES:]
+            self._dirty = False
+        data = {
+            "version": RESULT_CACHE_VERSION,
+            "source_hash": self.source_hash,
+            "entries": [
+                [list(key), entry.numbers.tolist(), list(entry.matches.items()), entry.groups]
+                for key, entry in entries
+            ],
+        }
+        temp_path = self.path.with_name(self.path.name + ".tmp")
+        try:
+            with open(temp_path, "w", encoding="utf-8") as file:
+                json.dump(data, file, ensure_ascii=False)
+            os.replace(temp_path, self.path)
+            logger.info(f"{len(entries)} search results saved to {self.path}")
+        except OSError as e:
+            logger.warning(f"Could not save the search results: {e}")
+
+    def _read(self) -> None:
+        if not self.path.is_file():
+            return
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                data = json.load(file)
+            if data.get("version") != RESULT_CACHE_VERSION or data.get("source_hash") != self.source_hash:
+                logger.info("Persisted search results are out of date, discarded.")
+                self.path.unlink(missing_ok=True)
+                return
+            # Entries of this session are more recent than the persisted ones, which go first from the newest.
+            for key, numbers, matches, groups in reversed(data["entries"]):
+                key = tuple(key)
+                if key in self._entries:
+                    continue
+                self.put(key, numbers, {number: [tuple(span) for span in spans] for number, spans in matches}, groups)
+                with self._entries_lock:
+                    if key in self._entries:
+                        self._entries.move_to_end(key, last=False)
+        except (OSError, ValueError, TypeError, KeyError) as e:
+            logger.warning(f"Could not read the persisted search results: {e}")
+            return
+        logger.info(f"{len(self._entries)} search results loaded from {self.path}")
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f"SearchResultCache(entries={len(self)}, size={self.size}, budget={self.budget}, hits={self.hits}, misses={self.misses})"
@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+"""
+Index of similar verses (mutashabihat), stored in the user data folder.
+
+It is built on first use and rebuilt when Verses.DB or the index version changes.
+Rebuild it from the project root with:
+    python -m core_functions.search.similar_verses [output]
+"""
+
+import hashlib
+import os
+import sqlite3
+import sys
+import time
+from array import array
+from pathlib import Path
+from threading import Lock
+from typing import Dict, List, NamedTuple, Optional, Set
+from utils.paths import paths
+from utils.logger import LoggerManager
+from utils.func import calculate_sha256
+from .normalizer import text_column
+from .normalized_verses import NormalizedVerses, VERSES_DB_PATH
+
+logger = LoggerManager.get_logger(__name__)
+
+SIMILAR_VERSES_INDEX_VERSION = 1
+# 64 MinHash values cut in 32 bands of 2: pairs of ayahs sharing 30% of their
+# word pairs become candidates with a probability of about 95%, 50% with 99.9%.
+PERMUTATIONS = 64
+BANDS = 32
+ROWS = PERMUTATIONS // BANDS
+MIN_SCORE = 0.3
+MAX_SIMILAR = 10
+# Words are compared without tashkil and with folded hamzat.
+SHINGLE_COLUMN = text_column(True, True)
+
+
+class SimilarVerse(NamedTuple):
+    number: int
+    score: float
+
+
+def shingles(text: str) -> Set[str]:
+    """Return the pairs of consecutive words of a normalized text, or its only word."""
+    words = text.split()
+    if len(words) < 2:
+        return set(words)
+    return {f"{first} {second}" for first, second in zip(words, words[1:])}
+
+
+def jaccard(first: Set[str], second: Set[str]) -> float:
+    if not first or not second:
+        return 0.0
+    common = len(first & second)
+    return common / (len(first) + len(second) - common)
+
+
+class SimilarVersesIndex:
+    """
+    Locality-sensitive hashing index of the word pairs of every ayah.
+
+    Each ayah is summarized by a MinHash signature: for each of PERMUTATIONS hash
+    functions, the smallest hash of its word pairs. Two signatures agree on a value
+    with a probability equal to the Jaccard similarity of the two ayahs, so the
+    signatures are cut in BANDS bands and the ayahs sharing a whole band are stored
+    under the same bucket. The candidates of an ayah are read from its buckets and
+    ranked by their exact Jaccard similarity, without comparing it to every ayah.
+    The hash functions are slices of a SHAKE-128 digest of the word pair.
+    """
+    _instances: Dict[Path, Optional["SimilarVersesIndex"]] = {}
+    _lock = Lock()
+
+    def __init__(self, path: Path, source: Path = VERSES_DB_PATH):
+        self.path = Path(path)
+        self.source = Path(source)
+        self.source_hash = calculate_sha256(self.source)
+
+    @classmethod
+    def load(cls, path: Path = None, source: Path = VERSES_DB_PATH) -> Optional["SimilarVersesIndex"]:
+        """Return the up to date index at the given path, building it if needed, or None if unavailable."""
+        path = Path(path or paths.similar_verses_index)
+        with cls._lock:
+            if path not in cls._instances:
+                instance = None
+                try:
+                    instance = cls(path, source)
+                    if not instance.is_current():
+                        instance.build()
+                except Exception as e:
+                    logger.warning(f"Similar verses index unavailable: {e}")
+                    instance = None
+                cls._instances[path] = instance
+            return cls._instances[path]
+
+    def is_current(self) -> bool:
+        if not self.path.is_file():
+            return False
+        try:
+            with sqlite3.connect(self.path) as conn:
+                meta = dict(conn.execute("SELECT key, value FROM meta;").fetchall())
+        except sqlite3.Error as e:
+            logger.warning(f"Unreadable similar verses index {self.path}: {e}")
+            return False
+        current = meta.get("version") == str(SIMILAR_VERSES_INDEX_VERSION) and meta.get("source_sha256") == self.source_hash
+        if not current:
+            logger.info(f"Similar verses index {self.path} is out of date.")
+        return current
+
+    @staticmethod
+    def signature(ayah_shingles: Set[str], hashes: Dict[str, array] = None) -> array:
+        """Return the MinHash signature of a set of word pairs, reusing the hashes already computed."""
+        hashes = {} if hashes is None else hashes
+        values = []
+        for shingle in ayah_shingles:
+            shingle_hashes = hashes.get(shingle)
+            if shingle_hashes is None:
+                shingle_hashes = hashes[shingle] = array("I", hashlib.shake_128(shingle.encode("utf-8")).digest(4 * PERMUTATIONS))
+            values.append(shingle_hashes)
+        return array("I", map(min, zip(*values)))
+
+    @staticmethod
+    def band_keys(signature: array) -> List[bytes]:
+        return [signature[band * ROWS:(band + 1) * ROWS].tobytes() for band in range(BANDS)]
+
+    def build(self) -> None:
+        """Build the index in a temporary file, then move it in place."""
+        start = time.perf_counter()
+        temp_path = self.path.with_name(self.path.name + ".tmp")
+        temp_path.unlink(missing_ok=True)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        source = NormalizedVerses.connect(self.source)
+        try:
+            rows = source.execute(f"SELECT number, {SHINGLE_COLUMN} FROM quran_normalized ORDER BY number;").fetchall()
+        finally:
+            source.close()
+
+        hashes: Dict[str, array] = {}
+        signatures = [(number, self.signature(shingles(text), hashes)) for number, text in rows]
+        conn = sqlite3.connect(temp_path)
+        try:
+            conn.execute("CREATE TABLE signatures (number INTEGER PRIMARY KEY, signature BLOB);")
+            conn.execute("CREATE TABLE buckets (band INTEGER, key BLOB, number INTEGER, PRIMARY KEY (band, key, number)) WITHOUT ROWID;")
+            conn.executemany("INSERT INTO signatures VALUES (?, ?);", ((number, signature.tobytes()) for number, signature in signatures))
+            conn.executemany(
+                "INSERT OR IGNORE INTO buckets VALUES (?, ?, ?);",
+                ((band, key, number) for number, signature in signatures for band, key in enumerate(self.band_keys(signature))),
+            )
+            conn.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);")
+            conn.executemany(
+                "INSERT INTO meta VALUES (?, ?);",
+                (("version", str(SIMILAR_VERSES_INDEX_VERSION)), ("source_sha256", self.source_hash), ("permutations", str(PERMUTATIONS)), ("bands", str(BANDS))),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+        os.replace(temp_path, self.path)
+        logger.info(f"Similar verses index built at {self.path} in {(time.perf_counter() - start) * 1000:.0f} ms ({self.path.stat().st_size / 1024:.0f} KB).")
+
+    def candidates(self, number: int) -> Set[int]:
+        """Return the ayahs sharing at least one band with the given ayah, without it."""
+        conn = sqlite3.connect(self.path.absolute().as_uri() + "?mode=ro", uri=True)
+        try:
+            row = conn.execute("SELECT signature FROM signatures WHERE number = ?;", (number,)).fetchone()
+            if row is None:
+                return set()
+            signature = array("I")
+            signature.frombytes(row[0])
+            found = set()
+            for band, key in enumerate(self.band_keys(signature)):
+                found.update(other for other, in conn.execute("SELECT number FROM buckets WHERE band = ? AND key = ?;", (band, key)))
+        finally:
+            conn.close()
+        found.discard(number)
+        return found
+
+    def find(self, number: int, limit: int = MAX_SIMILAR, min_score: float = MIN_SCORE) -> List[SimilarVerse]:
+        """Return the ayahs most similar to the given one, by their exact Jaccard similarity, best first."""
+        start = time.perf_counter()
+        candidates = self.candidates(number)
+        if not candidates:
+            return []
+        numbers = [number, *candidates]
+        conn = NormalizedVerses.connect(self.source)
+        try:
+            texts = dict(conn.execute(
+                f"SELECT number, {SHINGLE_COLUMN} FROM quran_normalized WHERE number IN ({', '.join('?' * len(numbers))});", numbers
+            ).fetchall())
+        finally:
+            conn.close()
+
+        ayah_shingles = shingles(texts[number])
+        similar = [SimilarVerse(other, jaccard(ayah_shingles, shingles(texts[other]))) for other in candidates]
+        similar = sorted((verse for verse in similar if verse.score >= min_score), key=lambda verse: (-verse.score, verse.number))
+        logger.debug(f"{len(similar)} similar verses of {number} among {len(candidates)} candidates in {(time.perf_counter() - start) * 1000:.1f} ms.")
+        return similar[:limit]
+
+    def __repr__(self) -> str:
+        return f"SimilarVersesIndex(path={self.path}, source={self.source})"
+
+
+if __name__ == "__main__":
+    start = time.perf_counter()
+    index = SimilarVersesIndex(Path(sys.argv[1]) if len(sys.argv) > 1 else paths.similar_verses_index)
+    index.build()
+    print(f"Built {index.path} in {time.perf_counter() - start:.1f} s")
@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+
+import sys
+import time
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from pathlib import Path
+from threading import Lock
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from core_functions.quran.types import NavigationMode
+from core_functions.quran.corpus import QuranCorpus
+from utils.logger import LoggerManager
+from .normalizer import normalize
+from .normalized_verses import NormalizedVerses, VERSES_DB_PATH
+from .word_index import WORD_PATTERN
+
+logger = LoggerManager.get_logger(__name__)
+
+# Words are counted without tashkil, the hamzat are kept apart.
+NO_TASHKIL = True
+NO_HAMZA = False
+
+
+class ConcordanceLine(NamedTuple):
+    number: int
+    left: str
+    word: str
+    right: str
+
+
+class CorpusStatistics:
+    """
+    Word statistics of the whole Quran, computed from a single pass over the verses.
+
+    Every word of Verses.DB is normalized once and replaced by an integer id, giving
+    the corpus as one array of ids in the order of the mushaf and the [start, end)
+    offsets of each ayah in it. The positions of every id are grouped in a second
+    array, so the frequency of a word in any range of ayahs is two binary searches,
+    and the counts of a page, surah or juz are one Counter over a slice of ids.
+    Ranges are given as [start, end) ayah indexes, like QuranCorpus.unit_bounds().
+    """
+    _instance: Optional["CorpusStatistics"] = None
+    _lock = Lock()
+
+    def __init__(self, source: Path = VERSES_DB_PATH):
+        start = time.perf_counter()
+        conn = NormalizedVerses.connect(source)
+        try:
+            rows = conn.execute("SELECT number, text FROM quran ORDER BY number;").fetchall()
+        finally:
+            conn.close()
+
+        self.numbers = array("H")
+        self.texts: List[str] = []
+        self.words: List[str] = []
+        self.ids: Dict[str, int] = {}
+        self.tokens = array("H")
+        self.ayah_starts = array("I", [0])
+        self.token_ayahs = array("H")
+        forms: Dict[str, int] = {}
+        for index, (number, text) in enumerate(rows):
+            self.numbers.append(number)
+            self.texts.append(text)
+            for match in WORD_PATTERN.finditer(text):
+                form = match.group()
+                word_id = forms.get(form)
+                if word_id is None:
+                    word = normalize(form, NO_TASHKIL, NO_HAMZA)
+                    word_id = self.ids.get(word)
+                    if word_id is None:
+                        word_id = self.ids[word] = len(self.words)
+                        self.words.append(word)
+                    forms[form] = word_id
+                self.tokens.append(word_id)
+                self.token_ayahs.append(index)
+            self.ayah_starts.append(len(self.tokens))
+
+        # Counting sort of the token positions by id: the occurrences of id i are
+        # occurrences[occurrence_starts[i]:occurrence_starts[i + 1]], in the order of the mushaf.
+        self.counts = array("I", [0] * len(self.words))
+        for word_id in self.tokens:
+            self.counts[word_id] += 1
+        self.occurrence_starts = array("I", [0] * (len(self.words) + 1))
+        for word_id, count in enumerate(self.counts):
+            self.occurrence_starts[word_id + 1] = self.occurrence_starts[word_id] + count
+        self.occurrences = array("I", [0] * len(self.tokens))
+        filled = array("I", self.occurrence_starts[:-1])
+        for position, word_id in enumerate(self.tokens):
+            self.occurrences[filled[word_id]] = position
+            filled[word_id] += 1
+
+        self.build_time = time.perf_counter() - start
+        logger.info(
+            f"Corpus statistics built in {self.build_time * 1000:.0f} ms: {len(self.tokens)} words, "
+            f"{len(self.words)} distinct, {sum(self.memory_usage().values()) / 1024:.0f} KB."
+        )
+
+    @classmethod
+    def load(cls) -> "CorpusStatistics":
+        """Return the shared statistics, building them on first use."""
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    @staticmethod
+    def unit_bounds(mode: NavigationMode, number: int) -> Tuple[int, int]:
+        """Return the [start, end) ayah indexes of a page, surah, juz, hizb or quarter."""
+        return QuranCorpus.load().unit_bounds(mode, number)
+
+    def _token_bounds(self, start: int, end: Optional[int]) -> Tuple[int, int]:
+        end = len(self.numbers) if end is None else end
+        return self.ayah_starts[max(0, start)], self.ayah_starts[min(end, len(self.numbers))]
+
+    def _occurrences(self, word_id: int) -> array:
+        return self.occurrences[self.occurrence_starts[word_id]:self.occurrence_starts[word_id + 1]]
+
+    def word_id(self, word: str) -> Optional[int]:
+        """Return the id of a word as it is counted, or None if it is not in the Quran."""
+        return self.ids.get(normalize(word.strip(), NO_TASHKIL, NO_HAMZA))
+
+    def word_count(self, start: int = 0, end: int = None) -> int:
+        """Return the number of words of the ayahs [start, end)."""
+        token_start, token_end = self._token_bounds(start, end)
+        return token_end - token_start
+
+    def frequencies(self, start: int = 0, end: int = None) -> Counter:
+        """Return the number of occurrences of each word id in the ayahs [start, end)."""
+        token_start, token_end = self._token_bounds(start, end)
+        return Counter(self.tokens[token_start:token_end])
+
+    def unique_count(self, start: int = 0, end: int = None) -> int:
+        """Return the number of distinct words of the ayahs [start, end)."""
+        token_start, token_end = self._token_bounds(start, end)
+        return len(set(self.tokens[token_start:token_end]))
+
+    def top_words(self, start: int = 0, end: int = None, limit: int = 10) -> List[Tuple[str, int]]:
+        """Return the most frequent words of the ayahs [start, end) with their counts; ties keep the first word of the mushaf."""
+        return [(self.words[word_id], count) for word_id, count in self.frequencies(start, end).most_common(limit)]
+
+    def exclusive_words(self, start: int = 0, end: int = None) -> List[str]:
+        """Return the words of the ayahs [start, end) that occur nowhere else in the Quran."""
+        return [self.words[word_id] for word_id, count in self.frequencies(start, end).items() if count == self.counts[word_id]]
+
+    def frequency(self, word: str, start: int = 0, end: int = None) -> int:
+        """Return the number of occurrences of a word in the ayahs [start, end)."""
+        word_id = self.word_id(word)
+        if word_id is None:
+            return 0
+        token_start, token_end = self._token_bounds(start, end)
+        occurrences = self._occurrences(word_id)
+        return bisect_left(occurrences, token_end) - bisect_left(occurrences, token_start)
+
+    def distribution(self, word: str, mode: NavigationMode = NavigationMode.SURAH) -> Dict[int, int]:
+        """Return the number of occurrences of a word in each page, surah, juz, hizb or quarter where it occurs."""
+        word_id = self.word_id(word)
+        if word_id is None:
+            return {}
+        corpus = QuranCorpus.load()
+        return dict(Counter(corpus.unit_of(mode, self.numbers[self.token_ayahs[position]]) for position in self._occurrences(word_id)))
+
+    def concordance(self, word: str, context: int = 4, limit: int = None) -> List[ConcordanceLine]:
+        """Return every occurrence of a word with the words around it in its ayah, in the order of the mushaf."""
+        word_id = self.word_id(word)
+        if word_id is None:
+            return []
+        lines = []
+        for position in self._occurrences(word_id)[:limit]:
+            index = self.token_ayahs[position]
+            offset = position - self.ayah_starts[index]
+            words = self.texts[index].split()
+            lines.append(ConcordanceLine(
+                self.numbers[index],
+                " ".join(words[max(0, offset - context):offset]),
+                words[offset],
+                " ".join(words[offset + 1:offset + 1 + context]),
+            ))
+        return lines
+
+    def memory_usage(self) -> Dict[str, int]:
+        """Return the approximate memory used by the arrays and by the vocabulary, in bytes."""
+        columns = (self.numbers, self.tokens, self.ayah_starts, self.token_ayahs, self.counts, self.occurrence_starts, self.occurrences)
+        return {
+            "arrays": sum(column.buffer_info()[1] * column.itemsize for column in columns),
+            "vocabulary": sys.getsizeof(self.words) + sys.getsizeof(self.ids) + sum(sys.getsizeof(word) for word in self.words),
+            "texts": sys.getsizeof(self.texts) + sum(sys.getsizeof(text) for text in self.texts),
+        }
+
+    def __len__(self) -> int:
+        return len(self.tokens)
+
+    def __repr__(self) -> str:
+        return f"CorpusStatistics(words={len(self)}, distinct={len(self.words)}, ayahs={len(self.numbers)})"
@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+
+import os
+import re
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+from core_functions.tafaseer import Category
+from utils.db_connections import ReadOnlyConnections
+from utils.func import calculate_sha256
+from utils.paths import paths
+from utils.logger import LoggerManager
+from .normalizer import normalize
+from .word_index import WORD_PATTERN, make_snippet
+
+logger = LoggerManager.get_logger(__name__)
+
+TAFASEER_FOLDER = paths.data_folder / "tafaseer"
+TAFASEER_INDEX_VERSION = 1
+MAX_HITS_PER_BOOK = 200
+SNIPPET_CONTEXT_WORDS = 8
+NON_LETTERS = re.compile(r"[^\w]")
+# Tashkil are nonspacing marks (category Mn), which unicode61 treats as separators
+# by default. Adding M* keeps any mark left in the text inside its token.
+TOKENIZER = "unicode61 remove_diacritics 0 categories 'L* N* Co M*'"
+
+
+@dataclass
+class TafsirHit:
+    category: str
+    number: int
+    sura_number: int
+    number_in_surah: int
+    snippet: str
+
+
+def quote_fts(text: str) -> str:
+    """Quote the text as an FTS5 string, matched as a phrase of its tokens."""
+    return '"' + text.replace('"', '""') + '"'
+
+
+def installed_tafaseer(folder: Path = TAFASEER_FOLDER) -> Dict[str, Path]:
+    """Return the database of every installed tafsir, by category, in the order of Category."""
+    files = {path.stem.lower(): path for path in Path(folder).glob("*") if path.suffix.lower() == ".db"}
+    return {category: files[category] for category in Category.get_categories() if category in files}
+
+
+def tafsir_snippet(text: str, words: List[str], prefix: bool = False, context_words: int = SNIPPET_CONTEXT_WORDS) -> str:
+    """Return the first occurrence of the normalized words in the text with some context, or the start of the text."""
+    matches = list(WORD_PATTERN.finditer(text))
+    tokens = [NON_LETTERS.sub("", normalize(match.group(), True, True)) for match in matches]
+    last = len(words) - 1
+    for start in range(len(tokens) - last):
+        if all(
+            tokens[start + i].startswith(word) if prefix and i == last else tokens[start + i] == word
+            for i, word in enumerate(words)
+        ):
+            return make_snippet(text, [(matches[start].start(), matches[start + last].end())], context_words)
+    return " ".join(text.split()[:2 * context_words + 1])
+
+
+class TafsirBookIndex:
+    """
+    FTS5 index of one tafsir book, stored in the user data folder.
+
+    The contentless tafsir_fts table holds the text of every ayah without tashkil and
+    with folded hamzas, and its rowid is the ayah number. The ayahs table maps it to
+    the surah and the number in the surah. Snippets are cut from the original text.
+    The size and modification time of the source are stored next to its hash, so the
+    books are only hashed again when one of them changed.
+    """
+
+    def __init__(self, category: str, source: Path, path: Path):
+        self.category = category
+        self.source = Path(source)
+        self.path = Path(path)
+
+    def source_stat(self) -> Dict[str, str]:
+        stat = self.source.stat()
+        return {"source_size": str(stat.st_size), "source_mtime_ns": str(stat.st_mtime_ns)}
+
+    def is_current(self) -> bool:
+        if not self.path.is_file():
+            return False
+        try:
+            with sqlite3.connect(self.path) as conn:
+                meta = dict(conn.execute("SELECT key, value FROM meta;").fetchall())
+                if meta.get("version") != str(TAFASEER_INDEX_VERSION):
+                    return False
+                source_stat = self.source_stat()
+                if all(meta.get(key) == value for key, value in source_stat.items()):
+                    return True
+                if meta.get("source_sha256") != calculate_sha256(self.source):
+                    return False
+                # Same content with a new modification time, such as a copied file.
+                conn.executemany("INSERT OR REPLACE INTO meta VALUES (?, ?);", source_stat.items())
+        except sqlite3.Error as e:
+            logger.warning(f"Unreadable tafsir index {self.path}: {e}")
+            return False
+        return True
+
+    def build(self) -> None:
+        """Build the index in a temporary file, then move it in place."""
+        start = time.perf_counter()
+        temp_path = self.path.with_name(self.path.name + ".tmp")
+        temp_path.unlink(missing_ok=True)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        source = ReadOnlyConnections.get(self.source)
+        conn = sqlite3.connect(temp_path)
+        try:
+            conn.execute(f"CREATE VIRTUAL TABLE tafsir_fts USING fts5(text, content='', tokenize=\"{TOKENIZER}\", prefix='2 3');")
+            conn.execute("CREATE TABLE ayahs (number INTEGER PRIMARY KEY, sura_number INTEGER, number_in_surah INTEGER);")
+            for sura_number in range(1, 115):
+                rows = source.execute(f"SELECT number, numberInSurah, text FROM tafsir_{sura_number};").fetchall()
+                conn.executemany("INSERT INTO ayahs VALUES (?, ?, ?);", ((number, sura_number, number_in_surah) for number, number_in_surah, _ in rows))
+                conn.executemany("INSERT INTO tafsir_fts(rowid, text) VALUES (?, ?);", ((number, normalize(text or "", True, True)) for number, _, text in rows))
+            conn.execute("INSERT INTO tafsir_fts(tafsir_fts) VALUES ('optimize');")
+            conn.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);")
+            conn.executemany(
+                "INSERT INTO meta VALUES (?, ?);",
+                (("version", str(TAFASEER_INDEX_VERSION)), ("source_sha256", calculate_sha256(self.source)), *self.source_stat().items()),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+        os.replace(temp_path, self.path)
+        logger.info(f"Tafsir index of {self.category} built at {self.path} in {(time.perf_counter() - start) * 1000:.0f} ms.")
+
+    def search(self, words: List[str], prefix: bool = False, limit: int = MAX_HITS_PER_BOOK) -> List[TafsirHit]:
+        """Return the best ranked ayahs whose tafsir has the normalized words as a phrase, with their snippets."""
+        expression = quote_fts(" ".join(words)) + (" *" if prefix else "")
+        source = ReadOnlyConnections.get(self.source)
+        conn = sqlite3.connect(self.path.absolute().as_uri() + "?mode=ro", uri=True)
+        try:
+            rows = conn.execute(
+                "SELECT ayahs.number, ayahs.sura_number, ayahs.number_in_surah FROM tafsir_fts "
+                "JOIN ayahs ON ayahs.number = tafsir_fts.rowid WHERE tafsir_fts MATCH ? ORDER BY rank LIMIT ?;",
+                (expression, limit),
+            ).fetchall()
+            hits = []
+            for number, sura_number, number_in_surah in rows:
+                text = source.execute(f"SELECT text FROM tafsir_{sura_number} WHERE number = ?;", (number,)).fetchone()[0]
+                hits.append(TafsirHit(self.category, number, sura_number, number_in_surah, tafsir_snippet(text, words, prefix)))
+        finally:
+            conn.close()
+        logger.debug(f"Tafsir {self.category}: {len(hits)} hits for {expression}")
+        return hits
+
+    def __repr__(self) -> str:
+        return f"TafsirBookIndex(category={self.category}, path={self.path})"
+
+
+class TafaseerIndex:
+    """
+    Search engine over every installed tafsir.
+
+    Each book has its own index file, so update() only builds the indexes of the books
+    added or changed since the last time, and search() queries the books in parallel:
+    SQLite releases the GIL while it runs the queries. The books are only checked by
+    the first update() of each TafaseerIndex.
+    """
+
+    def __init__(self, folder: Path = None, source_folder: Path = TAFASEER_FOLDER):
+        self.folder = Path(folder or paths.tafaseer_index)
+        self.books = {
+            category: TafsirBookIndex(category, source, self.folder / f"{category}.db")
+            for category, source in installed_tafaseer(source_folder).items()
+        }
+        self.checked = False
+
+    def outdated(self) -> List[str]:
+        """Return the categories whose index is missing or out of date."""
+        return [category for category, book in self.books.items() if not book.is_current()]
+
+    def update(self, progress: Optional[Callable[[str], None]] = None) -> List[str]:
+        """Build the missing and out of date indexes, calling progress with each category first. Return the built categories."""
+        built = []
+        if self.checked:
+            return built
+        self.checked = True
+        for category in self.outdated():
+            if progress is not None:
+                progress(category)
+            try:
+                self.books[category].build()
+                built.append(category)
+            except (sqlite3.Error, OSError) as e:
+                logger.error(f"Could not index the tafsir {category}: {e}", exc_info=True)
+        return built
+
+    def search(self, text: str, prefix: bool = False, categories: Optional[List[str]] = None, limit: int = MAX_HITS_PER_BOOK) -> List[TafsirHit]:
+        """
+        Search the text, without tashkil and with folded hamzas, as a phrase in every indexed book,
+        or in the given categories. Return the hits of each book by rank, in the order of Category.
+        """
+        words = NON_LETTERS.sub(" ", normalize(text, True, True)).split()
+        books = [book for category, book in self.books.items() if (categories is None or category in categories) and book.path.is_file()]
+        if not words or not books:
+            return []
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=len(books), thread_name_prefix="TafaseerSearch") as executor:
+            results = list(executor.map(lambda book: self._search_book(book, words, prefix, limit), books))
+        hits = [hit for book_hits in results for hit in book_hits]
+        logger.info(f"Tafaseer search found {len(hits)} hits in {len(books)} books in {(time.perf_counter() - start) * 1000:.0f} ms.")
+        return hits
+
+    @staticmethod
+    def _search_book(book: TafsirBookIndex, words: List[str], prefix: bool, limit: int) -> List[TafsirHit]:
+        try:
+            return book.search(words, prefix, limit)
+        except sqlite3.Error as e:
+            logger.error(f"Search in the tafsir {book.category} failed: {e}", exc_info=True)
+            return []
+
+    def __repr__(self) -> str:
+        return f"TafaseerIndex(folder={self.folder}, books={list(self.books)})"
@@ -0,0 +1,14 @@
+# -*- coding: utf-8 -*-
+
+from enum import Enum
+
+
+class SearchMode(Enum):
+    TEXT = 0
+    QUERY = 1
+    ROOT = 2
+    APPROXIMATE = 3
+
+    @staticmethod
+    def from_int(value: int) -> "SearchMode":
+        return SearchMode(value)
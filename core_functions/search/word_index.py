@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+
+import re
+import time
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+from threading import Lock
+from typing import Dict, List, Optional, Set, Tuple, Union
+from utils.logger import LoggerManager
+from .normalizer import normalize
+from .normalized_verses import NormalizedVerses, VERSES_DB_PATH
+
+logger = LoggerManager.get_logger(__name__)
+
+WORD_PATTERN = re.compile(r"\S+")
+# A posting packs the ayah number and the offset of the word in the ayah in one uint32.
+OFFSET_BITS = 10
+OFFSET_MASK = (1 << OFFSET_BITS) - 1
+
+Span = Tuple[int, int]
+
+
+def make_snippet(text: str, spans: List[Span], context_words: int = 2) -> str:
+    """Return the words of the first match with a few words of context on both sides."""
+    if not spans:
+        return text
+    start, end = spans[0]
+    words_before = text[:start].split()
+    words_after = text[end:].split()
+    snippet = " ".join(words_before[-context_words:] + [text[start:end]] + words_after[:context_words])
+    if len(words_before) > context_words:
+        snippet = "..." + snippet
+    if len(words_after) > context_words:
+        snippet += "..."
+    return snippet
+
+
+class WordIndex:
+    """
+    In-memory positional inverted index of the words of the verses, for one normalization.
+
+    Every word of Verses.DB is normalized like the searched text and mapped to the sorted
+    postings of its occurrences (ayah number and word offset), so exact words, phrases and
+    prefixes are found without scanning the verses. Matches are returned as character
+    spans in the original text of each ayah, ready to be highlighted.
+    Indexes are built on first use and shared per (no_tashkil, no_hamza).
+    """
+    _instances: Dict[Tuple[bool, bool], "WordIndex"] = {}
+    _word_spans: Dict[int, array] = {}
+    _lock = Lock()
+
+    def __init__(self, no_tashkil: bool = False, no_hamza: bool = False, source: Path = VERSES_DB_PATH):
+        self.no_tashkil = no_tashkil
+        self.no_hamza = no_hamza
+        self.postings: Dict[str, array] = {}
+        start = time.perf_counter()
+
+        conn = NormalizedVerses.connect(source)
+        try:
+            rows = conn.execute("SELECT number, text FROM quran ORDER BY number;").fetchall()
+        finally:
+            conn.close()
+
+        build_spans = not self._word_spans
+        for number, text in rows:
+            spans = array("H") if build_spans else None
+            for offset, match in enumerate(WORD_PATTERN.finditer(text)):
+                token = normalize(match.group(), no_tashkil, no_hamza)
+                postings = self.postings.get(token)
+                if postings is None:
+                    postings = self.postings[token] = array("I")
+                postings.append(number << OFFSET_BITS | offset)
+                if build_spans:
+                    spans.extend(match.span())
+            if build_spans:
+                self._word_spans[number] = spans
+
+        self.vocabulary = sorted(self.postings)
+        logger.info(
+            f"Word index (no_tashkil={no_tashkil}, no_hamza={no_hamza}) built in {(time.perf_counter() - start) * 1000:.0f} ms, "
+            f"{len(self.vocabulary)} distinct words."
+        )
+
+    @classmethod
+    def load(cls, no_tashkil: bool = False, no_hamza: bool = False) -> "WordIndex":
+        """Return the shared index of the given normalization, building it on first use."""
+        key = (bool(no_tashkil), bool(no_hamza))
+        with cls._lock:
+            if key not in cls._instances:
+                cls._instances[key] = cls(*key)
+            return cls._instances[key]
+
+    def _prefix_postings(self, prefix: str) -> set:
+        postings = set()
+        index = bisect_left(self.vocabulary, prefix)
+        while index < len(self.vocabulary) and self.vocabulary[index].startswith(prefix):
+            postings.update(self.postings[self.vocabulary[index]])
+            index += 1
+        return postings
+
+    @staticmethod
+    def _contains(postings: Union[array, set], value: int) -> bool:
+        if isinstance(postings, set):
+            return value in postings
+        index = bisect_left(postings, value)
+        return index < len(postings) and postings[index] == value
+
+    def estimate(self, word: str, prefix: bool = False) -> int:
+        """Return the number of occurrences of the normalized word, or of the words it starts."""
+        if not prefix:
+            return len(self.postings.get(word, ()))
+        count = 0
+        index = bisect_left(self.vocabulary, word)
+        while index < len(self.vocabulary) and self.vocabulary[index].startswith(word):
+            count += len(self.postings[self.vocabulary[index]])
+            index += 1
+        return count
+
+    def find_phrase(self, words: List[str], prefix: bool = False, candidates: Optional[Set[int]] = None) -> Dict[int, List[Span]]:
+        """
+        Find the normalized words as a phrase, in order and next to each other, in the
+        candidate ayahs if given. With prefix=True the last word only has to start a word.
+        Return the (first, last) word offsets of the matches in each ayah, by ayah number.
+        """
+        if not words:
+            return {}
+
+        last = len(words) - 1
+        word_postings: List[Union[array, set]] = [
+            self._prefix_postings(word) if prefix and i == last else self.postings.get(word, ())
+            for i, word in enumerate(words)
+        ]
+        # Walk the rarest word and check that the others are at the expected offsets around it.
+        anchor = min(range(len(words)), key=lambda i: len(word_postings[i]))
+        anchor_postings = word_postings[anchor]
+        if isinstance(anchor_postings, set):
+            anchor_postings = sorted(anchor_postings)
+        others = [(i - anchor, word_postings[i]) for i in range(len(words)) if i != anchor]
+        contains = self._contains
+
+        matches: Dict[int, List[Span]] = {}
+        for posting in anchor_postings:
+            offset = (posting & OFFSET_MASK) - anchor
+            if offset < 0:
+                continue
+            number = posting >> OFFSET_BITS
+            if candidates is not None and number not in candidates:
+                continue
+            if others and not all(contains(postings, posting + shift) for shift, postings in others):
+                continue
+            if number in matches:
+                matches[number].append((offset, offset + last))
+            else:
+                matches[number] = [(offset, offset + last)]
+        return matches
+
+    def to_char_spans(self, number: int, word_spans: List[Span]) -> List[Span]:
+        """Convert (first, last) word offsets in the ayah to character spans in its text."""
+        spans = self._word_spans[number]
+        return [(spans[2 * first], spans[2 * last + 1]) for first, last in word_spans]
+
+    def find(self, text: str, prefix: bool = False) -> Dict[int, List[Span]]:
+        """
+        Find the words of the text as a phrase, in order and next to each other.
+        With prefix=True the last word only has to start a word of the ayah.
+        Return the character spans of the matches in each ayah, by ayah number.
+        """
+        words = normalize(text, self.no_tashkil, self.no_hamza).split()
+        return {
+            number: self.to_char_spans(number, word_spans)
+            for number, word_spans in self.find_phrase(words, prefix).items()
+        }
+
+    def __len__(self) -> int:
+        return len(self.vocabulary)
+
+    def __repr__(self) -> str:
+        return f"WordIndex(no_tashkil={self.no_tashkil}, no_hamza={self.no_hamza}, words={len(self)})"
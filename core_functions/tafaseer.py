@@ -1,6 +1,7 @@
 import sqlite3
 import os
 from exceptions.database import DBNotFoundError
+from utils.db_connections import ReadOnlyConnections
 from utils.logger import LoggerManager
 
 logger = LoggerManager.get_logger(__name__)
@@ -36,6 +37,14 @@ class Category:
     def get_categories_in_arabic(cls) -> list:
         return list(cls._category_in_arabic.keys())
 
+    @classmethod
+    def get_categories(cls) -> list:
+        return list(cls._category_in_arabic.values())
+
+    @classmethod
+    def get_arabic_name(cls, category: str) -> str:
+        return next((arabic_name for arabic_name, value in cls._category_in_arabic.items() if value == category), None)
+
 class TafaseerManager:
     def __init__(self) -> None:
         logger.debug("Initializing TafaseerManager...")
@@ -64,10 +73,9 @@ class TafaseerManager:
             logger.error(f"Database file not found: {file_path}")
             raise DBNotFoundError(file_path)
         
-        self._conn = sqlite3.connect(file_path)
-        self._conn.row_factory = sqlite3.Row 
+        self._conn = ReadOnlyConnections.get(file_path)
         self._cursor = self._conn.cursor()
-        logger.info(f"Database connection established successfully: {file_path}.")
+        logger.debug(f"Database connection established successfully: {file_path}.")
 
     def get_tafaseer(self, surah_number, ayah_number) -> str:
         """Fetch tafseer for a specific Surah and Ayah."""
@@ -106,10 +114,3 @@ class TafaseerManager:
 
     def __str__(self) -> str:
         return "Category: {}".format(self._tafaseer_category)
-
-    def __del__(self):
-        """Close the database connection when the object is deleted."""
-        logger.debug("Deleting TafaseerManager object and closing database connecting...")
-        if self._conn:
-            self._conn.close()
-            logger.info("Deleted TafaseerManager object Database connection closed.")          
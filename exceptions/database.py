@@ -16,3 +16,9 @@ class InvalidSearchTextError(BaseException):
     def __init__(self, search_text):
         super().__init__(f"Invalid search text: '{search_text}'", None, 104)
 
+
+class InvalidSearchQueryError(BaseException):
+    def __init__(self, query: str, reason: str, position: int = None):
+        self.reason = reason
+        self.position = position
+        super().__init__(f"Invalid search query '{query}': {reason}" + (f" (at position {position})" if position is not None else ""), None, 105)
@@ -236,10 +236,15 @@ class BookmarkDialog(QDialog):
             item = selected_items[0]
             bookmark = item.data(Qt.ItemDataRole.UserRole)
             logger.info(f"Navigating to bookmark: {bookmark['name']} (Ayah: {bookmark['ayah_number']})")
+            # Bookmarks saved before the surah columns were filled only have the ayah number.
+            ayah_number = None
+            if bookmark["surah_number"] is not None and bookmark["ayah_number_in_surah"] is not None:
+                ayah_number = self.parent.quran_manager.get_ayah_number(bookmark["surah_number"], bookmark["ayah_number_in_surah"])
+            ayah_number = ayah_number or bookmark["ayah_number"]
             self.parent.quran_manager.navigation_mode = NavigationMode.from_int(bookmark["criteria_number"])
-            ayah_result = self.parent.quran_manager.get_by_ayah_number(bookmark["ayah_number"])
+            ayah_result = self.parent.quran_manager.get_by_ayah_number(ayah_number)
             self.parent.quran_view.setText(ayah_result)
-            self.parent.set_focus_to_ayah(bookmark["ayah_number"])
+            self.parent.set_focus_to_ayah(ayah_number)
             self.parent.quran_view.setFocus()
             self.accept()
             Globals.effects_manager.play("move")
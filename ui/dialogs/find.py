@@ -14,13 +14,19 @@ from PyQt6.QtWidgets import (
     QCheckBox,
 QListWidget,
 QListWidgetItem,
+QListView,
 QMessageBox,
 )
-from PyQt6.QtCore import Qt, QRegularExpression, pyqtSignal
+from PyQt6.QtCore import Qt, QRegularExpression, QTimer, pyqtSignal
 from PyQt6.QtGui import QKeyEvent, QKeySequence,  QRegularExpressionValidator, QShortcut
-from core_functions.search import SearchCriteria, QuranSearchManager
+from core_functions.search import SearchCriteria, QuranSearchManager, SearchMode
+from exceptions.database import InvalidSearchQueryError
+from core_functions.search.morphology import MorphologyIndex
+from core_functions.search.live_search import LiveSearch
+from core_functions.search.result_cache import SearchResultCache
 from core_functions.quran.quran_manager import QuranManager
 from ui.widgets.search_box import ArabicSearchBox
+from ui.dialogs.search_results_model import SearchResultsModel, SearchResultsProxyModel, format_result, highlight
 from utils.settings import Config
 from utils.universal_speech import UniversalSpeech
 from utils.const import Globals
@@ -28,6 +34,9 @@ from utils.logger import LoggerManager
 
 logger = LoggerManager.get_logger(__name__)
 
+# Delay after the last keystroke before searching as you type, in milliseconds.
+LIVE_SEARCH_DELAY = 300
+
 class SearchDialog(QDialog):
     search_submitted = pyqtSignal(str)
     
@@ -37,9 +46,14 @@ class SearchDialog(QDialog):
         self.default_search_phrase = default_search_phrase
         self.setWindowTitle(title)
         self.resize(500, 400)
+        SearchResultCache.load().set_persistent(Config.search.remember_search_results)
         self.search_manager = QuranSearchManager()
         self.reset_search_options()
         self.criteria = None
+        self.live_search = LiveSearch()
+        self.live_generation = 0
+        self.live_results = []
+        self.live_matches = {}
         self.initUI()
         logger.debug(f"SearchDialog initialized with title: {title}.")
 
@@ -47,12 +61,41 @@ class SearchDialog(QDialog):
         self.search_label = QLabel('اكتب ما تريد البحث عنه:')
         self.search_box = ArabicSearchBox(self)
         self.search_box.setText(self.default_search_phrase)
-        regex = QRegularExpression("[\u0621-\u0652\u0670\u0671[:space:]]+")  # Arabic letters, hamzas, diacritics, and spaces.
-        validator = QRegularExpressionValidator(regex)
-        self.search_box.setValidator(validator)
         self.search_box.inputRejected.connect(QApplication.beep)
         self.search_box.textChanged.connect(self.OnEdit)
         self.search_box.setAccessibleName(self.search_label.text())
+        self.live_search_checkbox = QCheckBox('البحث أثناء الكتابة')
+        self.live_search_checkbox.setChecked(Config.search.search_as_you_type)
+        self.live_search_checkbox.toggled.connect(self.on_live_search_toggled)
+        self.live_search_timer = QTimer(self)
+        self.live_search_timer.setSingleShot(True)
+        self.live_search_timer.setInterval(LIVE_SEARCH_DELAY)
+        self.live_search_timer.timeout.connect(self.start_live_search)
+        self.live_results_label = QLabel('النتائج:')
+        self.live_results_list = QListWidget()
+        self.live_results_list.setAccessibleName(self.live_results_label.text())
+        self.live_results_list.itemActivated.connect(self.on_live_result_activated)
+        self.more_results_button = QPushButton('المزيد من النتائج')
+        self.more_results_button.setEnabled(False)
+        self.more_results_button.clicked.connect(self.live_search.fetch_more)
+        self.live_search.results_ready.connect(self.on_live_results)
+        self.live_search.page_ready.connect(self.on_live_page)
+        self.live_search.search_failed.connect(self.on_live_search_failed)
+        self.finished.connect(self.live_search.shutdown)
+        self.finished.connect(self.search_manager.result_cache.save)
+        self.search_mode_label = QLabel('طريقة البحث:')
+        self.search_mode_combobox = QComboBox()
+        self.search_mode_combobox.addItem('نص', SearchMode.TEXT)
+        self.search_mode_combobox.addItem('استعلام (AND، OR، NOT، NEAR/عدد، "عبارة"، كلمة*)', SearchMode.QUERY)
+        self.search_mode_combobox.addItem('بحث بالجذر (مثل: ر ح م)', SearchMode.ROOT)
+        self.search_mode_combobox.addItem('بحث تقريبي (يتجاوز الأخطاء الإملائية)', SearchMode.APPROXIMATE)
+        if MorphologyIndex.load() is None:
+            # The morphology index is built offline and is not available in every installation.
+            root_index = self.search_mode_combobox.findData(SearchMode.ROOT)
+            self.search_mode_combobox.model().item(root_index).setEnabled(False)
+        self.search_mode_combobox.setAccessibleName(self.search_mode_label.text())
+        self.search_mode_combobox.currentIndexChanged.connect(self.on_search_mode_changed)
+        self.on_search_mode_changed()
         self.advanced_search_checkbox = QCheckBox('البحث المتقدم')
         self.advanced_search_checkbox.toggled.connect(self.show_advanced_options)
         self.search_button = QPushButton('بحث')
@@ -109,8 +152,14 @@ class SearchDialog(QDialog):
         main_layout = QVBoxLayout()
         main_layout.addWidget(self.search_label)
         main_layout.addWidget(self.search_box)
+        main_layout.addWidget(self.search_mode_label)
+        main_layout.addWidget(self.search_mode_combobox)
+        main_layout.addWidget(self.live_search_checkbox)
         main_layout.addWidget(self.advanced_search_checkbox)
         main_layout.addWidget(self.advanced_search_groupbox)
+        main_layout.addWidget(self.live_results_label)
+        main_layout.addWidget(self.live_results_list)
+        main_layout.addWidget(self.more_results_button)
         main_layout.addWidget(self.search_button)
         main_layout.addWidget(self.cancel_button)
 
@@ -133,11 +182,90 @@ class SearchDialog(QDialog):
         close_shortcut.activated.connect(self.reject)
 
         self.on_radio_toggled()
+        self.on_live_search_toggled()
         self.OnEdit()
 
     def OnEdit(self):
         self.search_button.setEnabled(bool(self.search_box.text()))
         logger.debug(f"User edited search box: {self.search_box.text()}.")
+        if self.live_search_checkbox.isChecked():
+            self.live_search_timer.start()
+
+    def on_live_search_toggled(self):
+        enabled = self.live_search_checkbox.isChecked()
+        self.live_results_label.setVisible(enabled)
+        self.live_results_list.setVisible(enabled)
+        self.more_results_button.setVisible(enabled)
+        if enabled:
+            self.live_search_timer.start()
+        else:
+            self.live_search_timer.stop()
+            self.live_search.cancel()
+        logger.debug(f"Search as you type {'enabled' if enabled else 'disabled'}.")
+
+    def start_live_search(self):
+        search_text = self.search_box.text()
+        self.live_results = []
+        self.live_results_list.clear()
+        self.more_results_button.setEnabled(False)
+        if not search_text:
+            self.live_search.cancel()
+            self.live_results_label.setText('النتائج:')
+            return
+
+        self.set_options_search()
+        self.search_manager.mode = self.search_mode_combobox.currentData()
+        settings = self.search_manager.settings()
+        # While typing, the last word of a whole word search is not complete yet.
+        prefix = settings["mode"] == SearchMode.TEXT and settings["match_whole_word"]
+        self.live_generation = self.live_search.search(search_text, settings, prefix)
+        self.live_results_label.setText('جارٍ البحث...')
+
+    def on_live_results(self, generation: int, rows: list, matches: dict, groups: dict, has_more: bool):
+        if generation != self.live_generation:
+            return
+        self.live_results = []
+        self.live_matches = matches
+        self.live_results_list.clear()
+        self.add_live_results(rows, has_more)
+
+    def on_live_page(self, generation: int, rows: list, has_more: bool):
+        if generation == self.live_generation:
+            self.add_live_results(rows, has_more)
+
+    def add_live_results(self, rows: list, has_more: bool):
+        for row in rows:
+            item = QListWidgetItem(format_result(row, self.live_matches.get(row["number"])))
+            item.setToolTip(highlight(row["text"], self.live_matches.get(row["number"], [])))
+            self.live_results_list.addItem(item)
+        self.live_results.extend(rows)
+        self.more_results_button.setEnabled(has_more)
+        if has_more:
+            self.live_results_label.setText("النتائج: عرض أول {} نتيجة.".format(len(self.live_results)))
+        else:
+            self.live_results_label.setText("عدد النتائج: {}.".format(len(self.live_results)))
+        logger.debug(f"Search as you type: {len(self.live_results)} results shown, more: {has_more}.")
+
+    def on_live_search_failed(self, generation: int, reason: str):
+        if generation == self.live_generation:
+            self.live_results_label.setText(f"{reason}.")
+
+    def on_live_result_activated(self, item: QListWidgetItem):
+        self.go_to_result(self.live_results[self.live_results_list.row(item)])
+
+    def on_search_mode_changed(self):
+        if self.search_mode_combobox.currentData() == SearchMode.QUERY:
+            # Arabic letters, diacritics and spaces, plus the operators, quotes, parentheses, "*", "/" and distances.
+            regex = QRegularExpression('[\u0621-\u0652\u0670\u0671[:space:]A-Za-z0-9"()*/]+')
+        elif self.search_mode_combobox.currentData() == SearchMode.ROOT:
+            # Arabic letters, hamzas and the separators between the letters of the root.
+            regex = QRegularExpression("[\u0621-\u064A\u0640[:space:]-]+")
+        else:
+            regex = QRegularExpression("[\u0621-\u0652\u0670\u0671[:space:]]+")  # Arabic letters, hamzas, diacritics, and spaces.
+        self.search_box.setValidator(QRegularExpressionValidator(regex, self.search_box))
+        if self.live_search_checkbox.isChecked():
+            self.live_search_timer.start()
+        logger.debug(f"Search mode changed to: {self.search_mode_combobox.currentData()}.")
 
     def show_advanced_options(self):
         enabled = self.advanced_search_checkbox.isChecked()
@@ -149,10 +277,24 @@ class SearchDialog(QDialog):
     def on_submit(self):
         logger.debug("Search button clicked.")
         self.set_options_search()
+        self.search_manager.mode = self.search_mode_combobox.currentData()
         search_text = self.search_box. text()
         self.search_submitted.emit(search_text)
         logger.debug(f"Searching for: {search_text}")
-        search_result = self.search_manager.search(search_text)
+        try:
+            search_result = self.search_manager.search(search_text)
+        except InvalidSearchQueryError as e:
+            logger.warning(f"Invalid search query: {e}")
+            msg_box = QMessageBox(self)
+            msg_box.setIcon(QMessageBox.Icon.Warning)
+            msg_box.setWindowTitle("استعلام غير صالح")
+            msg_box.setText(f"{e.reason}.")
+            msg_box.addButton("موافق", QMessageBox.ButtonRole.AcceptRole)
+            msg_box.exec()
+            if e.position is not None:
+                self.search_box.setCursorPosition(e.position)
+            self.search_box.setFocus()
+            return
         if not search_result:
             logger.warning(f"No results found for '{search_text}'.")
             msg_box = QMessageBox(self)
@@ -165,20 +307,23 @@ class SearchDialog(QDialog):
 
             return
         logger.info(f"Search successful. {len(search_result)} results found.")
-        result_dialog = SearchResultsDialog(self, search_result)
+        result_dialog = SearchResultsDialog(self, search_result, self.search_manager.matches, self.search_manager.groups)
         if result_dialog.exec():
-            selected_result = result_dialog.list_widget.currentRow()
-            selected_result = search_result[selected_result]
-            ayah_number = selected_result["number"]
-            self.parent.quran_manager.navigation_mode = self.parent.get_valid_navigation_mode()
-            ayah_result = self.parent.quran_manager.get_by_ayah_number(ayah_number)
-            logger.info(f"User selected result {selected_result}")
-            self.parent.quran_view.setText(ayah_result)
-            self.parent.set_focus_to_ayah(ayah_number)
-            self.parent.quran_view.setFocus()
-            logger.info(f"Moved to Ayah: {selected_result['numberInSurah']} in Surah: {selected_result['sura_name']}")
-            self.accept()
-            self.deleteLater()
+            selected_result = result_dialog.current_result()
+            if selected_result is not None:
+                self.go_to_result(selected_result)
+
+    def go_to_result(self, selected_result):
+        ayah_number = selected_result["number"]
+        self.parent.quran_manager.navigation_mode = self.parent.get_valid_navigation_mode()
+        ayah_result = self.parent.quran_manager.get_by_ayah_number(ayah_number)
+        logger.info(f"User selected result {selected_result}")
+        self.parent.quran_view.setText(ayah_result)
+        self.parent.set_focus_to_ayah(ayah_number)
+        self.parent.quran_view.setFocus()
+        logger.info(f"Moved to Ayah: {selected_result['numberInSurah']} in Surah: {selected_result['sura_name']}")
+        self.accept()
+        self.deleteLater()
 
     def on_radio_toggled(self):
         logger.debug(f"Radio button toggled. Selected: {self.sender().text()}")
@@ -241,22 +386,45 @@ _to=search_to
     
     
 class SearchResultsDialog(QDialog):
-    def __init__(self, parent=None, search_result=[]):
+    def __init__(self, parent=None, search_result=[], matches: dict = None, groups: dict = None):
         super().__init__(parent)
-        self.search_result = search_result
+        self.groups = groups or {}
         self.setWindowTitle("نتائج البحث")
         logger.debug(f"SearchResultsDialog opened with {len(search_result)} results.")
+        self.model = SearchResultsModel.from_rows(self, search_result, matches or {})
+        self.proxy_model = SearchResultsProxyModel(self)
+        self.proxy_model.setSourceModel(self.model)
         self.total_label = QLabel("عدد النتائج: {}.".format(len(search_result)))
+        self.form_label = QLabel("الصيغة:")
+        self.form_combobox = QComboBox()
+        self.form_combobox.setAccessibleName(self.form_label.text())
+        if self.groups:
+            # Derived forms of a root search, from the most frequent.
+            self.form_combobox.addItem("كل الصيغ ({})".format(sum(len(numbers) for numbers in self.groups.values())), None)
+            for form, numbers in self.groups.items():
+                self.form_combobox.addItem("{} ({})".format(form, len(numbers)), form)
+        self.form_combobox.currentIndexChanged.connect(self.on_filter_changed)
+        self.sura_label = QLabel("السورة:")
+        self.sura_combobox = QComboBox()
+        self.sura_combobox.setAccessibleName(self.sura_label.text())
+        self.sura_combobox.addItem("كل السور ({})".format(len(search_result)), None)
+        sura_names = self.model.sura_names()
+        for sura_number, count in self.model.sura_counts().items():
+            self.sura_combobox.addItem("{} ({})".format(sura_names[sura_number], count), sura_number)
+        self.sura_combobox.currentIndexChanged.connect(self.on_filter_changed)
+        self.sort_label = QLabel("الترتيب:")
+        self.sort_combobox = QComboBox()
+        self.sort_combobox.setAccessibleName(self.sort_label.text())
+        self.sort_combobox.addItem("ترتيب النتائج", SearchResultsModel.OrderRole)
+        self.sort_combobox.addItem("ترتيب المصحف", SearchResultsModel.NumberRole)
+        self.sort_combobox.currentIndexChanged.connect(self.on_sort_changed)
         self.label = QLabel("النتائج:")
-        self.list_widget = QListWidget(self)
-        self.list_widget.setAccessibleDescription(self.label.text())
-
-        for i, row in enumerate(search_result):
-            item = QListWidgetItem(self.format_result(row))
-            item.setData(Qt.ItemDataRole.AccessibleDescriptionRole, f"{i+1} من {len(search_result)}")
-            item.setToolTip(row["text"])
-            self.list_widget.addItem(item)
-            
+        self.list_view = QListView(self)
+        self.list_view.setAccessibleDescription(self.label.text())
+        # Rows are formatted on demand, a uniform height spares the view from measuring every one.
+        self.list_view.setUniformItemSizes(True)
+        self.list_view.setModel(self.proxy_model)
+
         self.go_to_button = QPushButton("الذهاب للنتيجة")
         self.go_to_button.clicked.connect(self.accept)
         self.go_to_button.clicked.connect(lambda: Globals.effects_manager.play("move"))
@@ -266,26 +434,44 @@ class SearchResultsDialog(QDialog):
         close_shortcut = QShortcut(QKeySequence("Ctrl+F4"), self)
         close_shortcut.activated.connect(self.reject)
 
+        options_layout = QHBoxLayout()
+        options_layout.addWidget(self.sura_label)
+        options_layout.addWidget(self.sura_combobox)
+        options_layout.addWidget(self.sort_label)
+        options_layout.addWidget(self.sort_combobox)
 
         layout = QVBoxLayout()
         layout.addWidget(self.total_label)
+        if self.groups:
+            layout.addWidget(self.form_label)
+            layout.addWidget(self.form_combobox)
+        layout.addLayout(options_layout)
         layout.addWidget(self.label)
-        layout.addWidget(self.list_widget)
+        layout.addWidget(self.list_view)
         layout.addWidget(self.go_to_button)
         layout.addWidget(self.cancel_button)
         
         self.setLayout(layout)
-        self.list_widget.setCurrentRow(0)
+        self.list_view.setCurrentIndex(self.proxy_model.index(0, 0))
         logger.debug("SearchResultsDialog initialized successfully.")
 
-    def format_result(self, row:dict) -> str:
-        text = row["text"]
-        # take first 5 words from text
-        words = text.split()
-        text = " ".join(words[:5])
-        text += "..." if len(words) > 5 else ""
+    def on_filter_changed(self):
+        form = self.form_combobox.currentData()
+        sura_number = self.sura_combobox.currentData()
+        self.proxy_model.set_numbers_filter(None if form is None else set(self.groups[form]))
+        self.proxy_model.set_sura_filter(sura_number)
+        self.total_label.setText("عدد النتائج: {}.".format(self.proxy_model.rowCount()))
+        self.list_view.setCurrentIndex(self.proxy_model.index(0, 0))
+        self.go_to_button.setEnabled(self.proxy_model.rowCount() > 0)
+        logger.debug(f"Results filtered by form: {form}, surah: {sura_number}, {self.proxy_model.rowCount()} results.")
+
+    def on_sort_changed(self):
+        self.proxy_model.sort_by(self.sort_combobox.currentData())
+        self.list_view.setCurrentIndex(self.proxy_model.index(0, 0))
+        logger.debug(f"Results sorted by: {self.sort_combobox.currentText()}")
 
-        return "{} | الآية {} من {}".format(text, row["numberInSurah"], row["sura_name"])
+    def current_result(self):
+        return self.list_view.currentIndex().data(SearchResultsModel.RowRole)
 
     def keyPressEvent(self, event: QKeyEvent | None) -> None:
 
@@ -293,10 +479,10 @@ class SearchResultsDialog(QDialog):
             UniversalSpeech.say(self.total_label.text(), force=True)
             logger.debug("Ctrl+I pressed: Announcing total results count.")
         elif event.key() == Qt.Key.Key_R and event.modifiers() == Qt.KeyboardModifier.ControlModifier:
-            current_row = self.list_widget.currentRow()
-            text = self.search_result[current_row]["text"]
-            UniversalSpeech.say(text, force=True)
-            logger.debug(f"Ctrl+R pressed: Reading search result at index {current_row}.")
+            current_result = self.current_result()
+            if current_result is not None:
+                UniversalSpeech.say(current_result["text"], force=True)
+                logger.debug(f"Ctrl+R pressed: Reading search result at index {self.list_view.currentIndex().row()}.")
         return super().keyPressEvent(event)
 
     def reject(self):
@@ -0,0 +1,177 @@
+import html
+import sqlite3
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex, QObject, QSortFilterProxyModel
+from core_functions.search.normalized_verses import NormalizedVerses
+from core_functions.search.word_index import Span, make_snippet
+from utils.logger import LoggerManager
+
+logger = LoggerManager.get_logger(__name__)
+
+# Rows of the visible ayahs are read on demand and the most recent ones kept.
+ROW_CACHE_SIZE = 512
+
+
+class SearchResultRecord(NamedTuple):
+    number: int
+    sura_number: int
+    spans: Optional[List[Span]]
+
+
+def format_result(row: dict, spans: list = None) -> str:
+    text = row["text"]
+    if spans:
+        # show the first match with two words around it
+        text = make_snippet(text, spans)
+    else:
+        # take first 5 words from text
+        words = text.split()
+        text = " ".join(words[:5])
+        text += "..." if len(words) > 5 else ""
+
+    return "{} | الآية {} من {}".format(text, row["numberInSurah"], row["sura_name"])
+
+
+def highlight(text: str, spans: list) -> str:
+    """Return the text as rich text with the matched words in bold."""
+    if not spans:
+        return text
+    parts = []
+    position = 0
+    for start, end in spans:
+        parts.append(html.escape(text[position:start]))
+        parts.append(f"<b>{html.escape(text[start:end])}</b>")
+        position = end
+    parts.append(html.escape(text[position:]))
+    return "<p>{}</p>".format("".join(parts))
+
+
+class SearchResultsModel(QAbstractListModel):
+    """
+    Model of the search results for a QListView.
+
+    Only a SearchResultRecord is kept per result. The row of an ayah is read from the
+    normalized verses and formatted when the view asks for it, so opening thousands of
+    results costs no more than the rows on screen.
+    """
+
+    RecordRole = Qt.ItemDataRole.UserRole
+    RowRole = Qt.ItemDataRole.UserRole + 1
+    NumberRole = Qt.ItemDataRole.UserRole + 2
+    SuraRole = Qt.ItemDataRole.UserRole + 3
+    OrderRole = Qt.ItemDataRole.UserRole + 4
+
+    def __init__(self, parent: QObject, records: List[SearchResultRecord]):
+        super().__init__(parent)
+        self._records = records
+        self._rows: "OrderedDict[int, sqlite3.Row]" = OrderedDict()
+        self._conn = NormalizedVerses.connect()
+        self._conn.row_factory = sqlite3.Row
+
+    @classmethod
+    def from_rows(cls, parent: QObject, rows: Iterable, matches: Dict[int, List[Span]]) -> "SearchResultsModel":
+        records = [SearchResultRecord(row["number"], row["sura_number"], matches.get(row["number"])) for row in rows]
+        return cls(parent, records)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return len(self._records)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+
+        row = index.row()
+        if row < 0 or row >= len(self._records):
+            return None
+
+        record = self._records[row]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return format_result(self.get_row(record.number), record.spans)
+
+        elif role == Qt.ItemDataRole.ToolTipRole:
+            return highlight(self.get_row(record.number)["text"], record.spans or [])
+
+        elif role == self.RecordRole:
+            return record
+
+        elif role == self.RowRole:
+            return self.get_row(record.number)
+
+        elif role == self.NumberRole:
+            return record.number
+
+        elif role == self.SuraRole:
+            return record.sura_number
+
+        elif role == self.OrderRole:
+            return row
+
+        return None
+
+    def get_row(self, number: int) -> sqlite3.Row:
+        row = self._rows.get(number)
+        if row is None:
+            row = self._conn.execute("SELECT * FROM quran WHERE number = ?;", (number,)).fetchone()
+            self._rows[number] = row
+            if len(self._rows) > ROW_CACHE_SIZE:
+                self._rows.popitem(last=False)
+        else:
+            self._rows.move_to_end(number)
+        return row
+
+    def sura_counts(self) -> Dict[int, int]:
+        """Return the number of results of each surah, in the order of the mushaf."""
+        counts: Dict[int, int] = {}
+        for record in sorted(self._records):
+            counts[record.sura_number] = counts.get(record.sura_number, 0) + 1
+        return counts
+
+    def sura_names(self) -> Dict[int, str]:
+        return dict(self._conn.execute("SELECT DISTINCT sura_number, sura_name FROM quran;").fetchall())
+
+
+class SearchResultsProxyModel(QSortFilterProxyModel):
+    """Sorts the search results and filters them by surah or by a set of ayah numbers, without touching the source model."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.sura_filter: Optional[int] = None
+        self.numbers_filter: Optional[Set[int]] = None
+        self.setSortRole(SearchResultsModel.OrderRole)
+
+    def set_sura_filter(self, sura_number: Optional[int]):
+        self.sura_filter = sura_number
+        self.invalidateFilter()
+
+    def set_numbers_filter(self, numbers: Optional[Set[int]]):
+        self.numbers_filter = numbers
+        self.invalidateFilter()
+
+    def sort_by(self, role: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder):
+        self.setSortRole(role)
+        self.sort(0, order)
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        source_model = self.sourceModel()
+        if not source_model or (self.sura_filter is None and self.numbers_filter is None):
+            return True
+
+        index = source_model.index(source_row, 0, source_parent)
+        if self.sura_filter is not None and index.data(SearchResultsModel.SuraRole) != self.sura_filter:
+            return False
+
+        if self.numbers_filter is not None and index.data(SearchResultsModel.NumberRole) not in self.numbers_filter:
+            return False
+
+        return True
+
+    def lessThan(self, left: QModelIndex, right: QModelIndex) -> bool:
+        role = self.sortRole()
+        # Ties keep the order of the results.
+        return (left.data(role), left.row()) < (right.data(role), right.row())
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if role == Qt.ItemDataRole.AccessibleDescriptionRole and index.isValid():
+            return f"{index.row() + 1} من {self.rowCount()}"
+        return super().data(index, role)
@@ -388,10 +388,14 @@ class SettingsDialog(QDialog):
         self.ignore_tashkeel_checkbox = QCheckBox("تجاهل التشكيل")
         self.ignore_hamza_checkbox = QCheckBox("تجاهل الهمزات")
         self.match_whole_word_checkbox = QCheckBox("تطابق الكلمة بأكملها")
+        self.search_as_you_type_checkbox = QCheckBox("البحث أثناء الكتابة")
+        self.remember_search_results_checkbox = QCheckBox("حفظ نتائج آخر عمليات البحث بين الجلسات")
 
         self.group_search_layout.addWidget(self.ignore_tashkeel_checkbox)
         self.group_search_layout.addWidget(self.ignore_hamza_checkbox)
         self.group_search_layout.addWidget(self.match_whole_word_checkbox)
+        self.group_search_layout.addWidget(self.search_as_you_type_checkbox)
+        self.group_search_layout.addWidget(self.remember_search_results_checkbox)
         self.group_search_layout.addSpacerItem(QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding))
         self.group_search.setLayout(self.group_search_layout)
 
@@ -649,6 +653,8 @@ class SettingsDialog(QDialog):
         Config.search.ignore_tashkeel = self.ignore_tashkeel_checkbox.isChecked()
         Config.search.ignore_hamza = self.ignore_hamza_checkbox.isChecked()
         Config.search.match_whole_word = self.match_whole_word_checkbox.isChecked()
+        Config.search.search_as_you_type = self.search_as_you_type_checkbox.isChecked()
+        Config.search.remember_search_results = self.remember_search_results_checkbox.isChecked()
 
         # Save settings to file
         logger.debug("Saving settings to configuration file.")
@@ -705,6 +711,8 @@ class SettingsDialog(QDialog):
         self.ignore_tashkeel_checkbox.setChecked(Config.search.ignore_tashkeel)
         self.ignore_hamza_checkbox.setChecked(Config.search.ignore_hamza)
         self.match_whole_word_checkbox.setChecked(Config.search.match_whole_word)
+        self.search_as_you_type_checkbox.setChecked(Config.search.search_as_you_type)
+        self.remember_search_results_checkbox.setChecked(Config.search.remember_search_results)
 
         combo_config = [
             (self.log_levels_combo, Config.general.log_level),
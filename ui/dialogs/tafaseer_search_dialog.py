@@ -0,0 +1,157 @@
+from typing import List, Optional
+from PyQt6.QtWidgets import (
+    QDialog,
+    QVBoxLayout,
+    QHBoxLayout,
+    QLabel,
+    QPushButton,
+    QComboBox,
+    QListWidget,
+    QListWidgetItem,
+)
+from PyQt6.QtCore import Qt, QThread, pyqtSignal
+from PyQt6.QtGui import QKeySequence, QShortcut
+from core_functions.tafaseer import Category
+from core_functions.search.tafaseer_index import TafaseerIndex, TafsirHit
+from ui.dialogs.tafaseer_Dialog import TafaseerDialog
+from ui.widgets.search_box import ArabicSearchBox
+from utils.universal_speech import UniversalSpeech
+from utils.logger import LoggerManager
+
+logger = LoggerManager.get_logger(__name__)
+
+
+class TafaseerSearchWorker(QThread):
+    """Brings the indexes of the installed tafaseer up to date, then searches them."""
+    index_progress = pyqtSignal(str)
+    results_ready = pyqtSignal(list)
+
+    def __init__(self, index: TafaseerIndex, search_text: str, categories: Optional[List[str]] = None):
+        super().__init__()
+        self.index = index
+        self.search_text = search_text
+        self.categories = categories
+
+    def run(self):
+        self.index.update(self.index_progress.emit)
+        self.results_ready.emit(self.index.search(self.search_text, categories=self.categories))
+
+
+class TafaseerSearchDialog(QDialog):
+    def __init__(self, parent, title: str):
+        super().__init__(parent)
+        self.parent = parent
+        self.setWindowTitle(title)
+        self.resize(600, 450)
+        self.index = TafaseerIndex()
+        self.hits: List[TafsirHit] = []
+        self.worker = None
+
+        self.search_label = QLabel("اكتب ما تريد البحث عنه في التفاسير:")
+        self.search_box = ArabicSearchBox(self)
+        self.search_box.setAccessibleName(self.search_label.text())
+        self.search_box.textChanged.connect(self.OnEdit)
+        self.search_box.returnPressed.connect(self.on_submit)
+
+        self.category_label = QLabel("التفسير:")
+        self.category_combobox = QComboBox()
+        self.category_combobox.setAccessibleName(self.category_label.text())
+        self.category_combobox.addItem("كل التفاسير", None)
+        for category in self.index.books:
+            self.category_combobox.addItem(Category.get_arabic_name(category), category)
+
+        self.search_button = QPushButton("بحث")
+        self.search_button.setEnabled(False)
+        self.search_button.clicked.connect(self.on_submit)
+
+        self.status_label = QLabel("النتائج:")
+        self.results_list = QListWidget(self)
+        self.results_list.setAccessibleName(self.status_label.text())
+        self.results_list.itemActivated.connect(self.open_tafsir)
+
+        self.open_button = QPushButton("فتح التفسير")
+        self.open_button.setEnabled(False)
+        self.open_button.clicked.connect(self.open_tafsir)
+        self.close_button = QPushButton("إغلاق")
+        self.close_button.setShortcut(QKeySequence("Ctrl+W"))
+        self.close_button.clicked.connect(self.reject)
+        close_shortcut = QShortcut(QKeySequence("Ctrl+F4"), self)
+        close_shortcut.activated.connect(self.reject)
+
+        category_layout = QHBoxLayout()
+        category_layout.addWidget(self.category_label)
+        category_layout.addWidget(self.category_combobox)
+
+        buttons_layout = QHBoxLayout()
+        buttons_layout.addWidget(self.open_button)
+        buttons_layout.addWidget(self.close_button)
+
+        layout = QVBoxLayout()
+        layout.addWidget(self.search_label)
+        layout.addWidget(self.search_box)
+        layout.addLayout(category_layout)
+        layout.addWidget(self.search_button)
+        layout.addWidget(self.status_label)
+        layout.addWidget(self.results_list)
+        layout.addLayout(buttons_layout)
+        self.setLayout(layout)
+        logger.debug(f"TafaseerSearchDialog initialized with {len(self.index.books)} installed tafaseer.")
+
+    def OnEdit(self):
+        self.search_button.setEnabled(bool(self.search_box.text()) and self.worker is None)
+
+    def on_submit(self):
+        search_text = self.search_box.text()
+        if not search_text or self.worker is not None:
+            return
+        category = self.category_combobox.currentData()
+        logger.debug(f"Searching the tafaseer for: {search_text}, category: {category}")
+        self.search_button.setEnabled(False)
+        self.status_label.setText("جارٍ البحث...")
+        self.worker = TafaseerSearchWorker(self.index, search_text, [category] if category else None)
+        self.worker.index_progress.connect(self.on_index_progress)
+        self.worker.results_ready.connect(self.on_results)
+        self.worker.start()
+
+    def on_index_progress(self, category: str):
+        message = f"جارٍ فهرسة تفسير {Category.get_arabic_name(category)}..."
+        self.status_label.setText(message)
+        UniversalSpeech.say(message)
+
+    def on_results(self, hits: list):
+        self.worker.wait()
+        self.worker = None
+        self.OnEdit()
+        self.hits = hits
+        self.results_list.clear()
+        for i, hit in enumerate(hits):
+            item = QListWidgetItem(self.format_hit(hit))
+            item.setData(Qt.ItemDataRole.AccessibleDescriptionRole, f"{i + 1} من {len(hits)}")
+            self.results_list.addItem(item)
+        self.open_button.setEnabled(bool(hits))
+        self.status_label.setText("عدد النتائج: {}.".format(len(hits)) if hits else "لا توجد نتائج متاحة لبحثك.")
+        UniversalSpeech.say(self.status_label.text())
+        if hits:
+            self.results_list.setCurrentRow(0)
+            self.results_list.setFocus()
+        logger.info(f"Tafaseer search returned {len(hits)} hits.")
+
+    def format_hit(self, hit: TafsirHit) -> str:
+        sura_name = self.parent.quran_manager.corpus.sura_names[hit.sura_number]
+        return "{} | {}، الآية {} من {}".format(hit.snippet, Category.get_arabic_name(hit.category), hit.number_in_surah, sura_name)
+
+    def open_tafsir(self):
+        row = self.results_list.currentRow()
+        if not 0 <= row < len(self.hits):
+            return
+        hit = self.hits[row]
+        ayah = self.parent.quran_manager.corpus.get_range(hit.number, hit.number)[0]
+        title = "تفسير آية {} من {}".format(ayah.number_in_surah, ayah.sura_name)
+        logger.debug(f"Opening TafaseerDialog for hit: {hit}")
+        dialog = TafaseerDialog(self, title, ayah, Category.get_arabic_name(hit.category))
+        dialog.exec()
+
+    def reject(self):
+        if self.worker is not None:
+            self.worker.wait()
+        super().reject()
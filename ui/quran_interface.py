@@ -25,7 +25,7 @@ from core_functions.quran.quran_manager import QuranManager
 from core_functions.quran.formatter import FormatterOptions
 from core_functions.quran.types import QuranFontType, NavigationMode, Ayah, MarksType
 from core_functions.tafaseer import Category
-from core_functions.info import MoshafInfo, E3rab, TanzilAyah, AyaInfo, SuraInfo, JuzInfo, HizbInfo, QuarterInfo, PageInfo
+from core_functions.info import MoshafInfo, E3rab, TanzilAyah, AyaInfo, SuraInfo, JuzInfo, HizbInfo, QuarterInfo, PageInfo, UnitStatistics, WordConcordance, SimilarVerses
 from core_functions.bookmark import BookmarkManager
 from ui.dialogs.quick_access import QuickAccess
 from ui.dialogs.find import SearchDialog
@@ -33,6 +33,7 @@ from ui.widgets.button import EnterButton
 from ui.widgets.menu_bar import MenuBar
 from ui.widgets.qText_edit import QuranViewer
 from ui.dialogs.tafaseer_Dialog import TafaseerDialog
+from ui.dialogs.tafaseer_search_dialog import TafaseerSearchDialog
 from ui.dialogs.info_dialog import InfoDialog
 from ui.dialogs.custom_range import CustomRangeDialog
 from ui.sura_player_ui.sura_player_ui import SuraPlayerWindow
@@ -211,13 +212,14 @@ class QuranInterface(QMainWindow):
         logger.debug(f"Setting focus to Ayah number: {ayah_number}")
         if ayah_number == -1:
             logger.debug("Setting focus to the end of the text.")
-            text_position = len(self.quran_view.toPlainText())
+            text_position = self.quran_view.text_length()
         else:
             text_position = self.quran_manager.view_content.get_by_ayah_number(ayah_number).first_position
         logger.debug(f"Text position: {text_position}")
 
+        document_position = self.quran_view.to_document_position(text_position)
         cursor = QTextCursor(self.quran_view.document())
-        cursor.setPosition(text_position)
+        cursor.setPosition(document_position)
         self.quran_view.setTextCursor(cursor)
         logger.debug("Focus set successfully.")
 
@@ -311,10 +313,14 @@ class QuranInterface(QMainWindow):
             logger.debug("Search dialog accepted.")
             self.set_text_ctrl_label()
 
+    def OnSearchTafaseer(self, event=None):
+        logger.debug("Search in tafaseer clicked.")
+        TafaseerSearchDialog(self, "البحث في التفاسير").exec()
+
     def get_current_ayah(self) -> Ayah:
         logger.debug("Getting current Ayah info.")
         current_line = self.quran_view.textCursor().block()
-        position = current_line.position()
+        position = self.quran_view.to_text_position(current_line.position())
         ayah = self.quran_manager.view_content.get_by_position(position)
         logger.debug(f"Retrieved current Ayah: {ayah.number}")
         return ayah
@@ -355,6 +361,7 @@ class QuranInterface(QMainWindow):
         get_quarter_info = info_menu.addAction("معلومات الربع")
         get_page_info = info_menu.addAction("معلومات الصفحة")
         get_moshaf_info = info_menu.addAction("معلومات المصحف")
+        word_concordance = info_menu.addAction("سياقات كلمة")
 
         get_moshaf_info.triggered.connect(self.OnMoshafInfo)
         get_sura_info.triggered.connect(self.OnSurahInfo)
@@ -363,6 +370,7 @@ class QuranInterface(QMainWindow):
         get_quarter_info.triggered.connect(self.OnQuarterInfo)
         get_page_info.triggered.connect(self.OnPageInfo)
         ayah_info.triggered.connect(self.OnAyahInfo)
+        word_concordance.triggered.connect(self.OnWordConcordance)
 
         get_interpretation_verse = menu.addAction("تفسير الآية")
         get_interpretation_verse.triggered.connect(self.OnInterpretation)
@@ -382,6 +390,8 @@ class QuranInterface(QMainWindow):
         get_verse_syntax.triggered.connect(self.OnSyntax)
         get_verse_reasons = menu.addAction("أسباب نزول الآية")
         get_verse_reasons.triggered.connect(self.OnVerseReasons)
+        get_similar_verses = menu.addAction("الآيات المتشابهة")
+        get_similar_verses.triggered.connect(self.OnSimilarVerses)
         copy_verse = menu.addAction("نسخ الآية")
         copy_verse.triggered.connect(self.on_copy_verse)
 
@@ -395,6 +405,7 @@ class QuranInterface(QMainWindow):
             ayah_info.setEnabled(False)
             get_verse_syntax.setEnabled(False)
             get_verse_reasons.setEnabled(False)
+            get_similar_verses.setEnabled(False)
 
         menu.setAccessibleName("الإجراءات")
         menu.setFocus()
@@ -443,6 +454,27 @@ class QuranInterface(QMainWindow):
             ok_button = msg_box.addButton("موافق", QMessageBox.ButtonRole.AcceptRole)
             msg_box.exec()
 
+    @exception_handler(ui_element=QMessageBox)
+    def OnSimilarVerses(self, event):
+        logger.debug("Similar verses action triggered.")
+        current_aya = self.get_current_ayah()
+        title = "الآيات المتشابهة مع آية رقم {} من {}".format(current_aya.number_in_surah, current_aya.sura_name)
+        label = "الآيات المتشابهة:"
+        text = SimilarVerses(current_aya.number).text
+
+        if text:
+            logger.debug(f"Similar verses retrieved for ayah {current_aya.number_in_surah} in {current_aya.sura_name}")
+            InfoDialog(self, title, label, text).exec()
+            logger.debug("Similar verses dialog closed.")
+        else:
+            logger.warning("No similar verses for this ayah.")
+            msg_box = QMessageBox(self)
+            msg_box.setIcon(QMessageBox.Icon.Information)
+            msg_box.setWindowTitle("لا توجد آيات متشابهة")
+            msg_box.setText("لم يتم العثور على آيات متشابهة مع هذه الآية.")
+            msg_box.addButton("موافق", QMessageBox.ButtonRole.AcceptRole)
+            msg_box.exec()
+
     @exception_handler(ui_element=QMessageBox)
     def OnMoshafInfo(self, event):
         logger.debug("Moshaf info action triggered.")
@@ -470,7 +502,9 @@ class QuranInterface(QMainWindow):
         label = "معلومات السورة:"
         sura_info = SuraInfo(current_aya.sura_number)
         logger.debug(f"Displaying information for surah {current_aya.sura_name}")
-        InfoDialog(self, title, label, sura_info.text, is_html_content=False).open()
+        statistics = UnitStatistics(NavigationMode.SURAH, current_aya.sura_number, "هذه السورة")
+        text = "\n\n".join(filter(None, [sura_info.text, statistics.text]))
+        InfoDialog(self, title, label, text, is_html_content=False).open()
 
     @exception_handler(ui_element=QMessageBox)
     def OnJuzInfo(self, event):
@@ -480,7 +514,9 @@ class QuranInterface(QMainWindow):
         label = "معلومات الجزء:"
         juz_info = JuzInfo(current_aya.juz)
         logger.debug(f"Displaying information for juz {current_aya.juz}")
-        InfoDialog(self, title, label, juz_info.text).open()
+        statistics = UnitStatistics(NavigationMode.JUZ, current_aya.juz, "هذا الجزء")
+        text = "\n\n".join(filter(None, [juz_info.text, statistics.text]))
+        InfoDialog(self, title, label, text).open()
 
     @exception_handler(ui_element=QMessageBox)
     def OnHizbInfo(self, event):
@@ -490,7 +526,9 @@ class QuranInterface(QMainWindow):
         label = "معلومات الحزب:"
         hizb_info = HizbInfo(current_aya.hizb)
         logger.debug(f"Displaying information for hizb {current_aya.hizb}")
-        InfoDialog(self, title, label, hizb_info.text).open()
+        statistics = UnitStatistics(NavigationMode.HIZB, current_aya.hizb, "هذا الحزب")
+        text = "\n\n".join(filter(None, [hizb_info.text, statistics.text]))
+        InfoDialog(self, title, label, text).open()
 
     @exception_handler(ui_element=QMessageBox)
     def OnQuarterInfo(self, event):
@@ -500,7 +538,39 @@ class QuranInterface(QMainWindow):
         label = "معلومات الربع:"
         quarter_info = QuarterInfo(current_aya.hizbQuarter)
         logger.debug(f"Displaying information for quarter {current_aya.hizbQuarter}")
-        InfoDialog(self, title, label, quarter_info.text).open()
+        statistics = UnitStatistics(NavigationMode.QUARTER, current_aya.hizbQuarter, "هذا الربع")
+        text = "\n\n".join(filter(None, [quarter_info.text, statistics.text]))
+        InfoDialog(self, title, label, text).open()
+
+    @exception_handler(ui_element=QMessageBox)
+    def OnWordConcordance(self, event):
+        logger.debug("Word concordance action triggered.")
+        cursor = self.quran_view.textCursor()
+        cursor.select(QTextCursor.SelectionType.WordUnderCursor)
+
+        dialog = QInputDialog(self)
+        dialog.setWindowTitle("سياقات كلمة")
+        dialog.setLabelText("أدخل الكلمة:")
+        dialog.setTextValue(cursor.selectedText().strip())
+        dialog.setOkButtonText("عرض")
+        dialog.setCancelButtonText("إلغاء")
+        if dialog.exec() != QInputDialog.DialogCode.Accepted or not dialog.textValue().strip():
+            return
+
+        word = dialog.textValue().strip()
+        text = WordConcordance(word).text
+        if not text:
+            logger.warning(f"Word not found for concordance: {word}")
+            msg_box = QMessageBox(self)
+            msg_box.setIcon(QMessageBox.Icon.Information)
+            msg_box.setWindowTitle("لا توجد نتائج")
+            msg_box.setText(f"لم ترد كلمة {word} في القرآن.")
+            msg_box.addButton("موافق", QMessageBox.ButtonRole.AcceptRole)
+            msg_box.exec()
+            return
+
+        logger.debug(f"Displaying the concordance of {word}")
+        InfoDialog(self, f"سياقات كلمة {word}", "مواضع الكلمة:", text).open()
 
     @exception_handler(ui_element=QMessageBox)
     def OnPageInfo(self, event):
@@ -510,7 +580,9 @@ class QuranInterface(QMainWindow):
         label = "معلومات الصفحة:"
         page_info = PageInfo(current_aya.page)
         logger.debug(f"Displaying information for page {current_aya.page}")
-        InfoDialog(self, title, label, page_info.text).open()
+        statistics = UnitStatistics(NavigationMode.PAGE, current_aya.page, "هذه الصفحة")
+        text = "\n\n".join(filter(None, [page_info.text, statistics.text]))
+        InfoDialog(self, title, label, text).open()
 
 
 
@@ -1,9 +1,10 @@
 import re
-from typing import List, Dict
+from typing import List, Dict, Optional
 from dataclasses import dataclass
 from PyQt6.QtCore import QObject, pyqtSignal, Qt
 from PyQt6.QtGui import QKeyEvent
 from PyQt6.QtWidgets import QComboBox
+from core_functions.search.name_index import NameIndex
 from utils.logger import LoggerManager
 
 logger = LoggerManager.get_logger(__name__)
@@ -20,6 +21,7 @@ class Category:
     label: str
     items: List[Item]
     widget : QComboBox
+    index: NameIndex
     selected_item_text: str = ""
     search_query: str = ""
 
@@ -41,10 +43,11 @@ class FilterManager(QObject):
         self.current_category_index = 0
         logger.debug("FilterManager initialized.")
 
-    def set_category(self, id, label: str, items: List[Item], widget: QComboBox) -> None:
-        """Set a new category with items."""
+    def set_category(self, id, label: str, items: List[Item], widget: QComboBox, index: Optional[NameIndex] = None) -> None:
+        """Set a new category with items, filtered through the given name index or one built from the items."""
         logger.debug(f"Setting category: ID={id}, Label={label}, Items={len(items)}.")
-        category = Category(id, label, items, widget)
+        index = index or NameIndex((item.id, item.text) for item in items)
+        category = Category(id, label, items, widget, index)
         self.categories.append(category)
         logger.debug(f"Category added: ID={id}, Label={label}, Items={len(items)}.")
 
@@ -121,7 +124,12 @@ class FilterManager(QObject):
         combo_box = active_category.widget
         all_items = active_category.items
         #active_category.selected_item_text = combo_box.currentText()
-        filtered_items = [item for item in all_items if item.text.startswith(active_category.search_query)]
+        if active_category.search_query:
+            # The index may cover more names than the category holds, such as every surah for a reciter with a few.
+            items_by_id = {item.id: item for item in all_items}
+            filtered_items = [items_by_id[item_id] for item_id in active_category.index.complete(active_category.search_query) if item_id in items_by_id]
+        else:
+            filtered_items = all_items
         self.filteredItemsUpdated.emit(combo_box, filtered_items, combo_box.currentText())
         logger.debug(f"Filtered items updated for category {active_category.label}. "
                      f"Query: {active_category.search_query}, Matches: {len(filtered_items)}.")
@@ -10,6 +10,7 @@ from PyQt6.QtWidgets import (
     QComboBox, QGroupBox, QSlider, QWidget, QMainWindow, QLineEdit
 )
 from core_functions.Reciters import SurahReciter
+from core_functions.search.name_index import NameIndex
 from .FilterManager import Item, FilterManager
 from utils.audio_player.audio_player_thread import AudioPlayerThread
 from utils.const import Globals, program_name
@@ -82,7 +83,7 @@ class SuraPlayerWindow(QMainWindow):
             if row["id"] == saved_reciter_id:
                 self.reciter_combo.setCurrentText(display_text)
         logger.debug(f"Loaded {len(reciters_list)} reciters. Selected reciter: {self.reciter_combo.currentText()}") 
-        self.filter_manager.set_category(1, "القارئ", reciters_list, self.reciter_combo)
+        self.filter_manager.set_category(1, "القارئ", reciters_list, self.reciter_combo, NameIndex.reciters(self.reciters))
 
         self.surah_label = QLabel("السورة:")
         self.surah_combo = QComboBox()
@@ -96,7 +97,7 @@ class SuraPlayerWindow(QMainWindow):
                 self.surah_combo.setCurrentText(surah.name)
 
         logger.debug(f"Loaded {len(suras_list)} surahs. Selected surah: {self.surah_combo.currentText()}.")
-        self.filter_manager.set_category(2, "السورة", suras_list, self.surah_combo)
+        self.filter_manager.set_category(2, "السورة", suras_list, self.surah_combo, NameIndex.surahs())
 
         selection_layout.addWidget(self.reciter_label)
         selection_layout.addWidget(self.reciter_combo)
@@ -77,6 +77,8 @@ class MenuBar(QMenuBar):
         self.go_to_saved_position_action.triggered.connect(lambda: Globals.effects_manager.play("move"))
         self.search_action = QAction("البحث", self)
         self.search_action.triggered.connect(self.parent.OnSearch)        
+        self.search_tafaseer_action = QAction("البحث في التفاسير", self)
+        self.search_tafaseer_action.triggered.connect(self.parent.OnSearchTafaseer)
         self.go_to_action = QAction("اذهب إلى", self)
         self.go_to_action.triggered.connect(self.OnGoTo)
         self.go_to_ayah_action = QAction("الذهاب إلى آية", self)
@@ -89,7 +91,7 @@ class MenuBar(QMenuBar):
         self.exit_action = QAction("إغلاق البرنامج", self)
         self.exit_action.triggered.connect(self.quit_application)
 
-        self.navigation_menu.addActions([self.next_action, self.previous_action, self.search_action, self.go_to_saved_position_action, self.go_to_ayah_action, self.go_to_action,  self.quick_access_action, self.close_action, self.exit_action])
+        self.navigation_menu.addActions([self.next_action, self.previous_action, self.search_action, self.search_tafaseer_action, self.go_to_saved_position_action, self.go_to_ayah_action, self.go_to_action,  self.quick_access_action, self.close_action, self.exit_action])
 
 
         self.player_menu = self.addMenu("المشغل(&P)")
@@ -186,7 +188,9 @@ class MenuBar(QMenuBar):
         self.page_info_action.triggered.connect(self.parent.OnPageInfo)
         self.moshaf_info_action = QAction("معلومات المصحف", self)
         self.moshaf_info_action.triggered.connect(self.parent.OnMoshafInfo)
-        self.info_menu.addActions([self.ayah_info_action, self.surah_info_action, self.page_info_action, self.quarter_info_action, self.hizb_info_action, self.juz_info_action, self.moshaf_info_action])
+        self.word_concordance_action = QAction("سياقات كلمة", self)
+        self.word_concordance_action.triggered.connect(self.parent.OnWordConcordance)
+        self.info_menu.addActions([self.ayah_info_action, self.surah_info_action, self.page_info_action, self.quarter_info_action, self.hizb_info_action, self.juz_info_action, self.moshaf_info_action, self.word_concordance_action])
 
 
         self.tools_menu =self.addMenu("الأدوات(&T)")
@@ -469,8 +473,8 @@ class MenuBar(QMenuBar):
             surah_number, ayah_number_in_surah = go_to_dialog.get_input_value()
             Config.listening.auto_play_ayah_after_go_to = go_to_dialog.checkbox_field.isChecked()
             Config.save_settings()
-            ayah = self.parent.quran_manager.view_content.get_by_ayah_number_in_surah(ayah_number_in_surah, surah_number)
-            self.parent.set_focus_to_ayah(ayah.number)
+            ayah_number = self.parent.quran_manager.get_ayah_number(surah_number, ayah_number_in_surah)
+            self.parent.set_focus_to_ayah(ayah_number)
             if Config.listening.auto_play_ayah_after_go_to:
                 self.parent.toolbar.stop_audio()
                 self.parent.toolbar.toggle_play_pause()
@@ -595,6 +599,7 @@ class MenuBar(QMenuBar):
             self.previous_action: ["Ctrl+B", QKeySequence(Qt.Key.Key_PageUp), "Ctrl+Up", "Alt+Left"],
             self.go_to_saved_position_action: ["Ctrl+Backspace"],
             self.search_action: ["Ctrl+F"],
+            self.search_tafaseer_action: ["Ctrl+Shift+F"],
             self.go_to_action: ["Ctrl+G"],
         self.go_to_ayah_action: ["Shift+G"],
             self.quick_access_action: ["Ctrl+Q"],
@@ -626,6 +631,7 @@ class MenuBar(QMenuBar):
             self.hizb_info_action: ["Alt+Shift+4"],
             self.juz_info_action: ["Alt+Shift+5"],
             self.moshaf_info_action: ["Alt+Shift+6"],
+            self.word_concordance_action: ["Alt+Shift+8"],
 
         #tools
                     self.sura_player_action: ["Shift+P"],
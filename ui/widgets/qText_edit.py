@@ -28,14 +28,103 @@ class ReadOnlyTextEdit(QTextEdit):
 
 
 class QuranViewer(ReadOnlyTextEdit):
+    """
+    Quran text view.
+
+    Texts longer than WINDOW_THRESHOLD (e.g. a custom range of the whole Quran) are loaded
+    in windowed mode: the document only holds a window of whole lines of the text, starting
+    at window_offset, and is extended by EXTEND_SIZE characters whenever the cursor gets
+    within EXTEND_MARGIN characters of one of its edges. Positions in the full text, as used
+    by ViewContent, are converted with to_document_position/to_text_position.
+    """
+    WINDOW_THRESHOLD = 120_000
+    WINDOW_SIZE      = 60_000
+    EXTEND_SIZE      = 30_000
+    EXTEND_MARGIN    = 5_000
+
     def __init__(self, parent=None):
         super().__init__(parent)
         logger.debug("Initializing QuranViewer.")
         self.parent = parent
         self.is_page_turn_alert = False
+        self.full_text = ""
+        self.window_offset = 0
+        self.window_end = 0
+        self._is_extending = False
         self.textChanged.connect(self.set_ctrl)
+        self.cursorPositionChanged.connect(self.extend_window)
         logger.debug("QuranViewer initialized.")
 
+    @property
+    def is_windowed(self) -> bool:
+        return len(self.full_text) > self.WINDOW_THRESHOLD
+
+    def setText(self, text: str) -> None:
+        self.full_text = text
+        if not self.is_windowed:
+            self.window_offset, self.window_end = 0, len(text)
+            super().setText(text)
+            return
+
+        logger.debug(f"Loading text of {len(text)} characters in windowed mode.")
+        self.load_window(0)
+
+    def text_length(self) -> int:
+        """Return the length of the full text, including the parts not loaded in the document."""
+        return len(self.full_text)
+
+    def _line_start(self, position: int) -> int:
+        """Return the start of the line containing the given text position."""
+        return self.full_text.rfind("\n", 0, max(0, position)) + 1
+
+    def load_window(self, position: int) -> None:
+        """Replace the document with a window of whole lines around the given text position."""
+        start = self._line_start(position - self.WINDOW_SIZE // 2)
+        end = self._line_start(start + self.WINDOW_SIZE) if start + self.WINDOW_SIZE < len(self.full_text) else len(self.full_text)
+        self.window_offset, self.window_end = start, end
+        self._is_extending = True
+        try:
+            super().setText(self.full_text[start:end])
+        finally:
+            self._is_extending = False
+        logger.debug(f"Loaded text window [{start}, {end}) of {len(self.full_text)}.")
+
+    def to_document_position(self, position: int) -> int:
+        """Convert a position in the full text to a document position, loading its window if needed."""
+        if not self.window_offset <= position <= self.window_end:
+            self.load_window(position)
+        return position - self.window_offset
+
+    def to_text_position(self, position: int) -> int:
+        """Convert a document position to a position in the full text."""
+        return position + self.window_offset
+
+    def extend_window(self) -> None:
+        """Extend the document when the cursor gets close to one of its edges."""
+        if self._is_extending or not self.is_windowed:
+            return
+
+        position = self.to_text_position(self.textCursor().position())
+        self._is_extending = True
+        try:
+            if self.window_end < len(self.full_text) and self.window_end - position < self.EXTEND_MARGIN:
+                end = self.window_end + self.EXTEND_SIZE
+                end = self._line_start(end) if end < len(self.full_text) else len(self.full_text)
+                cursor = QTextCursor(self.document())
+                cursor.movePosition(QTextCursor.MoveOperation.End)
+                cursor.insertText(self.full_text[self.window_end:end])
+                logger.debug(f"Text window extended forward to {end}.")
+                self.window_end = end
+
+            if self.window_offset > 0 and position - self.window_offset < self.EXTEND_MARGIN:
+                start = self._line_start(self.window_offset - self.EXTEND_SIZE)
+                cursor = QTextCursor(self.document())
+                cursor.insertText(self.full_text[start:self.window_offset])
+                logger.debug(f"Text window extended backward to {start}.")
+                self.window_offset = start
+        finally:
+            self._is_extending = False
+
     def set_ctrl(self):
         #logger.debug("Setting control state.")
         current_line_text = self.textCursor().block().text()
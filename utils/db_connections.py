@@ -0,0 +1,58 @@
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict
+from exceptions.database import DBNotFoundError
+from utils.logger import LoggerManager
+
+logger = LoggerManager.get_logger(__name__)
+
+# Negative cache sizes are in KiB.
+CACHE_SIZE = -8 * 1024
+MMAP_SIZE = 64 * 1024 * 1024
+
+
+class ReadOnlyConnections:
+    """
+    Process-wide registry of connections to the databases bundled with the program.
+
+    The bundled databases never change while the program runs, so each one is opened
+    once per thread in read-only, immutable mode: SQLite then skips file locking and
+    change detection, and the pages it caches stay valid for the whole session.
+    Connections are owned by the registry, callers must not close them. Rows are
+    returned as sqlite3.Row.
+    """
+    _local = threading.local()
+    _lock = threading.Lock()
+    opened = 0
+
+    @staticmethod
+    def uri(path) -> str:
+        """Return the read-only, immutable URI of a database file."""
+        return Path(path).absolute().as_uri() + "?mode=ro&immutable=1"
+
+    @classmethod
+    def get(cls, path) -> sqlite3.Connection:
+        """Return the connection of the current thread to the database at the given path, opening it on first use."""
+        path = Path(path).absolute()
+        connections: Dict[Path, sqlite3.Connection] = cls._local.__dict__.setdefault("connections", {})
+        conn = connections.get(path)
+        if conn is None:
+            conn = connections[path] = cls._open(path)
+        return conn
+
+    @classmethod
+    def _open(cls, path: Path) -> sqlite3.Connection:
+        if not path.is_file():
+            logger.error(f"Database file not found: {path}")
+            raise DBNotFoundError(str(path))
+
+        conn = sqlite3.connect(cls.uri(path), uri=True)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA query_only = ON;")
+        conn.execute(f"PRAGMA cache_size = {CACHE_SIZE};")
+        conn.execute(f"PRAGMA mmap_size = {MMAP_SIZE};")
+        with cls._lock:
+            cls.opened += 1
+        logger.info(f"Opened read-only connection to {path} in thread {threading.current_thread().name}, {cls.opened} opened in this session.")
+        return conn
@@ -125,6 +125,9 @@ class PathManager:
         self._log_file = self._app_folder / f"{app_name.lower()}.log"
         self._reciters_db = self._data_folder / "quran" / "reciters.db"
         self._athkar_db = self._app_folder / "athkar.db"
+        self._tafaseer_index = self._app_folder / "tafaseer_index"
+        self._search_cache = self._app_folder / "search_cache.json"
+        self._similar_verses_index = self._app_folder / "similar_verses.db"
 
         logger.debug("Standard DB/config/log paths initialized.")
 
@@ -209,6 +212,21 @@ class PathManager:
         logger.debug(f"Accessed athkar_db path: {self._athkar_db}")
         return self._athkar_db
 
+    @property
+    def tafaseer_index(self):
+        logger.debug(f"Accessed tafaseer_index folder: {self._tafaseer_index}")
+        return self._tafaseer_index
+
+    @property
+    def search_cache(self):
+        logger.debug(f"Accessed search_cache path: {self._search_cache}")
+        return self._search_cache
+
+    @property
+    def similar_verses_index(self):
+        logger.debug(f"Accessed similar_verses_index path: {self._similar_verses_index}")
+        return self._similar_verses_index
+
     @property
     def athkar_audio(self):
         logger.debug(f"Accessed athkar_audio folder: {self._athkar_audio}")
@@ -233,6 +251,9 @@ class PathManager:
             "Config": self.config_file,
             "Log": self.log_file,
             "AthkarDB": self.athkar_db,
+            "TafaseerIndex": self.tafaseer_index,
+            "SearchCache": self.search_cache,
+            "SimilarVersesIndex": self.similar_verses_index,
             "AthkarAudio": self.athkar_audio,
             "Temp": self.temp_folder,
             "Documents": self.documents_dir,
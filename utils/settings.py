@@ -80,6 +80,8 @@ class SearchSettings(BaseSection):
     ignore_tashkeel: bool = True
     ignore_hamza: bool = True
     match_whole_word: bool = False
+    search_as_you_type: bool = False
+    remember_search_results: bool = False
 
 
 @dataclass